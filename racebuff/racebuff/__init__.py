@@ -20,7 +20,10 @@
 Init logger, state, signal
 """
 
+from __future__ import annotations
+
 import logging
+import threading
 
 from PySide2.QtCore import QObject, Signal
 
@@ -58,6 +61,85 @@ class RealtimeState:
         self.spectating: bool = False
 
 
+class IdleState:
+    """Deep idle state
+
+    Park (block) threads while sim is not running or data not updating,
+    so that only overlay control (as watcher) keeps checking sim state.
+    State control: OverlayControl.
+
+    Connector threads are not parked, as watcher reads sim state from them,
+    but poll at watcher interval instead (see poll_delay).
+
+    Attributes:
+        parked: whether is deep idle state.
+        watch_interval: watcher & connector polling interval (seconds) while in deep idle state.
+    """
+
+    __slots__ = (
+        "_condition",
+        "parked",
+        "watch_interval",
+    )
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self.parked: bool = False
+        self.watch_interval: float = 1.0
+
+    def park(self):
+        """Enter deep idle state"""
+        with self._condition:
+            self.parked = True
+
+    def unpark(self):
+        """Exit deep idle state, wake all parked threads"""
+        with self._condition:
+            self.parked = False
+            self._condition.notify_all()
+
+    def notify(self):
+        """Wake all parked threads to re-check stop event"""
+        with self._condition:
+            self._condition.notify_all()
+
+    def poll_delay(self, delay: float) -> float:
+        """Connector polling delay, slowed down to watch interval while in deep idle state"""
+        if self.parked and delay < self.watch_interval:
+            return self.watch_interval
+        return delay
+
+    def wait(self, event: threading.Event) -> None:
+        """Block while in deep idle state, until unparked or event is set"""
+        if self.parked:
+            with self._condition:
+                self._condition.wait_for(lambda: not self.parked or event.is_set())
+
+
+class IdleEvent(threading.Event):
+    """Thread stop event that also blocks in wait() while in deep idle state
+
+    Attributes:
+        timeout_scale: wait timeout scale, set by CPU usage governor.
+    """
+
+    __slots__ = ("timeout_scale",)
+
+    def __init__(self):
+        super().__init__()
+        self.timeout_scale: float = 1.0
+
+    def wait(self, timeout: float | None = None) -> bool:
+        idle_state.wait(self)
+        if timeout is not None:
+            timeout *= self.timeout_scale
+        return super().wait(timeout)
+
+    def set(self) -> None:
+        super().set()
+        idle_state.notify()
+
+
 class OverlaySignal(QObject):
     """Overlay signal
 
@@ -93,5 +175,6 @@ class ApplicationSignal(QObject):
 
 
 realtime_state = RealtimeState()
+idle_state = IdleState()
 overlay_signal = OverlaySignal()
 app_signal = ApplicationSignal()
@@ -7,6 +7,8 @@ import logging
 import threading
 import time
 
+from .. import idle_state
+
 try:
     import irsdk
 except ImportError:
@@ -106,10 +108,10 @@ class IRacingConnector:
                     else:
                         retry_count += 1
                         if retry_count >= max_retries:
-                            time.sleep(1.0)  # Back off if repeated failures
+                            time.sleep(idle_state.poll_delay(1.0))  # Back off if repeated failures
                             retry_count = 0
                         else:
-                            time.sleep(0.1)
+                            time.sleep(idle_state.poll_delay(0.1))
                         continue
 
                 if self._connected and self._ir.is_connected:
@@ -125,7 +127,7 @@ class IRacingConnector:
                 else:
                     self._connected = False
                 
-                time.sleep(0.01)  # 10ms update cycle
+                time.sleep(idle_state.poll_delay(0.01))  # 10ms update cycle
                 
             except Exception as e:
                 logger.error(f"iRacing: update loop error: {e}")
@@ -44,6 +44,8 @@ from pyLMUSharedMemory.lmu_mmap import (
     MMapControl,
 )
 
+from .. import idle_state
+
 logger = logging.getLogger(__name__)
 
 
@@ -218,7 +220,7 @@ class SyncData:
                 self.__sync_player_tele()
             # Setup updating thread
             self._event.clear()
-            self._update_thread = threading.Thread(target=self.__update, daemon=True)
+            self._update_thread = threading.Thread(target=self.__update, name="LMU-Connector", daemon=True)
             self._update_thread.start()
             logger.info("sharedmemory: UPDATING: thread started")
             logger.info("sharedmemory: player index override: %s", self.override_player_index)
@@ -240,6 +242,7 @@ class SyncData:
         """Update synced player data"""
         self.paused = False  # make sure initial pause state is false
         _event_wait = self._event.wait
+        _poll_delay = idle_state.poll_delay
         freezed_version = 0  # store freezed update version number
         last_version_update = 0  # store last update version number
         last_update_time = 0.0
@@ -247,7 +250,7 @@ class SyncData:
         reset_counter = 0
         update_delay = 0.5  # longer delay while inactive
 
-        while not _event_wait(update_delay):
+        while not _event_wait(_poll_delay(update_delay)):
             self.dataset.update_mmap()
             self.__update_tele_indexes(
                 self.dataset.shmm.data.scoring.scoringInfo.mNumVehicles,
@@ -29,9 +29,10 @@ import threading
 from itertools import chain
 from typing import Any, NamedTuple
 
-from .. import realtime_state
+from .. import IdleEvent, realtime_state
 from ..async_request import http_get, set_header_get
 from ..const_common import TYPE_JSON
+from ..governor_control import gctrl
 from .rf2_restapi import ResRawOutput, RestAPIData
 
 logger = logging.getLogger(__name__)
@@ -59,6 +60,7 @@ class RestAPIInfo:
         "_updating",
         "_update_thread",
         "_active_interval",
+        "_rate_scale",
         "_event",
     )
 
@@ -71,7 +73,8 @@ class RestAPIInfo:
         self._updating = False
         self._update_thread = None
         self._active_interval = 0.2
-        self._event = threading.Event()
+        self._rate_scale = 1.0
+        self._event = IdleEvent()
 
     def telemetry(self) -> RestAPIData:
         """Rest API telemetry data"""
@@ -90,19 +93,25 @@ class RestAPIInfo:
         if not self._updating and self._cfg["enable_restapi_access"]:
             self._updating = True
             self._event.clear()
-            self._update_thread = threading.Thread(target=self.__update, daemon=True)
+            self._update_thread = threading.Thread(target=self.__update, name="RestAPI-Connector", daemon=True)
             self._update_thread.start()
+            gctrl.register("restapi", self, self._active_interval * 1000)
             logger.info("RestAPI: UPDATING: thread started")
 
     def stop(self):
         """Stop update thread"""
         if self._updating:
+            gctrl.unregister(self)
             self._event.set()
             if self._update_thread is not None:
                 self._update_thread.join()
             self._updating = False
             logger.info("RestAPI: UPDATING: thread stopped")
 
+    def set_rate_scale(self, scale: float):
+        """Set update interval scale (from CPU usage governor)"""
+        self._rate_scale = scale
+
     def __update(self):
         """Update Rest API data"""
         _event_wait = self._event.wait
@@ -233,7 +242,7 @@ class RestAPIInfo:
                 interval += interval / 2
                 if interval > 5:
                     interval = 5
-            await asyncio.sleep(interval)
+            await asyncio.sleep(interval * self._rate_scale)
 
 
 def reset_to_default(dataset: RestAPIData, active_task: dict[str, tuple[ResRawOutput, ...]]):
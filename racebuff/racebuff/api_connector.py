@@ -21,7 +21,6 @@ API connector
 """
 
 from abc import ABC, abstractmethod
-from functools import partial
 
 # Import APIs
 from .adapter import (
@@ -44,7 +43,7 @@ from .const_api import (
     API_RF2_NAME,
     API_IRACING_NAME,
 )
-from .validator import bytes_to_str
+from .validator import cached_bytes_to_str
 
 
 class Connector(ABC):
@@ -117,7 +116,7 @@ class SimLMU(Connector):
         self.shmmapi.setPlayerOverride(config["enable_player_index_override"])
         self.shmmapi.setPlayerIndex(config["player_index"])
         self.restapi.setConnection(config.copy())
-        lmu_reader.tostr = partial(bytes_to_str, char_encoding=config["character_encoding"].lower())
+        lmu_reader.tostr = cached_bytes_to_str(config["character_encoding"].lower())
 
 
 class SimRF2(Connector):
@@ -170,7 +169,7 @@ class SimRF2(Connector):
         self.shmmapi.setPlayerOverride(config["enable_player_index_override"])
         self.shmmapi.setPlayerIndex(config["player_index"])
         self.restapi.setConnection(config.copy())
-        rf2_reader.tostr = partial(bytes_to_str, char_encoding=config["character_encoding"].lower())
+        rf2_reader.tostr = cached_bytes_to_str(config["character_encoding"].lower())
 
 
 class SimLMULegacy(SimRF2):
@@ -385,6 +385,38 @@ def delta_telemetry(
     return 0
 
 
+def resample_delta(
+    dataset: Sequence[Sequence], step: float, rows: int,
+    position_column: int = 0, target_column: int = 1) -> list[float]:
+    """Resample delta telemetry data at uniform position step (linear interpolation)
+
+    Same interpolation as delta_telemetry, values beyond last position
+    are extrapolated from last segment.
+
+    Args:
+        dataset: delta telemetry data, ordered by position, minimum 2 rows.
+        step: position step.
+        rows: number of resampled rows (from position 0).
+    """
+    output = []
+    index_last = len(dataset) - 1
+    index_higher = 1
+    for row in range(rows):
+        position = row * step
+        while index_higher < index_last and dataset[index_higher][position_column] < position:
+            index_higher += 1
+        lower = dataset[index_higher - 1]
+        higher = dataset[index_higher]
+        output.append(linear_interp(
+            position,
+            lower[position_column],
+            lower[target_column],
+            higher[position_column],
+            higher[target_column],
+        ))
+    return output
+
+
 def clock_time_scale_sync(scaled_sec: float, elapsed_sec: float, start_sec: float) -> int:
     """Synchronize clock time scale multiplier
 
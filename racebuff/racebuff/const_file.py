@@ -61,6 +61,9 @@ class FileExt:
     TXT = ".txt"
     INI = ".ini"
     BAK = ".bak"
+    BIN = ".bin"
+    TMP = ".tmp"
+    DB = ".db"
     JSON = ".json"
     # Image
     SVG = ".svg"
@@ -73,7 +76,10 @@ class FileExt:
     TPPN = ".tppn"
     TPTN = ".tptn"
     STATS = ".stats"
+    JOURNAL = ".journal"
     LOCK = ".lock"
+    FOLDED = ".folded"
+    SPEEDSCOPE = ".speedscope.json"
 
 
 class FileFilter:
@@ -91,6 +97,7 @@ class FileFilter:
     PNG = qfile_filter(FileExt.PNG, "PNG image")
     # Specific
     CONSUMPTION = qfile_filter(FileExt.CONSUMPTION, "Consumption History")
+    CONSUMPTION_BIN = qfile_filter(f"{FileExt.CONSUMPTION}{FileExt.BIN}", "Consumption History")
     TPPN = qfile_filter(FileExt.TPPN, "RaceBuff Pace Notes")
     TPTN = qfile_filter(FileExt.TPTN, "RaceBuff Track Notes")
     GPLINI = qfile_filter(FileExt.INI, "GPL Pace Notes")
@@ -117,3 +124,4 @@ class LogFile:
 
     APP_LOG = "racebuff.log"
     PID = "pid.log"
+    PROFILE = "racebuff-profile"
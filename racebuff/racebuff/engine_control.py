@@ -0,0 +1,191 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Telemetry engine control
+
+Run API & selected data modules in separated process (telemetry engine),
+and receive module info snapshots from shared memory in GUI process,
+so that heavy GUI painting does not delay module updates (and vice versa).
+
+Only output of engine modules is published. GUI process still connects to API
+for widgets that read API directly, and runs all other modules. Vehicle timing
+lines stay in engine process, as they are only read by engine modules.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+
+from . import IdleEvent, realtime_state
+from .module_info import minfo
+from .setting import cfg
+from .snapshot import SnapshotBuffer
+
+logger = logging.getLogger(__name__)
+
+# Modules that run in engine process, output must be covered by snapshot layout
+ENGINE_MODULES = (
+    "module_force",
+    "module_hybrid",
+    "module_relative",
+    "module_vehicles",
+)
+
+
+def run_engine(shm_name: str, preset_name: str, update_interval: float, stop_event):
+    """Run telemetry engine (in engine process)
+
+    Args:
+        shm_name: snapshot shared memory name.
+        preset_name: user preset filename to load.
+        update_interval: snapshot publish interval in seconds.
+        stop_event: multiprocessing event for stopping engine.
+    """
+    from . import module
+    from .api_control import api
+
+    # Load same preset as GUI process (read only, never save from engine)
+    cfg.load_global()
+    cfg.set_next_to_load(preset_name)
+    cfg.load_user()
+
+    api.connect()
+    api.start()
+
+    snapshot = SnapshotBuffer(shm_name)
+    active_modules = [
+        getattr(module, name).Realtime(cfg, name)
+        for name in ENGINE_MODULES
+        if cfg.user.setting[name]["enable"]
+    ]
+    for _module in active_modules:
+        _module.start()
+
+    last_input = None
+    while not stop_event.wait(update_interval):
+        # Sync input from GUI process
+        host_input = snapshot.receive_input()
+        if last_input != host_input:
+            last_input = host_input
+            minfo.mapping.speedTrapPosition = host_input[0]
+            if (cfg.api["enable_player_index_override"] != host_input[1]
+                or cfg.api["player_index"] != host_input[2]):
+                cfg.api["enable_player_index_override"] = host_input[1]
+                cfg.api["player_index"] = host_input[2]
+                api.setup()
+        # Update state
+        realtime_state.active = api.read.state.active()
+        realtime_state.paused = api.read.state.paused()
+        # Publish
+        if not realtime_state.paused:
+            snapshot.publish(minfo)
+
+    for _module in active_modules:
+        _module.stop()
+    for _module in active_modules:
+        _module.join()
+    api.stop()
+    snapshot.close()
+
+
+class EngineControl:
+    """Telemetry engine control"""
+
+    __slots__ = (
+        "_stopped",
+        "_event",
+        "_thread",
+        "_process",
+        "_process_event",
+        "_snapshot",
+    )
+
+    def __init__(self):
+        self._stopped = True
+        self._event = IdleEvent()
+        self._thread = None
+        self._process = None
+        self._process_event = None
+        self._snapshot = None
+
+    def enable(self):
+        """Enable telemetry engine"""
+        if self._stopped and cfg.application["enable_telemetry_engine_process"]:
+            self._stopped = False
+            self._event.clear()
+            update_interval = cfg.application["minimum_update_interval"] / 1000
+            self._snapshot = SnapshotBuffer()
+            context = multiprocessing.get_context("spawn")
+            self._process_event = context.Event()
+            self._process = context.Process(
+                target=run_engine,
+                args=(self._snapshot.name, cfg.filename.setting, update_interval, self._process_event),
+                name="RaceBuff Telemetry Engine",
+                daemon=True,
+            )
+            self._process.start()
+            self._thread = threading.Thread(
+                target=self.__updating, args=(update_interval,), name="Engine-Control", daemon=True)
+            self._thread.start()
+            logger.info("ENABLED: telemetry engine (pid: %s)", self._process.pid)
+
+    def disable(self):
+        """Disable telemetry engine"""
+        self._event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def modules(self) -> tuple[str, ...]:
+        """Modules running in telemetry engine"""
+        if self._stopped:
+            return ()
+        return ENGINE_MODULES
+
+    def __updating(self, update_interval: float):
+        """Receive module info snapshot"""
+        _event_wait = self._event.wait
+        snapshot = self._snapshot
+        setting_api = cfg.api
+
+        while not _event_wait(update_interval):
+            snapshot.send_input(
+                minfo.mapping.speedTrapPosition,
+                setting_api["enable_player_index_override"],
+                setting_api["player_index"],
+            )
+            if not realtime_state.paused:
+                snapshot.receive(minfo)
+
+        self._process_event.set()
+        self._process.join(5)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+        self._process_event = None
+        snapshot.close()
+        self._snapshot = None
+        self._stopped = True
+        logger.info("DISABLED: telemetry engine")
+
+
+ectrl = EngineControl()
@@ -0,0 +1,256 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+CPU usage governor control
+
+Measure process CPU usage, and scale update interval of registered
+modules, widgets, Rest API tasks toward target CPU usage.
+
+Priority:
+    0 = full rate, never scaled (timing critical subsystems).
+    1 = normal, scaled after low priority subsystems reached maximum scale.
+    2 = low (cosmetic), scaled first.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+
+import psutil
+
+from .setting import cfg
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_FULL_RATE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# Subsystems that always update at full rate
+FULL_RATE_SUBSYSTEMS = frozenset((
+    "module_delta",
+    "module_relative",
+    "module_vehicles",
+    "deltabest",
+    "deltabest_extended",
+    "relative",
+    "relative_finish_order",
+    "rivals",
+    "standings",
+    "timing",
+))
+# Cosmetic subsystems that degrade first
+LOW_PRIORITY_SUBSYSTEMS = frozenset((
+    "elevation",
+    "friction_circle",
+    "heading",
+    "lap_time_history",
+    "navigation",
+    "rake_angle",
+    "ride_height",
+    "roll_angle",
+    "session",
+    "steering_wheel",
+    "stint_history",
+    "suspension_force",
+    "suspension_position",
+    "suspension_travel",
+    "system_performance",
+    "track_map",
+    "trailing",
+    "weather",
+    "weather_forecast",
+    "weight_distribution",
+    "wheel_camber",
+    "wheel_toe",
+))
+
+PRESSURE_STEP_UP = 0.1  # pressure increment while above target usage
+PRESSURE_STEP_DOWN = 0.05  # pressure decrement while below target usage
+TARGET_HYSTERESIS = 0.8  # release pressure only below 80% of target usage
+SCALE_STEP = 0.25  # round scale to reduce interval changes
+
+
+def subsystem_priority(name: str) -> int:
+    """Get subsystem priority from name"""
+    if name in FULL_RATE_SUBSYSTEMS:
+        return PRIORITY_FULL_RATE
+    if name in LOW_PRIORITY_SUBSYSTEMS:
+        return PRIORITY_LOW
+    return PRIORITY_NORMAL
+
+
+def priority_scale(priority: int, pressure: float, max_scale: float) -> float:
+    """Calculate interval scale from priority & pressure (0 - 1)
+
+    Low priority subsystems scale within first half of pressure range,
+    normal priority subsystems scale within second half.
+    """
+    if priority == PRIORITY_LOW:
+        ratio = min(pressure * 2, 1)
+    elif priority == PRIORITY_NORMAL:
+        ratio = max(pressure * 2 - 1, 0)
+    else:
+        return 1.0
+    scale = 1 + (max_scale - 1) * ratio
+    return round(scale / SCALE_STEP) * SCALE_STEP
+
+
+class GovernorTarget:
+    """Governor target
+
+    Attributes:
+        name: subsystem name.
+        target: subsystem instance, must have set_rate_scale(scale) method.
+        priority: subsystem priority.
+        base_interval: subsystem base update interval in milliseconds.
+        scale: last applied interval scale.
+    """
+
+    __slots__ = (
+        "name",
+        "target",
+        "priority",
+        "base_interval",
+        "scale",
+    )
+
+    def __init__(self, name: str, target, base_interval: float):
+        self.name = name
+        self.target = target
+        self.priority = subsystem_priority(name)
+        self.base_interval = max(base_interval, 1)
+        self.scale = 1.0
+
+    def apply(self, scale: float, max_interval: float):
+        """Apply interval scale, limited within base & maximum interval"""
+        max_scale = max(max_interval / self.base_interval, 1)
+        if scale > max_scale:
+            scale = max_scale
+        if self.scale != scale:
+            self.scale = scale
+            self.target.set_rate_scale(scale)
+
+
+class GovernorControl:
+    """CPU usage governor control"""
+
+    __slots__ = (
+        "_stopped",
+        "_event",
+        "_thread",
+        "_lock",
+        "_targets",
+        "pressure",
+    )
+
+    def __init__(self):
+        self._stopped = True
+        self._event = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._targets: dict[int, GovernorTarget] = {}
+        self.pressure = 0.0
+
+    def enable(self):
+        """Enable CPU usage governor"""
+        if self._stopped and cfg.application["enable_cpu_usage_governor"]:
+            self._stopped = False
+            self._event.clear()
+            self._thread = threading.Thread(target=self.__updating, name="Governor-Control", daemon=True)
+            self._thread.start()
+            logger.info("ENABLED: cpu usage governor")
+
+    def disable(self):
+        """Disable CPU usage governor"""
+        self._event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def register(self, name: str, target, base_interval: float):
+        """Register subsystem
+
+        Args:
+            name: subsystem name.
+            target: subsystem instance, must have set_rate_scale(scale) method.
+            base_interval: subsystem base update interval in milliseconds.
+        """
+        with self._lock:
+            self._targets[id(target)] = GovernorTarget(name, target, base_interval)
+
+    def unregister(self, target):
+        """Unregister subsystem, and reset interval scale"""
+        with self._lock:
+            governor_target = self._targets.pop(id(target), None)
+        if governor_target is not None and governor_target.scale != 1:
+            target.set_rate_scale(1.0)
+
+    def __updating(self):
+        """Update CPU usage & interval scale"""
+        _event_wait = self._event.wait
+        update_interval = max(cfg.application["cpu_usage_sampling_interval"], 100) / 1000
+        target_usage = max(cfg.application["cpu_usage_target"], 1)
+        max_scale = max(cfg.application["maximum_interval_scale"], 1)
+        max_interval = cfg.application["maximum_update_interval"]
+        release_usage = target_usage * TARGET_HYSTERESIS
+
+        app_info = psutil.Process(os.getpid())
+        cpu_count = os.cpu_count() or 1
+        app_info.cpu_percent()  # initialize measurement
+        self.pressure = 0.0
+
+        while not _event_wait(update_interval):
+            usage = app_info.cpu_percent() / cpu_count
+            if usage > target_usage:
+                pressure = min(self.pressure + PRESSURE_STEP_UP, 1.0)
+            elif usage < release_usage:
+                pressure = max(self.pressure - PRESSURE_STEP_DOWN, 0.0)
+            else:
+                pressure = self.pressure
+            self.pressure = pressure
+            self.__apply_scale(pressure, max_scale, max_interval)
+
+        # Reset to full rate on close
+        self.pressure = 0.0
+        self.__apply_scale(0.0, max_scale, max_interval)
+        self._stopped = True
+        logger.info("DISABLED: cpu usage governor")
+
+    def __apply_scale(self, pressure: float, max_scale: float, max_interval: float):
+        """Apply interval scale to all registered subsystems"""
+        scales = tuple(
+            priority_scale(priority, pressure, max_scale)
+            for priority in (PRIORITY_FULL_RATE, PRIORITY_NORMAL, PRIORITY_LOW)
+        )
+        with self._lock:
+            targets = tuple(self._targets.items())
+        for target_id, governor_target in targets:
+            if self._targets.get(target_id) is not governor_target:
+                continue  # unregistered since copied
+            try:
+                governor_target.apply(scales[governor_target.priority], max_interval)
+            except RuntimeError:  # deleted Qt object (closed widget)
+                with self._lock:
+                    self._targets.pop(target_id, None)
+
+
+gctrl = GovernorControl()
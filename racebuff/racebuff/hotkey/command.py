@@ -25,6 +25,7 @@ from __future__ import annotations
 from .. import app_signal, loader, overlay_signal, realtime_state
 from ..api_control import api
 from ..const_file import ConfigType, FileExt
+from ..profiler_control import pctrl
 from ..setting import cfg
 
 
@@ -169,6 +170,11 @@ def hotkey_pace_notes_playback():
     app_signal.refresh.emit(True)
 
 
+def hotkey_sampling_profiler():
+    """Command - sampling profiler"""
+    pctrl.toggle()
+
+
 def hotkey_restart_application():
     """Command - restart application"""
     loader.restart()
@@ -193,6 +199,7 @@ COMMANDS_HOTKEY = (
     ("spectate_next_driver", hotkey_spectate_next_driver),
     ("spectate_previous_driver", hotkey_spectate_previous_driver),
     ("pace_notes_playback", hotkey_pace_notes_playback),
+    ("sampling_profiler", hotkey_sampling_profiler),
     ("restart_application", hotkey_restart_application),
     ("quit_application", hotkey_quit_application),
 )
@@ -24,7 +24,6 @@ from __future__ import annotations
 
 import logging
 import threading
-from time import sleep
 
 from .hotkey.command import COMMANDS_HOTKEY
 from .hotkey.common import get_key_state_function, load_hotkey, refresh_keystate
@@ -39,25 +38,29 @@ class HotkeyControl:
     __slots__ = (
         "_stopped",
         "_event",
+        "_thread",
     )
 
     def __init__(self):
         self._stopped = True
         self._event = threading.Event()
+        self._thread = None
 
     def enable(self):
         """Enable hotkey control"""
         if self._stopped and cfg.application["enable_global_hotkey"]:
             self._stopped = False
             self._event.clear()
-            threading.Thread(target=self.__updating, daemon=True).start()
+            self._thread = threading.Thread(target=self.__updating, name="Hotkey-Control", daemon=True)
+            self._thread.start()
             logger.info("ENABLED: hotkey control")
 
     def disable(self):
         """Disable hotkey control"""
         self._event.set()
-        while not self._stopped:
-            sleep(0.01)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
     def reload(self):
         """Reload"""
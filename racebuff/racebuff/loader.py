@@ -23,16 +23,30 @@ Loader function
 import logging
 import os
 import signal
+import sqlite3
 import sys
 import time
+from itertools import chain
 
 from .api_control import api
 from .const_file import FileExt
+from .engine_control import ectrl
+from .governor_control import gctrl
 from .hotkey_control import kctrl
 from .module_control import mctrl, wctrl
 from .overlay_control import octrl
+from .profiler_control import pctrl
 from .setting import cfg
 from .update import update_checker
+from .userfile.consumption_history import export_consumption_record, read_consumption_record
+from .userfile.delta_binary import read_delta_record
+from .userfile.user_database import (
+    export_userdata_records,
+    read_file_record,
+    scan_userdata_files,
+    udb,
+)
+from .userfile.write_queue import wqueue
 
 logger = logging.getLogger(__name__)
 
@@ -46,15 +60,20 @@ def int_signal_handler(sign, frame):
 def start():
     """Start api, modules, widgets, etc. Call once per launch."""
     logger.info("STARTING............")
+    timer_start = time.monotonic()
     signal.signal(signal.SIGINT, int_signal_handler)
     # 1 load user preset
     cfg.set_next_to_load(f"{cfg.preset_files()[0]}{FileExt.JSON}")
-    cfg.load_user()
-    cfg.save()
+    load_preset()
     # 2 start api
     api.connect()
     api.start()
     # 3 start modules
+    wqueue.enable()
+    gctrl.enable()
+    open_user_database()
+    ectrl.enable()
+    mctrl.set_external(ectrl.modules)
     mctrl.start()
     # 4 start widgets
     wctrl.start()
@@ -70,6 +89,7 @@ def start():
     # 3 Check for updates
     if cfg.application["check_for_updates_on_startup"]:
         update_checker.check(False)
+    logger.info("STARTED: took %sms", round((time.monotonic() - timer_start) * 1000))
 
 
 def close():
@@ -79,6 +99,10 @@ def close():
     unload_modules()
     # 2 stop api
     api.stop()
+    # 3 stop profiler (save profile)
+    pctrl.disable()
+    # 4 flush pending user data writes
+    wqueue.disable()
 
 
 def restart():
@@ -90,6 +114,7 @@ def restart():
         cfg.save(0, next_task=True)
         while cfg.is_saving:
             time.sleep(0.01)
+    wqueue.flush()
     # 1 set restart env for skipping single instance check
     os.environ["RACEBUFF_RESTART"] = "TRUE"
     if "racebuff.exe" in sys.executable:  # if run as exe
@@ -109,6 +134,7 @@ def reload(reload_preset: bool = False):
             or auto-loading preset.
     """
     logger.info("RELOADING............")
+    timer_start = time.monotonic()
     # 0 wait unfinished saving
     if cfg.is_saving:
         # Trigger immediate saving from queue
@@ -119,25 +145,94 @@ def reload(reload_preset: bool = False):
     unload_modules()
     # 2 reload user preset from file
     if reload_preset:
-        cfg.load_user()
-        cfg.save(0)  # save new changes in case preset was edited externally
+        load_preset(0)  # save new changes in case preset was edited externally
     # 3 restart api
     api.restart()
     # 4 load modules
     load_modules()
+    logger.info("RELOADED: took %sms", round((time.monotonic() - timer_start) * 1000))
+
+
+def load_preset(delay: int = 66):
+    """Load user preset, save only if preset was validated from file (new or edited externally)"""
+    timer_start = time.monotonic()
+    is_cached = cfg.load_user()
+    if not is_cached:
+        cfg.save(delay)
+    logger.info(
+        "LOADED: user preset (took %sms, %s)",
+        round((time.monotonic() - timer_start) * 1000),
+        "validated cache" if is_cached else "validated",
+    )
 
 
 def load_modules():
     """Load modules, widgets"""
     octrl.enable()  # 1 overlay control
-    mctrl.start()  # 2 module
-    wctrl.start()  # 3 widget
-    kctrl.enable()  # 4 hotkey
+    gctrl.enable()  # 2 cpu usage governor
+    open_user_database()  # 3 user database
+    ectrl.enable()  # 4 telemetry engine
+    mctrl.set_external(ectrl.modules)
+    mctrl.start()  # 5 module
+    wctrl.start()  # 6 widget
+    kctrl.enable()  # 7 hotkey
 
 
 def unload_modules():
-    """Unload modules, widgets"""
+    """Unload modules, widgets
+
+    Modules are signaled to stop first, and finish closing concurrently
+    in their own threads while widgets are closing in GUI thread.
+    """
     kctrl.disable()  # 1 hotkey
-    wctrl.close()  # 2 widget
-    mctrl.close()  # 3 module
-    octrl.disable()  # 4 overlay control
+    mctrl.close(wait=False)  # 2 module (signal)
+    wctrl.close()  # 3 widget
+    mctrl.join()  # 4 module (wait finish)
+    wqueue.flush()  # 5 pending user data writes
+    udb.close()  # 6 user database
+    ectrl.disable()  # 7 telemetry engine
+    gctrl.disable()  # 8 cpu usage governor
+    octrl.disable()  # 9 overlay control
+
+
+def userdata_sources() -> tuple[tuple, ...]:
+    """User data sources: folder, record kind (extension), binary file suffix, file reader, export converter"""
+    return (
+        (cfg.path.delta_best, FileExt.CSV, FileExt.BIN, read_delta_record, None),
+        (cfg.path.energy_delta, FileExt.ENERGY, FileExt.BIN, read_delta_record, None),
+        (cfg.path.fuel_delta, FileExt.FUEL, FileExt.BIN, read_delta_record, None),
+        (cfg.path.fuel_delta, FileExt.CONSUMPTION, FileExt.BIN, read_consumption_record, export_consumption_record),
+        (cfg.path.sector_best, FileExt.SECTOR, "", read_file_record, None),
+    )
+
+
+def open_user_database():
+    """Open user database if enabled, and import existing user data files on first open
+
+    If disabled, export database records that are newer than user data files (once),
+    so that no user data is lost after switching back to files.
+    """
+    filename_database = f"{cfg.path.delta_best}userdata{FileExt.DB}"
+    if not cfg.application["enable_user_database"]:
+        try:
+            total_exported = export_userdata_records(filename_database, {
+                kind: (filepath, suffix, converter)
+                for filepath, kind, suffix, _, converter in userdata_sources()
+            })
+            if total_exported:
+                logger.info("USERDATA: %s records exported from user database", total_exported)
+        except (OSError, sqlite3.Error):
+            logger.error("USERDATA: failed to export user database")
+        return
+    try:
+        if not udb.open(filename_database):
+            return
+        total_imported = udb.import_records(chain.from_iterable(
+            scan_userdata_files(filepath, kind, reader)
+            for filepath, kind, _, reader, _ in userdata_sources()
+        ))
+        udb.set_version()
+        logger.info("USERDATA: %s records imported to user database", total_imported)
+    except (OSError, sqlite3.Error):
+        logger.error("USERDATA: failed to open user database, fallback to files")
+        udb.close()
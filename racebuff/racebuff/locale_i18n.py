@@ -34,6 +34,7 @@ TRANSLATIONS = {
     "Grid Move": "Перемещение по сетке",
     "VR Compatibility": "Режим VR",
     "Reload": "Перезагрузить",
+    "Sampling Profiler": "Профилировщик",
     # Menu - reset
     "Reset Data": "Сброс данных",
     "Delta Best": "Delta Best",
@@ -30,6 +30,7 @@ __all__ = [
     "module_force",
     "module_fuel",
     "module_hybrid",
+    "module_laptrace",
     "module_mapping",
     "module_notes",
     "module_relative",
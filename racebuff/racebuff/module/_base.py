@@ -24,6 +24,8 @@ import logging
 import threading
 from functools import partial
 
+from .. import IdleEvent
+from ..governor_control import gctrl
 from ..setting import Setting
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,7 @@ class DataModule:
         "active_interval",
         "idle_interval",
         "_event",
+        "_thread",
     )
 
     def __init__(self, config: Setting, module_name: str):
@@ -56,7 +59,8 @@ class DataModule:
         self.mcfg: dict = self.cfg.user.setting[module_name]
 
         # Module update interval
-        self._event = threading.Event()
+        self._event = IdleEvent()
+        self._thread = None
         self.active_interval = max(
             self.mcfg["update_interval"],
             self.cfg.application["minimum_update_interval"]) / 1000
@@ -70,13 +74,26 @@ class DataModule:
         if self.closed:
             self.closed = False
             self._event.clear()
-            threading.Thread(target=self.__tasks, daemon=True).start()
+            self._thread = threading.Thread(target=self.__tasks, name=self.module_name, daemon=True)
+            self._thread.start()
+            gctrl.register(self.module_name, self, self.active_interval * 1000)
             logger.info("ENABLED: %s", self.module_name.replace("_", " "))
 
     def stop(self):
-        """Stop update thread"""
+        """Stop update thread (non-blocking), call join() to wait thread finish"""
+        gctrl.unregister(self)
         self._event.set()
 
+    def join(self):
+        """Wait update thread finish"""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def set_rate_scale(self, scale: float):
+        """Set update interval scale (from CPU usage governor)"""
+        self._event.timeout_scale = scale
+
     def update_data(self):
         """Update module data, rewrite in child class"""
 
@@ -20,7 +20,9 @@
 Delta module
 """
 
+from array import array
 from functools import partial
+from itertools import chain
 
 from .. import calculation as calc
 from .. import realtime_state
@@ -37,6 +39,8 @@ from ..userfile.delta_best import load_delta_best_file, save_delta_best_file
 from ..validator import is_same_session, valid_delta_raw, vehicle_position_sync
 from ._base import DataModule, round6
 
+DELTA_STEP = 1.0  # delta table resample step in meters
+
 
 class Realtime(DataModule):
     """Delta time data"""
@@ -61,6 +65,8 @@ class Realtime(DataModule):
         laptime_session_best = MAX_SECONDS
         laptime_stint_best = MAX_SECONDS
         min_delta_distance = self.mcfg["minimum_delta_distance"]
+        references = output.references
+        laptrace = minfo.laptrace
 
         calc_ema_delta = partial(
             calc.exp_mov_avg,
@@ -72,6 +78,7 @@ class Realtime(DataModule):
         )
         laptime_pace_margin = max(self.mcfg["laptime_pace_margin"], 0.1)
         gen_position_sync = vehicle_position_sync()
+        delta_table = DeltaTable(DELTA_STEP)
 
         while not _event_wait(update_interval):
             if realtime_state.active:
@@ -103,10 +110,14 @@ class Realtime(DataModule):
                     delta_array_raw = [DELTA_ZERO]  # distance, laptime
                     delta_array_last = DELTA_DEFAULT  # last lap
 
-                    delta_ema_best = 0.0
-                    delta_ema_last = 0.0
-                    delta_ema_session = 0.0
-                    delta_ema_stint = 0.0
+                    delta_ema = {}  # smoothed delta by reference name
+                    references.register("best", delta_array_best, laptime_best)
+                    references.register("last", delta_array_last, MAX_SECONDS)
+                    references.register("session", delta_array_session, laptime_session_best)
+                    references.register("stint", delta_array_stint, laptime_stint_best)
+                    references.unregister("opponent")
+                    laptrace_version = -1  # last checked lap trace version
+                    laptime_opponent = MAX_SECONDS
 
                     laptime_curr = 0.0  # current laptime
                     laptime_last = 0.0  # last laptime
@@ -130,10 +141,23 @@ class Realtime(DataModule):
                 in_pits = api.read.vehicle.in_pits()
                 is_pit_lap |= in_pits
 
+                # Update opponent reference from fastest opponent lap trace
+                if laptrace_version != laptrace.version:
+                    laptrace_version = laptrace.version
+                    trace_opponent = laptrace.fastest(api.read.vehicle.slot_id())
+                    if trace_opponent is None:
+                        if laptime_opponent != MAX_SECONDS:
+                            laptime_opponent = MAX_SECONDS
+                            references.unregister("opponent")
+                    elif laptime_opponent != trace_opponent.laptime:
+                        laptime_opponent = trace_opponent.laptime
+                        references.register("opponent", trace_opponent.dataset(), laptime_opponent)
+
                 # Reset delta stint best if in pit and stopped
                 if in_pits and laptime_stint_best != MAX_SECONDS and api.read.vehicle.speed() < 0.1:
                     delta_array_stint = DELTA_DEFAULT
                     laptime_stint_best = MAX_SECONDS
+                    references.register("stint", delta_array_stint, laptime_stint_best)
 
                 # Lap start & finish detection
                 if lap_stime > last_lap_stime:
@@ -141,6 +165,7 @@ class Realtime(DataModule):
                     if valid_delta_raw(delta_array_raw, laptime_last, 1):  # set end value
                         delta_array_raw.append((round6(pos_last + 10), round6(laptime_last)))
                         delta_array_last = tuple(delta_array_raw)
+                        references.register("last", delta_array_last, laptime_last)
                         validating = api.read.timing.elapsed()
                     delta_array_raw[:] = DELTA_DEFAULT
                     pos_last = pos_recorded = pos_curr
@@ -188,14 +213,17 @@ class Realtime(DataModule):
                                 filename=combo_name,
                                 dataset=delta_array_best,
                             )
+                            references.register("best", delta_array_best, laptime_best)
                         # Update delta session best list
                         if laptime_session_best > laptime_last:
                             laptime_session_best = laptime_last
                             delta_array_session = delta_array_last
+                            references.register("session", delta_array_session, laptime_session_best)
                         # Update delta stint best list
                         if laptime_stint_best > laptime_last:
                             laptime_stint_best = laptime_last
                             delta_array_stint = delta_array_last
+                            references.register("stint", delta_array_stint, laptime_stint_best)
                         validating = 0
 
                 # Calc distance
@@ -213,44 +241,23 @@ class Realtime(DataModule):
                 # Calc delta
                 if pos_synced_last != pos_synced:
                     pos_synced_last = pos_synced
-                    delay_update = laptime_curr > 0.3
+                    # Resample only if any reference changed
+                    delta_table.update(references.sources)
+                    if laptime_curr > 0.3:  # delay update
+                        deltas = delta_table.lookup(pos_synced, laptime_curr)
+                    else:
+                        deltas = delta_table.zeros
                     # Smooth delta
-                    delta_ema_best = calc_ema_delta(
-                        delta_ema_best,
-                        calc.delta_telemetry(
-                            delta_array_best,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_last = calc_ema_delta(
-                        delta_ema_last,
-                        calc.delta_telemetry(
-                            delta_array_last,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_session = calc_ema_delta(
-                        delta_ema_session,
-                        calc.delta_telemetry(
-                            delta_array_session,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_stint = calc_ema_delta(
-                        delta_ema_stint,
-                        calc.delta_telemetry(
-                            delta_array_stint,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
+                    delta_ema_get = delta_ema.get
+                    references.deltas = delta_ema = {
+                        name: calc_ema_delta(delta_ema_get(name, 0.0), delta)
+                        for name, delta in zip(delta_table.names, deltas)
+                    }
+
+                delta_ema_best = delta_ema.get("best", 0.0)
+                delta_ema_last = delta_ema.get("last", 0.0)
+                delta_ema_session = delta_ema.get("session", 0.0)
+                delta_ema_stint = delta_ema.get("stint", 0.0)
 
                 # Estimated laptime
                 laptime_est = laptime_stint_best + delta_ema_stint  # from stint
@@ -283,6 +290,89 @@ class Realtime(DataModule):
                     last_session_id = (combo_name, *session_id)
 
 
+class DeltaTable:
+    """Uniform distance delta table
+
+    Delta references are resampled at fixed distance step, and stacked in
+    one flat array (row = distance step, column = reference), so that
+    any number of references are looked up with single index calculation.
+    Only changed references are resampled, unless table length changed.
+
+    Args:
+        step: resample step in meters.
+    """
+
+    __slots__ = (
+        "_step",
+        "_sources",
+        "_columns",
+        "_starts",
+        "_rows",
+        "_table",
+        "names",
+        "zeros",
+    )
+
+    def __init__(self, step: float):
+        self._step = step
+        self._sources: dict[str, tuple] = {}
+        self._columns: dict[str, list[float]] = {}
+        self._starts: tuple[float, ...] = ()  # no delta before start position
+        self._rows = 0
+        self._table = array("d")
+        self.names: tuple[str, ...] = ()
+        self.zeros: tuple[float, ...] = ()
+
+    def update(self, sources: dict[str, tuple]):
+        """Update delta references, resample if any reference changed"""
+        last_sources = self._sources
+        if sources is last_sources:
+            return
+        self._sources = sources
+        step = self._step
+        valid_sources = {name: dataset for name, dataset in sources.items() if len(dataset) > 1}
+        # Extra 2 rows beyond last position for extrapolation
+        rows = max(
+            (int(dataset[-1][0] / step) + 3 for dataset in valid_sources.values()),
+            default=0,
+        )
+        last_columns = self._columns if rows == self._rows else {}
+        columns = {}
+        for name, dataset in sources.items():
+            column = last_columns.get(name)
+            if column is None or last_sources.get(name) is not dataset:
+                if name in valid_sources:
+                    column = calc.resample_delta(dataset, step, rows)
+                else:
+                    column = [0.0] * rows
+            columns[name] = column
+        self._columns = columns
+        self._starts = tuple(
+            dataset[0][0] if name in valid_sources else FLOAT_INF
+            for name, dataset in sources.items()
+        )
+        self._table = array("d", chain.from_iterable(zip(*columns.values())))
+        self._rows = rows
+        self.names = tuple(sources)
+        self.zeros = (0.0,) * len(sources)
+
+    def lookup(self, position: float, target: float) -> tuple[float, ...]:
+        """Lookup delta (target - reference) of all references at position"""
+        if self._rows < 2:
+            return self.zeros
+        step_position = position / self._step
+        row = min(int(step_position), self._rows - 2)
+        fraction = step_position - row
+        table = self._table
+        lower = row * len(self._starts)
+        higher = lower + len(self._starts)
+        return tuple(
+            target - (table[lower + column] + (table[higher + column] - table[lower + column]) * fraction)
+            if position > start else 0.0
+            for column, start in enumerate(self._starts)
+        )
+
+
 def init_laptime_pace(laptime_best: float):
     """Initialize laptime pace value"""
     if 0 < laptime_best < MAX_SECONDS:
@@ -79,12 +79,21 @@ class Realtime(DataModule):
                     # Reset module output
                     minfo.fuel.reset()
                     load_consumption_history(userpath_fuel_delta, combo_name)
+                    fuel_last = api.read.vehicle.fuel()
+                    is_refilled = False
 
                 # Run calculation
                 gen_calc_fuel.send(True)
 
+                # Pitstop refilling check (start new stint)
+                fuel_curr = api.read.vehicle.fuel()
+                if fuel_last < fuel_curr and api.read.vehicle.speed() <= 1:
+                    is_refilled = True
+                fuel_last = fuel_curr
+
                 # Update consumption history
-                update_consumption_history()
+                if update_consumption_history(is_refilled):
+                    is_refilled = False
 
             else:
                 if reset:
@@ -95,41 +104,49 @@ class Realtime(DataModule):
                     save_consumption_history(userpath_fuel_delta, combo_name)
 
 
-def update_consumption_history():
-    """Update consumption history"""
+def update_consumption_history(is_refilled: bool) -> bool:
+    """Update consumption history, returns true if added new lap
+
+    Start new stint after refilling, or if lap number not continuous.
+    """
     if not (10 > minfo.delta.lapTimeCurrent > 2) or minfo.delta.lapTimeLast < 1:
-        return
+        return False
 
     lap_number = api.read.lap.completed_laps() - 1
-    if (
-        minfo.history.consumptionDataSet[0].lapTimeLast != minfo.delta.lapTimeLast
-        or minfo.history.consumptionDataSet[0].lapNumber != lap_number
-    ):
-        minfo.history.consumptionDataSet.appendleft(
-            ConsumptionDataSet(
-                lapNumber=lap_number,
-                isValidLap=int(minfo.delta.isValidLap),
-                lapTimeLast=minfo.delta.lapTimeLast,
-                lastLapUsedFuel=minfo.fuel.lastLapConsumption,
-                lastLapUsedEnergy=minfo.energy.lastLapConsumption,
-                batteryDrainLast=minfo.hybrid.batteryDrainLast,
-                batteryRegenLast=minfo.hybrid.batteryRegenLast,
-                tyreAvgWearLast=calc.mean(minfo.wheels.lastLapTreadWear),
-                capacityFuel=minfo.fuel.capacity,
-            )
+    history = minfo.history.consumptionDataSet
+    latest = history.latest()
+    if latest.lapTimeLast == minfo.delta.lapTimeLast and latest.lapNumber == lap_number:
+        return False
+
+    stint_number = latest.stintNumber
+    if is_refilled or not history or latest.lapNumber + 1 != lap_number:
+        stint_number += 1
+    history.append(
+        ConsumptionDataSet(
+            lapNumber=lap_number,
+            isValidLap=int(minfo.delta.isValidLap),
+            lapTimeLast=minfo.delta.lapTimeLast,
+            lastLapUsedFuel=minfo.fuel.lastLapConsumption,
+            lastLapUsedEnergy=minfo.energy.lastLapConsumption,
+            batteryDrainLast=minfo.hybrid.batteryDrainLast,
+            batteryRegenLast=minfo.hybrid.batteryRegenLast,
+            tyreAvgWearLast=calc.mean(minfo.wheels.lastLapTreadWear),
+            capacityFuel=minfo.fuel.capacity,
+            stintNumber=stint_number,
         )
-        minfo.history.consumptionDataVersion += 1
+    )
+    minfo.history.consumptionDataVersion += 1
+    return True
 
 
 def load_consumption_history(filepath: str, combo_name: str):
     """Load consumption history"""
     if minfo.history.consumptionDataName != combo_name:
-        dataset = load_consumption_history_file(
+        history = load_consumption_history_file(
             filepath=filepath,
             filename=combo_name,
         )
-        minfo.history.consumptionDataSet.clear()
-        minfo.history.consumptionDataSet.extend(dataset)
+        minfo.history.consumptionDataSet.replace(history)
         # Update combo info
         minfo.history.consumptionDataName = combo_name
         minfo.history.consumptionDataVersion = hash(combo_name)  # unique start id
@@ -139,7 +156,7 @@ def save_consumption_history(filepath: str, combo_name: str):
     """Save consumption history"""
     if minfo.history.consumptionDataVersion != hash(combo_name):
         save_consumption_history_file(
-            dataset=minfo.history.consumptionDataSet,
+            history=minfo.history.consumptionDataSet,
             filepath=filepath,
             filename=combo_name,
         )
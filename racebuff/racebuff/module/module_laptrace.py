@@ -0,0 +1,76 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Lap trace module
+"""
+
+from .. import realtime_state
+from ..api_control import api
+from ..module_info import minfo
+from ._base import DataModule
+
+
+class Realtime(DataModule):
+    """Lap trace data"""
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        reset = False
+        update_interval = self.idle_interval
+
+        output = minfo.laptrace
+        trace_step = max(self.mcfg["trace_distance_step"], 1)
+        max_trace_samples = max(self.mcfg["maximum_trace_samples"], 16)
+
+        while not _event_wait(update_interval):
+            if realtime_state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+
+                    track_length = api.read.lap.track_length()
+                    max_samples = min(int(track_length / trace_step) + 16, max_trace_samples)
+                    output.reset(trace_step, max_samples, track_length)
+                    vehicle_range = ()
+                    last_total = -1
+
+                total_vehicles = api.read.vehicle.total_vehicles()
+                if last_total != total_vehicles:
+                    last_total = total_vehicles
+                    vehicle_range = range(total_vehicles)
+
+                output.update(
+                    total_vehicles,
+                    tuple(map(api.read.vehicle.slot_id, vehicle_range)),
+                    tuple(map(api.read.lap.distance, vehicle_range)),
+                    tuple(map(api.read.timing.current_laptime, vehicle_range)),
+                    tuple(map(api.read.timing.start, vehicle_range)),
+                )
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
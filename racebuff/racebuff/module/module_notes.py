@@ -22,18 +22,17 @@ Notes module
 
 from __future__ import annotations
 
-from typing import Callable, Mapping
+from typing import Callable
 
-from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_file import FileExt
 from ..module_info import NotesInfo, minfo
 from ..userfile.track_notes import (
-    COLUMN_DISTANCE,
     HEADER_PACE_NOTES,
     HEADER_TRACK_NOTES,
-    load_notes_file,
+    NotesIndex,
+    load_notes_index,
     parse_csv_notes_only,
 )
 from ..validator import generator_init
@@ -86,7 +85,7 @@ class Realtime(DataModule):
                         )
 
                     # Load track notes
-                    track_notes = load_notes_file(
+                    track_notes = load_notes_index(
                         filepath=userpath_track_notes,
                         filename=track_name,
                         table_header=HEADER_TRACK_NOTES,
@@ -121,12 +120,12 @@ class Realtime(DataModule):
 def load_pace_notes_file(
     config: dict, filepath: str, filename: str,
     table_header: tuple, parser: Callable, extension: str):
-    """Load pace notes"""
+    """Load pace notes index"""
     if config["enable_manual_file_selector"]:
         filepath = ""
         filename = config["pace_notes_file_name"]
         extension = ""
-    return load_notes_file(
+    return load_notes_index(
         filepath=filepath,
         filename=filename,
         table_header=table_header,
@@ -136,23 +135,21 @@ def load_pace_notes_file(
 
 
 @generator_init
-def notes_selector(output: NotesInfo, dataset: list[Mapping]):
+def notes_selector(output: NotesInfo, dataset: NotesIndex):
     """Notes selector
 
     Args:
         output: module info.
-        dataset: list of notes.
+        dataset: compiled notes index.
     """
     last_index = -99999  # make sure initial index is different
-    next_index = 0  # next note line index
-    end_index = len(dataset) - 1  # end note line index
-    pos_reference = reference_position(dataset)
-    pos_final = pos_reference[-1]  # final reference position
+    pos_final = dataset.distances[-1]  # final reference position
+    index_at = dataset.index_at
     output.reset()  # initial reset before updating
 
     while True:
         pos_curr = yield
-        curr_index = calc.binary_search_lower(pos_reference, pos_curr, 0, end_index)
+        curr_index = index_at(pos_curr)
 
         if last_index == curr_index:
             continue
@@ -161,11 +158,6 @@ def notes_selector(output: NotesInfo, dataset: list[Mapping]):
         next_index = (curr_index + 1) * (pos_curr < pos_final)
 
         output.currentIndex = curr_index
-        output.currentNote = dataset[curr_index]
+        output.currentNote = dataset.note(curr_index)
         output.nextIndex = next_index
-        output.nextNote = dataset[next_index]
-
-
-def reference_position(notes: list[Mapping]) -> tuple[float, ...]:
-    """Reference notes position list"""
-    return tuple(note_line[COLUMN_DISTANCE] for note_line in notes)
+        output.nextNote = dataset.note(next_index)
@@ -23,6 +23,7 @@ Relative module
 from __future__ import annotations
 
 from functools import lru_cache
+from heapq import nlargest, nsmallest
 from itertools import chain
 from operator import itemgetter
 
@@ -66,6 +67,7 @@ class Realtime(DataModule):
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
+                    last_standings_state = None
 
                 # Check setting
                 if last_version_update != self.cfg.version_update:
@@ -94,12 +96,23 @@ class Realtime(DataModule):
                 plr_place = api.read.vehicle.place()
 
                 # Get vehicles info
-                (relative_ahead, relative_behind, classes_list, draw_order_list, is_multi_class,
+                (relative_ahead, relative_behind, classes_list, draw_order_list, is_multi_class, classes_changed,
                  ) = get_vehicles_info(veh_total, plr_index, show_in_garage)
 
                 # Create relative index list
                 relative_index_list = create_relative_index(
                     relative_ahead, relative_behind, plr_index, max_veh_front, max_veh_behind)
+                output.relative = relative_index_list
+                output.drawOrder = draw_order_list
+
+                # Skip standings update if no place, class, laptime, setting change
+                standings_state = (veh_total, plr_index, plr_place, last_version_update)
+                if not classes_changed and last_standings_state == standings_state:
+                    continue
+                last_standings_state = standings_state
+
+                # Sort classes list by vehicle class
+                classes_list.sort()
 
                 # Create vehicle class position list (initially ordered by class name)
                 class_pos_list, plr_class_name, plr_class_place = create_position_in_class(
@@ -123,10 +136,8 @@ class Realtime(DataModule):
                 class_pos_list.sort()
 
                 # Output data
-                output.relative = relative_index_list
                 output.standings = standings_index_list
                 output.classes = class_pos_list
-                output.drawOrder = draw_order_list
 
             else:
                 if reset:
@@ -139,8 +150,10 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
     """Get vehicles info: relative time gap, classes, places, laptime"""
     laptime_est = api.read.timing.estimated_laptime()
     plr_time = api.read.timing.estimated_time_into()
+    timing_interval = minfo.vehicles.timingLines.interval
     last_class_name = None
     classes_count = 0
+    classes_changed = False
     recorded_index = 0
     leader_index = 0
     pitter_index = 0
@@ -152,13 +165,17 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
 
         # Update relative time gap list
         if index != plr_index and laptime_est and (show_in_garage or not in_garage):
-            opt_time = api.read.timing.estimated_time_into(index)
-            diff_time = opt_time - plr_time
-            diff_time_ahead = diff_time_behind = diff_time - diff_time // laptime_est * laptime_est
-            if diff_time_ahead < 0:
-                diff_time_ahead += laptime_est
-            if diff_time_behind > 0:
-                diff_time_behind -= laptime_est
+            # Time gap from timing lines if available (within a lap)
+            diff_time_ahead = timing_interval(index, plr_index)
+            diff_time_behind = -timing_interval(plr_index, index)
+            if not (0 <= diff_time_ahead < laptime_est and -laptime_est < diff_time_behind <= 0):
+                opt_time = api.read.timing.estimated_time_into(index)
+                diff_time = opt_time - plr_time
+                diff_time_ahead = diff_time_behind = diff_time - diff_time // laptime_est * laptime_est
+                if diff_time_ahead < 0:
+                    diff_time_ahead += laptime_est
+                if diff_time_behind > 0:
+                    diff_time_behind -= laptime_est
 
             TEMP_RELATIVE_AHEAD[recorded_index][:] = (
                 diff_time_ahead,  # 0 relative time gap
@@ -186,13 +203,20 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
         else:
             laptime_personal_best = MAX_SECONDS
 
-        TEMP_CLASSES[index][:] = (
-            class_name,  # 0 vehicle class name
-            place_overall,  # 1 overall position/place
-            index,  # 2 player index
-            laptime_personal_best,  # 3 best lap time
-            laptime_personal_last,  # 4 last lap time (for fastest last lap check)
-        )
+        # Only update classes data if changed
+        class_data = TEMP_CLASSES[index]
+        if (class_data[1] != place_overall
+            or class_data[0] != class_name
+            or class_data[3] != laptime_personal_best
+            or class_data[4] != laptime_personal_last):
+            classes_changed = True
+            class_data[:] = (
+                class_name,  # 0 vehicle class name
+                place_overall,  # 1 overall position/place
+                index,  # 2 player index
+                laptime_personal_best,  # 3 best lap time
+                laptime_personal_last,  # 4 last lap time (for fastest last lap check)
+            )
 
         # Update draw order list
         if place_overall == 1:  # save leader index
@@ -214,33 +238,31 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
         player_pos = draw_order.index(plr_index)
         draw_order[player_pos], draw_order[-2] = draw_order[-2], draw_order[player_pos]
 
-    # Sort output in-place
-    relative_ahead = TEMP_RELATIVE_AHEAD[:recorded_index]
-    relative_ahead.sort(reverse=True)  # by reversed time gap
-
-    relative_behind = TEMP_RELATIVE_BEHIND[:recorded_index]
-    relative_behind.sort(reverse=True)  # by reversed time gap
-
-    new_classes = TEMP_CLASSES[:veh_total]
-    new_classes.sort()  # by vehicle class
-
+    # Relative lists are unsorted, nearest vehicles are selected in create_relative_index
+    # Classes list is unsorted, only sort if classes changed
     return (
-        relative_ahead,
-        relative_behind,
-        new_classes,  # classes_list
+        TEMP_RELATIVE_AHEAD[:recorded_index],
+        TEMP_RELATIVE_BEHIND[:recorded_index],
+        TEMP_CLASSES[:veh_total],  # classes_list
         draw_order,
         classes_count > 1,  # is_multi_class
+        classes_changed,
     )
 
 
 def create_relative_index(
     relative_ahead: list, relative_behind: list, plr_index: int, max_veh_ahead: int, max_veh_behind: int):
-    """Create player-centered relative (time, index) list"""
-    ahead_cut = relative_ahead[max(len(relative_ahead) - max_veh_ahead, 0):]
+    """Create player-centered relative (time, index) list
+
+    Only select nearest vehicles from unsorted relative lists,
+    so that cost scales with displayed vehicles rather than field size.
+    """
+    ahead_cut = nsmallest(max_veh_ahead, relative_ahead)  # nearest ahead
+    ahead_cut.reverse()  # by reversed time gap
     ahead_diff = max_veh_ahead - len(ahead_cut)
     if ahead_diff > 0:
         ahead_cut = [REL_TIME_DEFAULT] * ahead_diff + ahead_cut
-    behind_cut = relative_behind[:min(len(relative_behind), max_veh_behind)]
+    behind_cut = nlargest(max_veh_behind, relative_behind)  # nearest behind, by reversed time gap
     behind_diff = max_veh_behind - len(behind_cut)
     if behind_diff > 0:
         behind_cut += [REL_TIME_DEFAULT] * behind_diff
@@ -22,12 +22,23 @@ Stats module
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_common import FLOAT_INF, POS_XYZ_INF
+from ..const_file import StatsFile
 from ..module_info import minfo
-from ..userfile.driver_stats import DriverStats, load_driver_stats, save_driver_stats
+from ..userfile.driver_stats import (
+    JOURNAL_COMPACT_SIZE,
+    DriverStats,
+    append_driver_stats,
+    compact_driver_stats,
+    diff_driver_stats,
+    load_driver_stats,
+)
+from ..userfile.write_queue import wqueue
 from ._base import DataModule
 
 
@@ -66,11 +77,13 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
 
                     # Load driver stats
+                    stats_keys = self.stats_keys(vehicle_class)
                     loaded_stats = load_driver_stats(
-                        key_list=self.stats_keys(vehicle_class),
+                        key_list=stats_keys,
                         filepath=self.cfg.path.config,
                     )
                     driver_stats = DriverStats()
+                    journal_stats = DriverStats()  # stats written to journal
                     is_pit_lap = 0
                     last_lap_stime = FLOAT_INF
                     last_lap_etime = FLOAT_INF
@@ -123,6 +136,13 @@ class Realtime(DataModule):
                         driver_stats.invalid += 1
                     is_pit_lap = 0
                     last_lap_stime = lap_stime
+                    # Append stats changes to journal
+                    append_driver_stats(
+                        key_list=stats_keys,
+                        stats_delta=diff_driver_stats(driver_stats, journal_stats),
+                        filepath=self.cfg.path.config,
+                    )
+                    journal_stats = replace(driver_stats)
 
                 # Seconds spent
                 if last_lap_etime > lap_etime:
@@ -171,11 +191,18 @@ class Realtime(DataModule):
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
-                    save_driver_stats(
-                        key_list=self.stats_keys(vehicle_class),
-                        stats_update=driver_stats,
+                    append_driver_stats(
+                        key_list=stats_keys,
+                        stats_delta=diff_driver_stats(driver_stats, journal_stats),
                         filepath=self.cfg.path.config,
                     )
+                    wqueue.submit(
+                        f"{self.cfg.path.config}{StatsFile.DRIVER}",
+                        compact_driver_stats,
+                        self.cfg.path.config,
+                        StatsFile.DRIVER,
+                        JOURNAL_COMPACT_SIZE,
+                    )
 
     def stats_keys(self, vehicle_class: str) -> tuple[str, str]:
         """Stats key names"""
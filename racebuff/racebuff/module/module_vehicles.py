@@ -22,11 +22,15 @@ Vehicles module
 
 from __future__ import annotations
 
+from array import array
+from math import cos, hypot, sin
+from operator import add
+
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_common import MAX_METERS, MAX_SECONDS
-from ..module_info import VehicleDataSet, VehiclesInfo, minfo
+from ..module_info import VehicleDataSet, VehiclesInfo, VehicleTimingLines, minfo
 from ..validator import state_timer
 from ._base import DataModule
 
@@ -58,6 +62,7 @@ class Realtime(DataModule):
                     reset = True
                     update_interval = self.active_interval
                     output.dataSetVersion = -1
+                    output.timingLines.reset()
                     last_veh_total = 0
 
                 veh_total = output.totalVehicles = api.read.vehicle.total_vehicles()
@@ -71,6 +76,7 @@ class Realtime(DataModule):
 
                 if last_veh_total != veh_total:
                     last_veh_total = veh_total
+                    output.timingLines.reset()
                     if veh_total > 0:
                         update_qualify_position(output)
 
@@ -86,12 +92,13 @@ def update_vehicle_data(
     max_lap_diff_behind: float,
     update_low_priority: bool,
 ) -> None:
-    """Update vehicle data"""
-    nearest_line = MAX_METERS
-    nearest_time_behind = -MAX_SECONDS
-    nearest_yellow_ahead = MAX_METERS
-    nearest_yellow_behind = -MAX_METERS
+    """Update vehicle data
 
+    High priority data are read as fleet columns (one tuple per data type,
+    indexed by vehicle index) with bound reader methods, and derived data
+    (lap progress, yellow flag, nearest traffic & yellow) are calculated
+    over whole columns, then written to vehicle data columns in bulk.
+    """
     # Counter
     total_completed_laps = 0
     total_out_pits = 0
@@ -102,6 +109,7 @@ def update_vehicle_data(
     # General data
     track_length = api.read.lap.track_length()
     in_race = api.read.session.in_race()
+    session_time = api.read.session.elapsed()
     speedtrap_distance = minfo.mapping.speedTrapPosition
 
     # Local player data
@@ -113,92 +121,127 @@ def update_vehicle_data(
     plr_pos_x = api.read.vehicle.position_longitudinal()
     plr_pos_y = api.read.vehicle.position_lateral()
     plr_ori_yaw = api.read.vehicle.orientation_yaw_radians()
+    plr_ori_rad = plr_ori_yaw - 3.14159265  # rotate view
+    plr_sin_rad = sin(plr_ori_rad)
+    plr_cos_rad = cos(plr_ori_rad)
+
+    # Bound reader
+    read_pos_x = api.read.vehicle.position_longitudinal
+    read_pos_y = api.read.vehicle.position_lateral
+    read_ori_yaw = api.read.vehicle.orientation_yaw_radians
+    lap_difference = calc.lap_difference
+
+    # Fleet columns
+    indexes = range(output.totalVehicles)
+    col_laps = tuple(map(api.read.lap.completed_laps, indexes))
+    col_distance = tuple(map(api.read.lap.distance, indexes))
+    col_speed = tuple(map(api.read.vehicle.speed, indexes))
+    col_in_pit = tuple(map(api.read.vehicle.in_paddock, indexes))
+    col_slot_id = tuple(map(api.read.vehicle.slot_id, indexes))
+    col_etime = tuple(map(api.read.timing.elapsed, indexes))
+    col_progress = lap_progress_column(col_distance, track_length)
+    col_yellow = tuple(speed < 8 for speed in col_speed)
+    plr_index = find_player_index(indexes)
+
+    # Nearest traffic time gap (opponents behind local players)
+    nearest_time_behind = max(
+        (
+            calc.circular_relative_distance(plr_laptime_est, plr_timeinto_est, api.read.timing.estimated_time_into(index))
+            for index in indexes
+            if index != plr_index and not col_in_pit[index]
+        ),
+        key=nearest_behind_key,
+        default=-MAX_SECONDS,
+    )
+    if not 0 > nearest_time_behind > -MAX_SECONDS:
+        nearest_time_behind = -MAX_SECONDS
 
-    # Update dataset from all vehicles in current session
-    for index, data, class_pos in zip(range(output.totalVehicles), output.dataSet, minfo.relative.classes):
-        # Temp var only
-        laps_completed = api.read.lap.completed_laps(index)
-        lap_distance = api.read.lap.distance(index)
-        speed = api.read.vehicle.speed(index)
+    # Nearest yellow flag distance
+    if 0 <= plr_index < output.totalVehicles and col_yellow[plr_index]:
+        nearest_yellow_ahead = 0.0
+        nearest_yellow_behind = 0.0
+    else:
+        yellow_distance = tuple(
+            calc.circular_relative_distance(track_length, plr_lap_distance, col_distance[index])
+            for index in indexes
+            if col_yellow[index] and index != plr_index
+        )
+        nearest_yellow_ahead = min(
+            (rel_dist for rel_dist in yellow_distance if rel_dist >= 0), default=MAX_METERS)
+        nearest_yellow_behind = max(
+            (rel_dist for rel_dist in yellow_distance if rel_dist <= 0), default=-MAX_METERS)
+        if nearest_yellow_ahead > MAX_METERS:
+            nearest_yellow_ahead = MAX_METERS
+        if nearest_yellow_behind < -MAX_METERS:
+            nearest_yellow_behind = -MAX_METERS
+
+    # Update high priority columns
+    columns = output.columns
+    total = output.totalVehicles
+    columns.isPlayer[:total] = [index == plr_index for index in indexes]
+    columns.currentLapProgress[:total] = array("d", col_progress)
+    columns.totalLapProgress[:total] = col_lap_progress_total = array("d", map(add, col_laps, col_progress))
+    columns.isYellow[:total] = col_yellow
+    columns.inPit[:total] = array("q", col_in_pit)
+    output.timingLines.update(col_lap_progress_total, total, session_time)
+    if 0 <= plr_index < total:
+        output.playerIndex = plr_index
+        columns.elapsedTime[plr_index] = elapsed_time
+        columns.worldPositionX[plr_index] = plr_pos_x
+        columns.worldPositionY[plr_index] = plr_pos_y
+
+    out_etime = columns.elapsedTime
+    out_pos_x = columns.worldPositionX
+    out_pos_y = columns.worldPositionY
+    out_rel_ori = columns.relativeOrientationRadians
+    out_rel_pos_x = columns.relativeRotatedPositionX
+    out_rel_pos_y = columns.relativeRotatedPositionY
+    out_rel_dist = columns.relativeStraightDistance
+    out_lapped = columns.isLapped
 
+    # Update dataset from all vehicles in current session
+    for (index, data, class_pos, pit_timer, speed_trap, laps_completed, lap_distance, speed, in_pit, slot_id, opt_etime
+         ) in zip(indexes, output.dataSet, minfo.relative.classes, columns.pitTimer, columns.speedTrap,
+                  col_laps, col_distance, col_speed, col_in_pit, col_slot_id, col_etime):
         # Update high priority info
-        data.isPlayer = api.read.vehicle.is_player(index)
-        data.currentLapProgress = calc.lap_progress_distance(lap_distance, track_length)
-        data.totalLapProgress = laps_completed + data.currentLapProgress
-        data.isYellow = speed < 8
-        data.inPit = api.read.vehicle.in_paddock(index)
-        data.pitTimer.update(api.read.vehicle.slot_id(index), data.inPit, elapsed_time, laps_completed, speed)
-
-        if not data.inPit:
-            data.speedTrap.update(speed, lap_distance, speedtrap_distance, track_length)
-
-        if data.isPlayer:
-            data.elapsedTime = elapsed_time
-            data.worldPositionX = plr_pos_x
-            data.worldPositionY = plr_pos_y
-            output.playerIndex = index
-            if data.isYellow:
-                nearest_yellow_ahead = 0.0
-                nearest_yellow_behind = 0.0
-        else:
-            # Relative position & orientation
-            opt_etime = api.read.timing.elapsed(index)
-            if data.elapsedTime != opt_etime:
-                opt_pos_x = api.read.vehicle.position_longitudinal(index)
-                opt_pos_y = api.read.vehicle.position_lateral(index)
-                opt_ori_yaw = api.read.vehicle.orientation_yaw_radians(index)
-                # Player data update rate may be (twice) higher than opponents
-                # Interpolate coordinates to avoid desync
-                est_pos_x, est_pos_y = interp_coordinate(
-                    opt_pos_x,
-                    data.worldPositionX,
-                    opt_pos_y,
-                    data.worldPositionY,
-                    opt_etime,
-                    data.elapsedTime,
-                    elapsed_time,
-                )
-                data.worldPositionX = opt_pos_x
-                data.worldPositionY = opt_pos_y
-                data.elapsedTime = opt_etime
-
-                data.relativeOrientationRadians = opt_ori_yaw - plr_ori_yaw
-                data.relativeRotatedPositionX, data.relativeRotatedPositionY = calc.rotate_coordinate(
-                    plr_ori_yaw - 3.14159265,  # plr_ori_rad, rotate view
-                    est_pos_x - plr_pos_x,  # x position related to player
-                    est_pos_y - plr_pos_y,  # y position related to player
-                )
-                # Relative distance & time gap
-                data.relativeStraightDistance = calc.distance(
-                    (plr_pos_x, plr_pos_y),
-                    (est_pos_x, est_pos_y)
-                )
-
-                data.isLapped = calc.lap_difference(
-                    data.totalLapProgress, plr_lap_progress_total,
-                    max_lap_diff_ahead, max_lap_diff_behind
-                ) if in_race else 0
-
-            # Nearest straight line distance (non local players)
-            if nearest_line > data.relativeStraightDistance:
-                nearest_line = data.relativeStraightDistance
-            # Nearest traffic time gap (opponents behind local players)
-            if not data.inPit:
-                opt_time_behind = calc.circular_relative_distance(
-                    plr_laptime_est,
-                    plr_timeinto_est,
-                    api.read.timing.estimated_time_into(index),
-                )
-                if 0 > opt_time_behind > nearest_time_behind:
-                    nearest_time_behind = opt_time_behind
-            # Nearest yellow flag distance
-            if data.isYellow:
-                opt_rel_distance = calc.circular_relative_distance(
-                    track_length, plr_lap_distance, lap_distance)
-                if nearest_yellow_ahead > opt_rel_distance >= 0:
-                    nearest_yellow_ahead = opt_rel_distance
-                if nearest_yellow_behind < opt_rel_distance <= 0:
-                    nearest_yellow_behind = opt_rel_distance
+        lap_progress_total = col_lap_progress_total[index]
+        pit_timer.update(slot_id, in_pit, elapsed_time, laps_completed, speed)
+
+        if not in_pit:
+            speed_trap.update(speed, lap_distance, speedtrap_distance, track_length)
+
+        # Relative position & orientation, only update if opponent data changed
+        if index != plr_index and out_etime[index] != opt_etime:
+            opt_pos_x = read_pos_x(index)
+            opt_pos_y = read_pos_y(index)
+            # Player data update rate may be (twice) higher than opponents
+            # Interpolate coordinates to avoid desync
+            est_pos_x, est_pos_y = interp_coordinate(
+                opt_pos_x,
+                out_pos_x[index],
+                opt_pos_y,
+                out_pos_y[index],
+                opt_etime,
+                out_etime[index],
+                elapsed_time,
+            )
+            out_pos_x[index] = opt_pos_x
+            out_pos_y[index] = opt_pos_y
+            out_etime[index] = opt_etime
+
+            # Position related to player
+            rel_pos_x = est_pos_x - plr_pos_x
+            rel_pos_y = est_pos_y - plr_pos_y
+            out_rel_ori[index] = read_ori_yaw(index) - plr_ori_yaw
+            out_rel_pos_x[index] = plr_cos_rad * rel_pos_x - plr_sin_rad * rel_pos_y
+            out_rel_pos_y[index] = plr_cos_rad * rel_pos_y + plr_sin_rad * rel_pos_x
+            # Relative distance
+            out_rel_dist[index] = hypot(rel_pos_x, rel_pos_y)
+
+            out_lapped[index] = lap_difference(
+                lap_progress_total, plr_lap_progress_total,
+                max_lap_diff_ahead, max_lap_diff_behind
+            ) if in_race else 0
 
         # Update low priority info
         if update_low_priority:
@@ -221,21 +264,23 @@ def update_vehicle_data(
 
             data.gapBehindNext = calc_gap_behind_next(index)
             data.gapBehindLeader = calc_gap_behind_leader(index)
-            data.gapBehindNextInClass = calc_time_gap_behind(opt_index_ahead, index, track_length, data.totalLapProgress)
-            data.gapBehindLeaderInClass = calc_time_gap_behind(opt_index_leader, index, track_length, data.totalLapProgress)
+            data.gapBehindNextInClass = calc_time_gap_behind(
+                output.timingLines, opt_index_ahead, index, track_length, lap_progress_total)
+            data.gapBehindLeaderInClass = calc_time_gap_behind(
+                output.timingLines, opt_index_leader, index, track_length, lap_progress_total)
 
             data.vehicleIntegrity = api.read.vehicle.integrity(index)
             data.lapTimeHistory.update(api.read.timing.start(index), elapsed_time, data.lastLapTime)
 
-            update_stint_usage(data, laps_completed)
+            update_stint_usage(data, laps_completed, in_pit, lap_progress_total)
 
             # Update counter
             total_completed_laps += laps_completed
 
-            if data.inPit == 1:  # in pit (exclude garage)
+            if in_pit == 1:  # in pit (exclude garage)
                 total_in_pits += 1
                 total_stopped_pits += (speed < 0.1)
-            elif data.inPit == 0:  # out pit
+            elif in_pit == 0:  # out pit
                 total_out_pits += 1
                 total_pit_requests += data.pitRequested
 
@@ -245,7 +290,12 @@ def update_vehicle_data(
                 output.leaderBestLapTime = data.bestLapTime
 
     # Output extra info
-    output.nearestLine = nearest_line
+    output.nearestLine = min(
+        (distance for index, distance in zip(indexes, out_rel_dist) if index != plr_index),
+        default=MAX_METERS,
+    )
+    if output.nearestLine > MAX_METERS:
+        output.nearestLine = MAX_METERS
     output.nearestTraffic = -nearest_time_behind
     output.nearestYellowAhead = nearest_yellow_ahead
     output.nearestYellowBehind = nearest_yellow_behind
@@ -259,6 +309,30 @@ def update_vehicle_data(
         output.totalCompletedLaps = total_completed_laps
 
 
+def lap_progress_column(distance_column: tuple[float, ...], track_length: float) -> tuple[float, ...]:
+    """Lap progress (distance into lap) fraction column"""
+    if track_length < 1:
+        return (0.0,) * len(distance_column)
+    return tuple(
+        0.0 if progress < 0 else 1.0 if progress > 1 else progress
+        for progress in (distance / track_length for distance in distance_column)
+    )
+
+
+def find_player_index(indexes: range) -> int:
+    """Find local player index from fleet, -1 if not found"""
+    for index in filter(api.read.vehicle.is_player, indexes):
+        return index
+    return -1
+
+
+def nearest_behind_key(time_gap: float) -> float:
+    """Sort key for nearest time gap behind (negative value closest to 0)"""
+    if time_gap < 0:
+        return time_gap
+    return -MAX_SECONDS * 2
+
+
 def interp_coordinate(
     pos_curr_x: float,
     pos_last_x: float,
@@ -300,12 +374,16 @@ def update_qualify_position(output: VehiclesInfo) -> None:
 
 
 def calc_time_gap_behind(
+    timing_lines: VehicleTimingLines,
     ahead_index: int,
     behind_index: int,
     track_length: float,
     lap_progress_total: float,
 ) -> float:
-    """Calculate interval behind next in class"""
+    """Calculate interval behind next in class
+
+    Use time gap from timing lines if available, otherwise estimated time gap.
+    """
     if ahead_index < 0:
         return 0.0
     opt_lap_progress = calc.lap_progress_distance(api.read.lap.distance(ahead_index), track_length)
@@ -313,7 +391,11 @@ def calc_time_gap_behind(
     lap_diff = opt_lap_progress_total - lap_progress_total
     if lap_diff >= 1 or lap_diff <= -1:  # laps
         return int(abs(lap_diff))
-    # Time gap between driver ahead and behind
+    # Time gap at latest timing line crossed by both drivers
+    time_gap = timing_lines.gap(ahead_index, behind_index)
+    if time_gap >= 0:
+        return time_gap
+    # Estimated time gap between driver ahead and behind
     time_gap = api.read.timing.estimated_time_into(ahead_index) - api.read.timing.estimated_time_into(behind_index)
     # Check lap diff (positive) for position correction
     # in case the ahead driver is momentarily behind (such as during double-file formation lap)
@@ -338,7 +420,7 @@ def calc_gap_behind_leader(index: int) -> float:
     return api.read.timing.behind_leader(index)
 
 
-def update_stint_usage(data: VehicleDataSet, laps_completed: int) -> None:
+def update_stint_usage(data: VehicleDataSet, laps_completed: int, in_pit: int, lap_progress_total: float) -> None:
     """Update stint usage data"""
     (ve_remaining, ve_used, total_laps_done, stint_laps_est, stint_laps_done
      ) = api.read.vehicle.stint_usage(data.driverName)
@@ -351,7 +433,7 @@ def update_stint_usage(data: VehicleDataSet, laps_completed: int) -> None:
         data.currentStintLaps = laps_completed - data.pitTimer.lap_stopped
 
     # Stint energy usage
-    if ve_remaining <= -1.0 or ve_used <= 0 or (data.pitTimer.pitting and not data.inPit):
+    if ve_remaining <= -1.0 or ve_used <= 0 or (data.pitTimer.pitting and not in_pit):
         data.energyRemaining = ve_remaining
     else:  # Apply linear interpolation at 95% of expected lap usage
-        data.energyRemaining = ve_remaining - ve_used * 0.95 * (data.totalLapProgress - total_laps_done)
+        data.energyRemaining = ve_remaining - ve_used * 0.95 * (lap_progress_total - total_laps_done)
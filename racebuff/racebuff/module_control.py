@@ -23,7 +23,6 @@ Module and widget control
 from __future__ import annotations
 
 import logging
-from time import sleep
 from types import MappingProxyType
 from typing import Any, KeysView
 
@@ -60,6 +59,8 @@ class ModuleControl:
     __slots__ = (
         "_imported_modules",
         "_active_modules",
+        "_external_modules",
+        "_closing_modules",
         "type_id",
         "active_modules",
     )
@@ -67,6 +68,8 @@ class ModuleControl:
     def __init__(self, target: Any, type_id: str):
         self._imported_modules = MappingProxyType(create_module_pack(target))
         self._active_modules: dict = {}
+        self._external_modules: tuple[str, ...] = ()
+        self._closing_modules: list = []
         self.type_id = type_id
         self.active_modules: MappingProxyType = MappingProxyType(self._active_modules)
 
@@ -77,12 +80,33 @@ class ModuleControl:
         else:
             self.__start_enabled()
 
-    def close(self, name: str = ""):
-        """Close module, specify name for selected module"""
+    def close(self, name: str = "", wait: bool = True):
+        """Close module, specify name for selected module
+
+        Args:
+            name: module name, leave empty to close all enabled modules.
+            wait: whether to wait modules finish closing,
+                set False to signal all modules to stop concurrently, and call join() later.
+        """
         if name:
             self.__close_selected(name)
         else:
             self.__close_enabled()
+        if wait:
+            self.join()
+
+    def join(self):
+        """Wait closing modules finish"""
+        for _module in self._closing_modules:
+            if not _module.closed:
+                _module.join()
+        self._closing_modules.clear()
+
+    def set_external(self, names: tuple[str, ...]):
+        """Set modules that run externally (such as in telemetry engine process),
+        which are skipped from starting locally.
+        """
+        self._external_modules = names
 
     def reload(self, name: str = ""):
         """Reload module"""
@@ -93,7 +117,7 @@ class ModuleControl:
         """Toggle module"""
         if cfg.user.setting[name]["enable"]:
             cfg.user.setting[name]["enable"] = False
-            self.__close_selected(name)
+            self.close(name)
         else:
             cfg.user.setting[name]["enable"] = True
             self.__start_selected(name)
@@ -122,7 +146,9 @@ class ModuleControl:
 
     def __start_selected(self, name: str):
         """Start selected module"""
-        if cfg.user.setting[name]["enable"] and name not in self._active_modules:
+        if (cfg.user.setting[name]["enable"]
+            and name not in self._active_modules
+            and name not in self._external_modules):
             # Create module instance and add to dict
             self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
             self._active_modules[name].start()
@@ -133,14 +159,11 @@ class ModuleControl:
             self.__close_selected(_name)
 
     def __close_selected(self, name: str):
-        """Close selected module"""
-        if name in self._active_modules:
-            _module = self._active_modules[name]  # get instance
-            self._active_modules.pop(name)  # remove active reference
-            _module.stop()  # close module
-            while not _module.closed:  # wait finish
-                sleep(0.01)
-            _module = None  # remove final reference
+        """Close selected module (non-blocking)"""
+        _module = self._active_modules.pop(name, None)  # remove active reference
+        if _module is not None:
+            _module.stop()  # signal module to close
+            self._closing_modules.append(_module)  # keep reference until finished
 
     @property
     def number_active(self) -> int:
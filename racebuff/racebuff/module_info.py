@@ -22,10 +22,13 @@ Module info
 
 from __future__ import annotations
 
+import threading
 from array import array
-from collections import deque
-from itertools import islice
-from typing import Mapping, NamedTuple
+from itertools import compress, groupby, islice
+from math import hypot
+from operator import attrgetter, ne
+from statistics import fmean, median
+from typing import Mapping, NamedTuple, Sequence
 
 from .calculation import circular_relative_distance, linear_interp
 from .const_common import (
@@ -51,6 +54,7 @@ class ConsumptionDataSet(NamedTuple):
     batteryRegenLast: float = 0.0
     tyreAvgWearLast: float = 0.0
     capacityFuel: float = 0.0
+    stintNumber: int = 0
 
 
 class DeltaLapTime(array):
@@ -225,8 +229,18 @@ class VehiclePitTimer:
         self.lap_stopped = self._last_pit_lap
 
 
-class VehicleDataSet:
-    """Vehicle data set"""
+def new_column(typecode: str, default: float, size: int) -> array:
+    """Create typed vehicle data column"""
+    return array(typecode, (default,)) * size
+
+
+class VehicleColumns:
+    """Vehicle data columns (struct of arrays)
+
+    Each column is indexed by vehicle (player) index.
+    Numeric columns are typed array, bool & string & mixed type
+    (int lap or float time gap) columns are list.
+    """
 
     __slots__ = (
         "isPlayer",
@@ -270,46 +284,631 @@ class VehicleDataSet:
         "lapTimeHistory",
     )
 
+    def __init__(self, size: int = MAX_VEHICLES):
+        self.isPlayer: list[bool] = [False] * size
+        self.elapsedTime: array = new_column("d", 0.0, size)
+        self.positionOverall: array = new_column("q", 0, size)
+        self.positionInClass: array = new_column("q", 0, size)
+        self.qualifyOverall: array = new_column("q", 0, size)
+        self.qualifyInClass: array = new_column("q", 0, size)
+        self.driverName: list[str] = [""] * size
+        self.vehicleName: list[str] = [""] * size
+        self.vehicleClass: list[str] = [""] * size
+        self.classBestLapTime: array = new_column("d", MAX_SECONDS, size)
+        self.bestLapTime: array = new_column("d", MAX_SECONDS, size)
+        self.lastLapTime: array = new_column("d", MAX_SECONDS, size)
+        self.currentLapProgress: array = new_column("d", 0.0, size)
+        self.totalLapProgress: array = new_column("d", 0.0, size)
+        self.gapBehindNext: list[float] = [0.0] * size
+        self.gapBehindNextInClass: list[float] = [0.0] * size
+        self.gapBehindLeader: list[float] = [0.0] * size
+        self.gapBehindLeaderInClass: list[float] = [0.0] * size
+        self.isLapped: array = new_column("d", 0.0, size)
+        self.isYellow: list[bool] = [False] * size
+        self.inPit: array = new_column("q", 0, size)
+        self.isClassFastestLastLap: list[bool] = [False] * size
+        self.numPitStops: list[int] = [0] * size
+        self.pitRequested: list[bool] = [False] * size
+        self.tireCompoundFront: list[str] = [""] * size
+        self.tireCompoundRear: list[str] = [""] * size
+        self.relativeOrientationRadians: array = new_column("d", 0.0, size)
+        self.relativeStraightDistance: array = new_column("d", 0.0, size)
+        self.worldPositionX: array = new_column("d", 0.0, size)
+        self.worldPositionY: array = new_column("d", 0.0, size)
+        self.relativeRotatedPositionX: array = new_column("d", 0.0, size)
+        self.relativeRotatedPositionY: array = new_column("d", 0.0, size)
+        self.vehicleIntegrity: array = new_column("d", 0.0, size)
+        self.energyRemaining: array = new_column("d", 0.0, size)
+        self.estimatedStintLaps: array = new_column("d", 0.0, size)
+        self.currentStintLaps: list[int] = [0] * size
+        self.pitTimer: tuple[VehiclePitTimer, ...] = tuple(VehiclePitTimer() for _ in range(size))
+        self.speedTrap: tuple[VehicleSpeedTrap, ...] = tuple(VehicleSpeedTrap() for _ in range(size))
+        self.lapTimeHistory: tuple[DeltaLapTime, ...] = tuple(DeltaLapTime("d", [0.0] * 7) for _ in range(size))
+
+
+def column_property(name: str) -> property:
+    """Create vehicle data set property that reads & writes column by row index"""
+    def fget(self):
+        return getattr(self._columns, name)[self._index]
+
+    def fset(self, value):
+        getattr(self._columns, name)[self._index] = value
+
+    return property(fget, fset)
+
+
+class VehicleDataSet:
+    """Vehicle data set (row view of vehicle data columns)
+
+    Read & write attributes of single vehicle from VehicleColumns,
+    for backward compatibility with per-vehicle access.
+    """
+
+    __slots__ = (
+        "_columns",
+        "_index",
+    )
+
+    def __init__(self, columns: VehicleColumns, index: int):
+        self._columns = columns
+        self._index = index
+
+
+for _column_name in VehicleColumns.__slots__:
+    setattr(VehicleDataSet, _column_name, column_property(_column_name))
+
+
+class VehicleSpatialIndex:
+    """Vehicle spatial index (uniform grid)
+
+    Index opponents by relative rotated position (player at origin,
+    same coordinates as radar), each grid cell holds vehicle indexes.
+    Queries only check vehicles from cells overlapping query area.
+    Index is rebuilt on first query after vehicle data version changed.
+
+    Args:
+        vehicles: vehicles module output data.
+        cell_size: grid cell size in meters.
+    """
+
+    __slots__ = (
+        "_vehicles",
+        "_cell_size",
+        "_cells",
+        "_bounds",
+        "_version",
+    )
+
+    def __init__(self, vehicles: VehiclesInfo, cell_size: float = 25.0):
+        self._vehicles = vehicles
+        self._cell_size = cell_size
+        self._cells: dict[tuple[float, float], list[int]] = {}
+        self._bounds = (0, 0, -1, -1)  # min cell x, min cell y, max cell x, max cell y
+        self._version = None
+
+    def _sync(self):
+        """Rebuild index if vehicle data version changed"""
+        vehicles = self._vehicles
+        if self._version == vehicles.dataSetVersion:
+            return
+        self._version = vehicles.dataSetVersion
+        columns = vehicles.columns
+        total_vehicles = vehicles.totalVehicles
+        player_index = vehicles.playerIndex
+        cell_size = self._cell_size
+        cells = {}
+        for index, key in enumerate(zip(
+            [pos_x // cell_size for pos_x in columns.relativeRotatedPositionX[:total_vehicles]],
+            [pos_y // cell_size for pos_y in columns.relativeRotatedPositionY[:total_vehicles]],
+        )):
+            # Exclude player, and invalid (nan, inf) position
+            if index == player_index or key[0] != key[0] or key[1] != key[1]:
+                continue
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [index]
+            else:
+                cell.append(index)
+        self._cells = cells
+        if cells:
+            cell_x = tuple(key[0] for key in cells)
+            cell_y = tuple(key[1] for key in cells)
+            self._bounds = (int(min(cell_x)), int(min(cell_y)), int(max(cell_x)), int(max(cell_y)))
+        else:
+            self._bounds = (0, 0, -1, -1)
+
+    def _candidates(self, min_x: float, min_y: float, max_x: float, max_y: float):
+        """Vehicle indexes from cells overlapping rect"""
+        cell_size = self._cell_size
+        bound_x1, bound_y1, bound_x2, bound_y2 = self._bounds
+        cell_x1 = max(int(min_x // cell_size), bound_x1)
+        cell_y1 = max(int(min_y // cell_size), bound_y1)
+        cell_x2 = min(int(max_x // cell_size), bound_x2)
+        cell_y2 = min(int(max_y // cell_size), bound_y2)
+        if cell_x1 > cell_x2 or cell_y1 > cell_y2:
+            return
+        cells = self._cells
+        if (cell_x2 - cell_x1 + 1) * (cell_y2 - cell_y1 + 1) > len(cells):
+            # Fewer occupied cells than covered cells
+            for (cell_x, cell_y), cell in cells.items():
+                if cell_x1 <= cell_x <= cell_x2 and cell_y1 <= cell_y <= cell_y2:
+                    yield from cell
+            return
+        for cell_x in range(cell_x1, cell_x2 + 1):
+            for cell_y in range(cell_y1, cell_y2 + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is not None:
+                    yield from cell
+
+    def within_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[int]:
+        """Vehicle indexes inside rect (exclusive), sorted by index
+
+        -x = left, +x = right, -y = ahead, +y = behind.
+        """
+        self._sync()
+        pos_x = self._vehicles.columns.relativeRotatedPositionX
+        pos_y = self._vehicles.columns.relativeRotatedPositionY
+        return sorted(
+            index for index in self._candidates(min_x, min_y, max_x, max_y)
+            if min_x < pos_x[index] < max_x and min_y < pos_y[index] < max_y
+        )
+
+    def within_radius(self, radius: float, x: float = 0.0, y: float = 0.0) -> list[int]:
+        """Vehicle indexes within radius from coordinates (default player), sorted by index"""
+        self._sync()
+        pos_x = self._vehicles.columns.relativeRotatedPositionX
+        pos_y = self._vehicles.columns.relativeRotatedPositionY
+        return sorted(
+            index for index in self._candidates(x - radius, y - radius, x + radius, y + radius)
+            if hypot(pos_x[index] - x, pos_y[index] - y) <= radius
+        )
+
+    def nearest(self, x: float = 0.0, y: float = 0.0) -> tuple[int, float]:
+        """Nearest vehicle index & distance from coordinates (default player)
+
+        Search grid in expanding rings, until no closer vehicle can exist,
+        or fall back to check all occupied cells if rings cover more cells.
+        Returns (-1, MAX_METERS) if no vehicle.
+        """
+        self._sync()
+        cells = self._cells
+        if not cells:
+            return -1, MAX_METERS
+        cell_size = self._cell_size
+        bound_x1, bound_y1, bound_x2, bound_y2 = self._bounds
+        center_x = int(x // cell_size)
+        center_y = int(y // cell_size)
+        max_ring = max(
+            abs(center_x - bound_x1), abs(center_x - bound_x2),
+            abs(center_y - bound_y1), abs(center_y - bound_y2),
+        )
+        max_visit = len(cells)
+        visited = 0
+        nearest_index = -1
+        nearest_dist = MAX_METERS
+        for ring in range(max_ring + 1):
+            visited += 8 * ring or 1
+            if visited > max_visit:
+                return self._nearest_from(cells.values(), x, y, nearest_index, nearest_dist)
+            nearest_index, nearest_dist = self._nearest_from(
+                filter(None, map(cells.get, ring_cells(center_x, center_y, ring))),
+                x, y, nearest_index, nearest_dist)
+            # Vehicles in next ring are at least (ring * cell size) away
+            if nearest_dist <= ring * cell_size:
+                break
+        return nearest_index, nearest_dist
+
+    def _nearest_from(
+        self, cells, x: float, y: float, nearest_index: int, nearest_dist: float
+    ) -> tuple[int, float]:
+        """Nearest vehicle index & distance from cells"""
+        pos_x = self._vehicles.columns.relativeRotatedPositionX
+        pos_y = self._vehicles.columns.relativeRotatedPositionY
+        for cell in cells:
+            for index in cell:
+                distance = hypot(pos_x[index] - x, pos_y[index] - y)
+                if distance < nearest_dist:
+                    nearest_dist = distance
+                    nearest_index = index
+        return nearest_index, nearest_dist
+
+
+def ring_cells(center_x: int, center_y: int, ring: int):
+    """Grid cell keys on square ring around center cell"""
+    if ring == 0:
+        yield center_x, center_y
+        return
+    top = center_y - ring
+    bottom = center_y + ring
+    for cell_x in range(center_x - ring, center_x + ring + 1):
+        yield cell_x, top
+        yield cell_x, bottom
+    left = center_x - ring
+    right = center_x + ring
+    for cell_y in range(top + 1, bottom):
+        yield left, cell_y
+        yield right, cell_y
+
+
+class VehicleTimingLines:
+    """Vehicle mini-sector timing lines
+
+    Split lap into fixed amount of lap distance lines, and record session time
+    when each vehicle crossed each line, in preallocated ring array
+    (one lap of lines per vehicle). Gap between two vehicles is time difference
+    at latest line crossed by both vehicles.
+
+    Line count: total crossed lines (laps * lines per lap + line index).
+
+    Args:
+        line_count: number of lines per lap.
+        max_vehicles: max number of vehicles.
+        max_interp: max number of crossed lines to interpolate between samples,
+            lines are skipped if exceeded (such as teleport to pit).
+    """
+
+    __slots__ = (
+        "_line_count",
+        "_max_vehicles",
+        "_max_interp",
+        "_times",
+        "_counts",
+        "_last_count",
+        "_last_progress",
+        "_last_time",
+    )
+
+    def __init__(self, line_count: int = 256, max_vehicles: int = MAX_VEHICLES, max_interp: int = 32):
+        self._line_count = line_count
+        self._max_vehicles = max_vehicles
+        self._max_interp = max_interp
+        self._times = array("d", (0.0,)) * (line_count * max_vehicles)
+        self._counts = array("q", (-1,)) * (line_count * max_vehicles)
+        self._last_count = array("q", (-1,)) * max_vehicles
+        self._last_progress = array("d", (-1.0,)) * max_vehicles
+        self._last_time = array("d", (0.0,)) * max_vehicles
+
+    def reset(self):
+        """Reset all vehicles"""
+        self._counts[:] = array("q", (-1,)) * len(self._counts)
+        self._last_count[:] = array("q", (-1,)) * self._max_vehicles
+        self._last_progress[:] = array("d", (-1.0,)) * self._max_vehicles
+
+    def update(self, lap_progress_total: array, total_vehicles: int, session_time: float):
+        """Update timing lines
+
+        Args:
+            lap_progress_total: total lap progress (completed laps + lap progress fraction) column.
+            total_vehicles: total vehicles.
+            session_time: session elapsed time (seconds).
+        """
+        line_count = self._line_count
+        max_interp = self._max_interp
+        times = self._times
+        counts = self._counts
+        last_count = self._last_count
+        last_progress = self._last_progress
+        last_time = self._last_time
+        # Only check vehicles with new data
+        for index in compress(
+            range(min(total_vehicles, self._max_vehicles)),
+            map(ne, lap_progress_total, last_progress),
+        ):
+            progress = lap_progress_total[index]
+            progress_prev = last_progress[index]
+            count = int(progress * line_count)
+            count_prev = last_count[index]
+            if count != count_prev:
+                offset = index * line_count
+                if count_prev >= 0 and count_prev < count <= count_prev + max_interp:
+                    # Interpolate crossing time from last & current sample
+                    time_prev = last_time[index]
+                    time_scale = (session_time - time_prev) / (progress - progress_prev)
+                    for line in range(count_prev + 1, count + 1):
+                        slot = offset + line % line_count
+                        times[slot] = time_prev + (line / line_count - progress_prev) * time_scale
+                        counts[slot] = line
+                elif count < count_prev:  # went backward, invalidate recorded lines
+                    counts[offset:offset + line_count] = array("q", (-1,)) * line_count
+                last_count[index] = count
+            last_progress[index] = progress
+            last_time[index] = session_time
+
+    def gap(self, ahead_index: int, behind_index: int) -> float:
+        """Time gap behind vehicle ahead on same lap, at latest line crossed by both
+
+        Returns:
+            Time gap (seconds), -1 if not available.
+        """
+        if not (0 <= ahead_index < self._max_vehicles and 0 <= behind_index < self._max_vehicles):
+            return -1.0
+        count = self._last_count[behind_index]
+        line_count = self._line_count
+        slot_ahead = ahead_index * line_count + count % line_count
+        slot_behind = behind_index * line_count + count % line_count
+        if count < 0 or self._counts[slot_ahead] != count or self._counts[slot_behind] != count:
+            return -1.0
+        return self._times[slot_behind] - self._times[slot_ahead]
+
+    def interval(self, front_index: int, rear_index: int) -> float:
+        """Time since front vehicle passed latest line crossed by rear vehicle (circular, any lap)
+
+        Returns:
+            Time interval (seconds), -1 if not available.
+        """
+        if not (0 <= front_index < self._max_vehicles and 0 <= rear_index < self._max_vehicles):
+            return -1.0
+        count = self._last_count[rear_index]
+        line_count = self._line_count
+        slot_front = front_index * line_count + count % line_count
+        slot_rear = rear_index * line_count + count % line_count
+        if count < 0 or self._counts[slot_front] < 0 or self._counts[slot_rear] != count:
+            return -1.0
+        time_gap = self._times[slot_rear] - self._times[slot_front]
+        if time_gap < 0:
+            return -1.0
+        return time_gap
+
+
+class LapTrace:
+    """Recorded lap trace
+
+    Attributes:
+        laptime: lap time (seconds).
+        distance: lap distance (meters) column.
+        elapsed: lap elapsed time (seconds) column, same length as distance.
+    """
+
+    __slots__ = (
+        "laptime",
+        "distance",
+        "elapsed",
+    )
+
+    def __init__(self, laptime: float, distance: array, elapsed: array):
+        self.laptime = laptime
+        self.distance = distance
+        self.elapsed = elapsed
+
+    def dataset(self) -> tuple[tuple[float, float], ...]:
+        """Lap trace data set (distance, laptime), same format as delta best data"""
+        return tuple(zip(self.distance, self.elapsed))
+
+
+class LapTraceInfo:
+    """Lap trace module output data
+
+    Record distance to lap time trace of every vehicle at fixed distance step,
+    into preallocated per-vehicle buffer (one lap of samples per vehicle,
+    reused every lap). On lap finish, recorded samples are copied into
+    compact LapTrace, and kept as last & best lap trace by vehicle slot id.
+
+    Lap is discarded if vehicle joined mid-lap, jumped forward more than
+    max_gap steps (such as teleport to pit), or exceeded max samples.
+
+    Args:
+        max_vehicles: max number of vehicles.
+    """
+
+    __slots__ = (
+        "_max_vehicles",
+        "_step",
+        "_max_gap",
+        "_max_samples",
+        "_track_length",
+        "_distances",
+        "_times",
+        "_sizes",
+        "_marks",
+        "_starts",
+        "_slots",
+        "_last",
+        "_best",
+        "version",
+    )
+
+    def __init__(self, max_vehicles: int = MAX_VEHICLES):
+        self._max_vehicles = max_vehicles
+        self._step = 10.0
+        self._max_gap = 0.0
+        self._max_samples = 0
+        self._track_length = 0.0
+        self._distances = array("d")
+        self._times = array("d")
+        self._sizes = array("q", (-1,)) * max_vehicles  # -1 = not recording
+        self._marks = array("d", (0.0,)) * max_vehicles  # next recording distance
+        self._starts = array("d", (0.0,)) * max_vehicles  # lap start time
+        self._slots = array("q", (-1,)) * max_vehicles  # slot id by vehicle index
+        self._last: dict[int, LapTrace] = {}
+        self._best: dict[int, LapTrace] = {}
+        self.version: int = 0
+
+    def reset(self, step: float, max_samples: int, track_length: float, max_gap: int = 32):
+        """Reset all vehicles, and preallocate sample buffer
+
+        Args:
+            step: recording distance step (meters).
+            max_samples: max number of samples per lap.
+            track_length: track length (meters), used as lap end distance.
+            max_gap: max number of steps between samples, lap is discarded if exceeded.
+        """
+        max_vehicles = self._max_vehicles
+        self._step = step
+        self._max_gap = step * max_gap
+        self._max_samples = max_samples
+        self._track_length = track_length
+        if len(self._distances) != max_samples * max_vehicles:
+            self._distances = array("d", (0.0,)) * (max_samples * max_vehicles)
+            self._times = array("d", (0.0,)) * (max_samples * max_vehicles)
+        self._sizes[:] = array("q", (-1,)) * max_vehicles
+        self._slots[:] = array("q", (-1,)) * max_vehicles
+        self._last = {}
+        self._best = {}
+        self.version += 1
+
+    def update(self, total_vehicles: int, slot_ids: Sequence[int], distances: Sequence[float],
+        laptimes: Sequence[float], lap_starts: Sequence[float]):
+        """Update lap traces
+
+        Args:
+            total_vehicles: total vehicles.
+            slot_ids: vehicle slot id column.
+            distances: vehicle lap distance (meters) column.
+            laptimes: vehicle current lap time (seconds) column.
+            lap_starts: vehicle lap start time (seconds) column.
+        """
+        step = self._step
+        max_gap = self._max_gap
+        max_samples = self._max_samples
+        buffer_distances = self._distances
+        buffer_times = self._times
+        sizes = self._sizes
+        marks = self._marks
+        starts = self._starts
+        slots = self._slots
+        for index in range(min(total_vehicles, self._max_vehicles)):
+            lap_start = lap_starts[index]
+            slot_id = slot_ids[index]
+            if slots[index] != slot_id:  # new vehicle at index, wait for next lap
+                slots[index] = slot_id
+                sizes[index] = -1
+                starts[index] = lap_start
+                continue
+            size = sizes[index]
+            if lap_start != starts[index]:  # lap finished, or session restarted
+                if size > 1 and lap_start > starts[index]:
+                    self.__finalize(slot_id, index * max_samples, size, lap_start - starts[index])
+                starts[index] = lap_start
+                sizes[index] = size = 0
+                marks[index] = 0.0
+            if size < 0:
+                continue
+            distance = distances[index]
+            mark = marks[index]
+            if distance < mark:
+                continue
+            if distance - mark > max_gap:
+                if size:  # skip if not synced to lap start position yet
+                    sizes[index] = -1
+            elif size >= max_samples - 1:  # reserve last sample for lap end
+                sizes[index] = -1
+            else:
+                offset = index * max_samples + size
+                buffer_distances[offset] = distance
+                buffer_times[offset] = laptimes[index]
+                sizes[index] = size + 1
+                marks[index] = distance + step
+
+    def __finalize(self, slot_id: int, offset: int, size: int, laptime: float):
+        """Finalize lap trace"""
+        if laptime <= 0:
+            return
+        end = offset + size
+        distance = self._distances[offset:end]
+        elapsed = self._times[offset:end]
+        # Set end value at track length (finish line)
+        if distance[-1] < self._track_length:
+            distance.append(self._track_length)
+        else:
+            distance.append(distance[-1] + self._step)
+        elapsed.append(laptime)
+        trace = LapTrace(laptime, distance, elapsed)
+        # Copy-on-write, read by other modules without lock
+        last_traces = self._last.copy()
+        last_traces[slot_id] = trace
+        self._last = last_traces
+        best = self._best.get(slot_id)
+        if best is None or best.laptime > laptime:
+            best_traces = self._best.copy()
+            best_traces[slot_id] = trace
+            self._best = best_traces
+        self.version += 1
+
+    def last(self, slot_id: int) -> LapTrace | None:
+        """Last lap trace of vehicle slot id"""
+        return self._last.get(slot_id)
+
+    def best(self, slot_id: int) -> LapTrace | None:
+        """Best lap trace of vehicle slot id"""
+        return self._best.get(slot_id)
+
+    def fastest(self, exclude_slot_id: int = -1) -> LapTrace | None:
+        """Fastest best lap trace of all vehicles, excluding vehicle slot id"""
+        return min(
+            (trace for slot_id, trace in self._best.items() if slot_id != exclude_slot_id),
+            key=attrgetter("laptime"),
+            default=None,
+        )
+
+
+class DeltaReferences:
+    """Delta reference lap registry
+
+    Reference laps (distance, laptime) are stored by name in copy-on-write
+    dict, which delta module reads without lock, and resamples only on change.
+    All references are evaluated together by delta module in each update.
+
+    Built-in references (updated by delta module):
+        best: all time personal best lap.
+        last: last lap.
+        session: session best lap.
+        stint: stint best lap.
+        opponent: fastest opponent lap trace (requires lap trace module).
+
+    Attributes:
+        sources: reference lap data set by name.
+        laptimes: reference laptime by name.
+        deltas: smoothed delta (current - reference) by name, published by delta module.
+    """
+
+    __slots__ = (
+        "_lock",
+        "sources",
+        "laptimes",
+        "deltas",
+    )
+
     def __init__(self):
-        self.isPlayer: bool = False
-        self.elapsedTime: float = 0.0
-        self.positionOverall: int = 0
-        self.positionInClass: int = 0
-        self.qualifyOverall: int = 0
-        self.qualifyInClass: int = 0
-        self.driverName: str = ""
-        self.vehicleName: str = ""
-        self.vehicleClass: str = ""
-        self.classBestLapTime: float = MAX_SECONDS
-        self.bestLapTime: float = MAX_SECONDS
-        self.lastLapTime: float = MAX_SECONDS
-        self.currentLapProgress: float = 0.0
-        self.totalLapProgress: float = 0.0
-        self.gapBehindNext: float = 0.0
-        self.gapBehindNextInClass: float = 0.0
-        self.gapBehindLeader: float = 0.0
-        self.gapBehindLeaderInClass: float = 0.0
-        self.isLapped: float = 0.0
-        self.isYellow: bool = False
-        self.inPit: int = 0
-        self.isClassFastestLastLap: bool = False
-        self.numPitStops: int = 0
-        self.pitRequested: bool = False
-        self.tireCompoundFront: str = ""
-        self.tireCompoundRear: str = ""
-        self.relativeOrientationRadians: float = 0.0
-        self.relativeStraightDistance: float = 0.0
-        self.worldPositionX: float = 0.0
-        self.worldPositionY: float = 0.0
-        self.relativeRotatedPositionX: float = 0.0
-        self.relativeRotatedPositionY: float = 0.0
-        self.vehicleIntegrity: float = 0.0
-        self.energyRemaining: float = 0.0
-        self.estimatedStintLaps: float = 0.0
-        self.currentStintLaps: int = 0
-        self.pitTimer: VehiclePitTimer = VehiclePitTimer()
-        self.speedTrap: VehicleSpeedTrap = VehicleSpeedTrap()
-        self.lapTimeHistory: DeltaLapTime = DeltaLapTime("d", [0.0] * 7)
+        self._lock = threading.Lock()
+        self.sources: dict[str, tuple[tuple[float, float], ...]] = {}
+        self.laptimes: dict[str, float] = {}
+        self.deltas: dict[str, float] = {}
+
+    def register(self, name: str, dataset: tuple[tuple[float, float], ...], laptime: float = MAX_SECONDS):
+        """Register or replace reference lap
+
+        Args:
+            name: reference name.
+            dataset: reference lap data set (distance, laptime), ordered by distance.
+            laptime: reference laptime.
+        """
+        with self._lock:
+            sources = self.sources.copy()
+            laptimes = self.laptimes.copy()
+            sources[name] = dataset
+            laptimes[name] = laptime
+            self.sources = sources
+            self.laptimes = laptimes
+
+    def unregister(self, name: str):
+        """Unregister reference lap"""
+        with self._lock:
+            if name not in self.sources:
+                return
+            sources = self.sources.copy()
+            laptimes = self.laptimes.copy()
+            del sources[name]
+            del laptimes[name]
+            self.sources = sources
+            self.laptimes = laptimes
+
+    def delta(self, name: str, default: float = 0.0) -> float:
+        """Get smoothed delta against reference"""
+        return self.deltas.get(name, default)
+
+    def laptime(self, name: str) -> float:
+        """Get reference laptime"""
+        return self.laptimes.get(name, MAX_SECONDS)
 
 
 class DeltaInfo:
@@ -317,6 +916,7 @@ class DeltaInfo:
 
     __slots__ = (
         "deltaBestData",
+        "references",
         "deltaBest",
         "deltaLast",
         "deltaSession",
@@ -334,6 +934,7 @@ class DeltaInfo:
 
     def __init__(self):
         self.deltaBestData: tuple[tuple[float, float], ...] = DELTA_DEFAULT
+        self.references: DeltaReferences = DeltaReferences()
         self.deltaBest: float = 0.0
         self.deltaLast: float = 0.0
         self.deltaSession: float = 0.0
@@ -427,6 +1028,155 @@ class FuelInfo:
         self.oneLessPitConsumption: float = 0.0
 
 
+class ConsumptionHistory:
+    """Consumption history data (struct of arrays)
+
+    Each ConsumptionDataSet field is stored in typed array column,
+    in chronological order (oldest first), without size limit.
+    Index access & iteration are in newest first order,
+    and return ConsumptionDataSet.
+
+    Attributes:
+        columns: typed array column by field index.
+        saved: number of oldest rows already saved to file.
+    """
+
+    __slots__ = (
+        "columns",
+        "saved",
+    )
+    FIELDS = ConsumptionDataSet._fields
+    TYPECODES = tuple(
+        "q" if isinstance(value, int) else "d"
+        for value in ConsumptionDataSet._field_defaults.values()
+    )
+
+    def __init__(self, columns: Sequence[array] | None = None):
+        if columns is None:
+            columns = tuple(array(typecode) for typecode in self.TYPECODES)
+        self.columns: tuple[array, ...] = tuple(columns)
+        self.saved: int = 0
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    def __getitem__(self, index: int) -> ConsumptionDataSet:
+        columns = self.columns
+        size = len(columns[0])
+        if not -size <= index < size:
+            raise IndexError("consumption history index out of range")
+        row = size - 1 - index if index >= 0 else -1 - index
+        return ConsumptionDataSet(*(column[row] for column in columns))
+
+    def __iter__(self):
+        columns = self.columns
+        for row in range(len(columns[0]) - 1, -1, -1):
+            yield ConsumptionDataSet(*(column[row] for column in columns))
+
+    def latest(self) -> ConsumptionDataSet:
+        """Latest data set, or default if no data"""
+        if self.columns[0]:
+            return self[0]
+        return ConsumptionDataSet()
+
+    def append(self, data_set: ConsumptionDataSet):
+        """Append new data set
+
+        First column is updated last, as its length is used as total rows
+        for reading from other thread.
+        """
+        for column, value in zip(reversed(self.columns), reversed(data_set)):
+            column.append(value)
+
+    def clear(self):
+        """Clear all data"""
+        self.columns = tuple(array(typecode) for typecode in self.TYPECODES)
+        self.saved = 0
+
+    def replace(self, other: ConsumptionHistory):
+        """Replace all data with (take over) other consumption history columns"""
+        self.columns = other.columns
+        self.saved = other.saved
+
+    def column(self, name: str) -> array:
+        """Get data column by field name (chronological order)"""
+        return self.columns[self.FIELDS.index(name)]
+
+    def stint_ranges(self) -> list[tuple[int, int, int]]:
+        """Stint row ranges, newest stint first
+
+        Returns:
+            List of (stint number, start row, end row).
+        """
+        ranges = []
+        start = 0
+        stints = self.column("stintNumber")
+        for stint_number, rows in groupby(stints[:len(self)]):
+            end = start + sum(1 for _ in rows)
+            ranges.append((stint_number, start, end))
+            start = end
+        ranges.reverse()
+        return ranges
+
+    def median_by_stint(self, name: str = "lastLapUsedFuel", valid_only: bool = True) -> list[tuple[int, int, float]]:
+        """Median value per lap by stint, newest stint first
+
+        Args:
+            name: field name.
+            valid_only: only count valid lap with positive value.
+
+        Returns:
+            List of (stint number, number of counted laps, median value), skip stint without counted laps.
+        """
+        values = self.column(name)
+        valid = self.column("isValidLap")
+        output = []
+        for stint_number, start, end in self.stint_ranges():
+            if valid_only:
+                samples = [value for value in compress(values[start:end], valid[start:end]) if value > 0]
+            else:
+                samples = values[start:end]
+            if samples:
+                output.append((stint_number, len(samples), median(samples)))
+        return output
+
+    def median_latest_stint(self, name: str = "lastLapUsedFuel") -> float:
+        """Median value per valid lap from latest stint with valid laps, 0 if not available"""
+        for _, _, value in self.median_by_stint(name):
+            return value
+        return 0.0
+
+    def wear_rate(self, max_laps: int = 0) -> float:
+        """Average tyre tread wear per valid lap from latest stint, 0 if not available
+
+        Args:
+            max_laps: only count most recent laps of stint, 0 for all laps.
+        """
+        wear = self.column("tyreAvgWearLast")
+        valid = self.column("isValidLap")
+        for _, start, end in self.stint_ranges():
+            samples = [value for value in compress(wear[start:end], valid[start:end]) if value > 0]
+            if samples:
+                return fmean(samples[-max_laps:] if max_laps > 0 else samples)
+        return 0.0
+
+    def stint_summary(self) -> list[tuple[int, int, float, float, float, float]]:
+        """Stint total, newest stint first
+
+        Returns:
+            List of (stint number, laps, lap time, used fuel, used energy, tyre wear).
+        """
+        laptime = self.column("lapTimeLast")
+        fuel = self.column("lastLapUsedFuel")
+        energy = self.column("lastLapUsedEnergy")
+        wear = self.column("tyreAvgWearLast")
+        return [
+            (stint_number, end - start, sum(laptime[start:end]), sum(fuel[start:end]),
+             sum(energy[start:end]), sum(wear[start:end]))
+            for stint_number, start, end in self.stint_ranges()
+        ]
+
+
 class HistoryInfo:
     """History output data"""
 
@@ -439,14 +1189,13 @@ class HistoryInfo:
     def __init__(self):
         self.consumptionDataName: str = ""
         self.consumptionDataVersion: int = 0
-        self.consumptionDataSet: deque[ConsumptionDataSet] = deque([ConsumptionDataSet()], 100)
+        self.consumptionDataSet: ConsumptionHistory = ConsumptionHistory()
 
     def reset_consumption(self):
         """Reset consumption data"""
         self.consumptionDataName = ""
         self.consumptionDataVersion = 0
         self.consumptionDataSet.clear()
-        self.consumptionDataSet.appendleft(ConsumptionDataSet())
 
 
 class HybridInfo:
@@ -589,6 +1338,9 @@ class VehiclesInfo:
     """Vehicles module output data"""
 
     __slots__ = (
+        "columns",
+        "spatialIndex",
+        "timingLines",
         "dataSet",
         "dataSetVersion",
         "leaderIndex",
@@ -607,8 +1359,11 @@ class VehiclesInfo:
     )
 
     def __init__(self):
+        self.columns: VehicleColumns = VehicleColumns(MAX_VEHICLES)
+        self.spatialIndex: VehicleSpatialIndex = VehicleSpatialIndex(self)
+        self.timingLines: VehicleTimingLines = VehicleTimingLines()
         self.dataSet: tuple[VehicleDataSet, ...] = tuple(
-            VehicleDataSet() for _ in range(MAX_VEHICLES)
+            VehicleDataSet(self.columns, index) for index in range(MAX_VEHICLES)
         )
         self.dataSetVersion: int = -1
         self.leaderIndex: int = 0
@@ -685,6 +1440,7 @@ class ModuleInfo:
         "fuel",
         "history",
         "hybrid",
+        "laptrace",
         "mapping",
         "pacenotes",
         "relative",
@@ -702,6 +1458,7 @@ class ModuleInfo:
         self.fuel = FuelInfo()
         self.history = HistoryInfo()
         self.hybrid = HybridInfo()
+        self.laptrace = LapTraceInfo()
         self.mapping = MappingInfo()
         self.pacenotes = NotesInfo()
         self.relative = RelativeInfo()
@@ -22,14 +22,16 @@ Overlay Control
 
 import logging
 import threading
-from time import sleep
+from time import monotonic
 
-from . import app_signal, overlay_signal, realtime_state
+from . import app_signal, idle_state, overlay_signal, realtime_state
 from .api_control import api
 from .setting import cfg
 
 logger = logging.getLogger(__name__)
 
+DEEP_IDLE_DELAY = 10  # seconds of inactive state before entering deep idle
+
 
 class OverlayToggle:
     """Overlay state toggle"""
@@ -68,6 +70,7 @@ class OverlayControl:
         "toggle",
         "_stopped",
         "_event",
+        "_thread",
         "_last_active_state",
         "_last_hide_state",
     )
@@ -76,6 +79,7 @@ class OverlayControl:
         self.toggle = OverlayToggle()
         self._stopped = True
         self._event = threading.Event()
+        self._thread = None
 
         self._last_active_state = None
         self._last_hide_state = None
@@ -85,22 +89,40 @@ class OverlayControl:
         if self._stopped:
             self._stopped = False
             self._event.clear()
-            threading.Thread(target=self.__updating, daemon=True).start()
+            self._thread = threading.Thread(target=self.__updating, name="Overlay-Control", daemon=True)
+            self._thread.start()
             logger.info("ENABLED: overlay control")
 
     def disable(self):
         """Disable overlay control"""
         self._event.set()
-        while not self._stopped:
-            sleep(0.01)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
     def __updating(self):
         """Update global state"""
         _event_wait = self._event.wait
-        while not _event_wait(0.2):
+        update_interval = 0.2
+        enable_deep_idle = cfg.application["enable_deep_idle_mode"]
+        last_active_time = monotonic()
+
+        while not _event_wait(update_interval):
             # Read state
             active = api.read.state.active()
             paused = api.read.state.paused()
+            # Deep idle state check
+            if not paused or active:
+                last_active_time = monotonic()
+                if idle_state.parked:
+                    idle_state.unpark()
+                    update_interval = 0.2
+                    logger.info("DEEP IDLE: OFF")
+            elif (enable_deep_idle and not idle_state.parked
+                  and monotonic() - last_active_time > DEEP_IDLE_DELAY):
+                idle_state.park()
+                update_interval = idle_state.watch_interval
+                logger.info("DEEP IDLE: ON")
             hidden = cfg.overlay["auto_hide"] and not active
             # Update state
             realtime_state.active = active
@@ -119,6 +141,8 @@ class OverlayControl:
                 # Set overlay timer state
                 overlay_signal.paused.emit(not active)
 
+        # Wake parked threads, watcher is no longer running
+        idle_state.unpark()
         self._stopped = True
         logger.info("DISABLED: overlay control")
 
@@ -0,0 +1,151 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Sampling profiler control
+
+Take periodic snapshots of all thread stacks (sys._current_frames),
+count samples by thread name & stack, and save as collapsed stack
+and speedscope files on stop.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from time import monotonic, strftime
+from types import CodeType
+
+from .const_file import LogFile
+from .setting import cfg
+from .userfile.profiler import save_profile_collapsed, save_profile_speedscope
+
+logger = logging.getLogger(__name__)
+
+THREAD_NAME_GUI = "GUI"
+THREAD_NAME_REFRESH = 1.0  # seconds between thread name refresh
+MAX_STACK_DEPTH = 128
+
+
+def thread_names() -> dict[int, str]:
+    """Get thread name by thread ident"""
+    main_ident = threading.main_thread().ident
+    return {
+        _thread.ident: THREAD_NAME_GUI if _thread.ident == main_ident else _thread.name
+        for _thread in threading.enumerate()
+    }
+
+
+class ProfilerControl:
+    """Sampling profiler control"""
+
+    __slots__ = (
+        "_stopped",
+        "_event",
+        "_thread",
+    )
+
+    def __init__(self):
+        self._stopped = True
+        self._event = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Whether profiler is running"""
+        return not self._stopped
+
+    def toggle(self):
+        """Toggle sampling profiler"""
+        if self._stopped:
+            self.enable()
+        else:
+            self.disable()
+
+    def enable(self):
+        """Enable sampling profiler"""
+        if self._stopped:
+            self._stopped = False
+            self._event.clear()
+            self._thread = threading.Thread(target=self.__sampling, name="Profiler", daemon=True)
+            self._thread.start()
+            logger.info("ENABLED: sampling profiler")
+
+    def disable(self):
+        """Disable sampling profiler, and save profile"""
+        self._event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __sampling(self):
+        """Sample thread stacks"""
+        _event_wait = self._event.wait
+        _current_frames = sys._current_frames
+        interval = max(cfg.application["profiler_sampling_interval"], 1)
+        update_interval = interval / 1000
+        own_ident = threading.get_ident()
+
+        samples: dict[tuple[str, tuple[CodeType, ...]], int] = {}
+        names = thread_names()
+        time_start = last_refresh = monotonic()
+        total_samples = 0
+
+        while not _event_wait(update_interval):
+            time_now = monotonic()
+            if time_now - last_refresh > THREAD_NAME_REFRESH:
+                last_refresh = time_now
+                names = thread_names()
+            for ident, frame in _current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                stack.reverse()
+                thread_name = names.get(ident)
+                if thread_name is None:  # new thread
+                    names = thread_names()
+                    thread_name = names.setdefault(ident, f"Thread-{ident}")
+                key = (thread_name, tuple(stack))
+                samples[key] = samples.get(key, 0) + 1
+            total_samples += 1
+
+        duration = monotonic() - time_start
+        logger.info(
+            "PROFILER: %s samples in %.1fs (interval: %sms)",
+            total_samples, duration, interval)
+        if samples:
+            self.__save(samples, interval)
+        self._stopped = True
+        logger.info("DISABLED: sampling profiler")
+
+    @staticmethod
+    def __save(samples: dict[tuple[str, tuple[CodeType, ...]], int], interval: float):
+        """Save profile files"""
+        filename = f"{LogFile.PROFILE}-{strftime('%Y%m%d-%H%M%S')}"
+        try:
+            save_profile_collapsed(cfg.path.config, filename, samples)
+            save_profile_speedscope(cfg.path.config, filename, samples, interval)
+        except (OSError, TypeError, ValueError):
+            logger.error("PROFILER: failed to save %s", filename)
+
+
+pctrl = ProfilerControl()
@@ -183,7 +183,7 @@ ABBR_PATTERN = (
 CHOICE_COMMON = MappingProxyType({
     CFG_API_NAME: tuple(API_MAP_ALIAS),
     CFG_CHARACTER_ENCODING: ("UTF-8", "ISO-8859-1"),
-    CFG_DELTABEST_SOURCE: ("Best", "Session", "Stint", "Last"),
+    CFG_DELTABEST_SOURCE: ("Best", "Session", "Stint", "Last", "Opponent"),
     CFG_FONT_WEIGHT: ("normal", "bold"),
     CFG_TARGET_LAPTIME: ("Theoretical", "Personal"),
     CFG_TEXT_ALIGNMENT: ("Left", "Center", "Right"),
@@ -26,9 +26,10 @@ import logging
 import os
 import threading
 from collections import ChainMap
-from time import sleep
+from time import monotonic
 from types import MappingProxyType
 from typing import Any
+from zlib import crc32
 
 from .const_api import API_MAP_CONFIG
 from .const_app import APP_NAME
@@ -50,10 +51,14 @@ from .template.setting_widget import WIDGET_DEFAULT
 from .userfile import set_global_config_path, set_user_data_path
 from .userfile.json_setting import (
     copy_setting,
+    dumps_json,
     load_setting_json_file,
     load_style_json_file,
-    save_and_verify_json_file,
+    save_json_file_atomic,
+    write_json_file_atomic,
 )
+from .userfile.preset_cache import load_user_preset_cached, preset_cache_key, save_preset_cache
+from .userfile.sharded_preset import ShardedPreset, load_sharded_preset
 from .validator import is_allowed_filename
 
 logger = logging.getLogger(__name__)
@@ -171,8 +176,12 @@ class Setting:
     """APP setting"""
 
     __slots__ = (
-        "_save_delay",
+        "_save_condition",
+        "_save_deadline",
         "_save_queue",
+        "_save_checksum",
+        "_sharded",
+        "_preset_cache_key",
         "_setting_to_load",
         "is_saving",
         "version_update",
@@ -184,8 +193,12 @@ class Setting:
 
     def __init__(self):
         # States
-        self._save_delay = 0
+        self._save_condition = threading.Condition()
+        self._save_deadline = 0.0
         self._save_queue = {}
+        self._save_checksum: dict[str, int] = {}
+        self._sharded: dict[str, ShardedPreset] = {}
+        self._preset_cache_key = None
         self._setting_to_load = ""
         self.is_saving = False
         self.version_update = 0
@@ -287,22 +300,29 @@ class Setting:
         if new_settings_path != old_settings_path:
             self.set_next_to_load(f"{self.preset_files()[0]}{FileExt.JSON}")
 
-    def load_user(self):
-        """Load user settings, should be called after loaded global setting"""
+    def load_user(self) -> bool:
+        """Load user settings, should be called after loaded global setting
+
+        Returns:
+            True if user preset loaded from validated cache (unchanged, no need to save).
+        """
         # Load preset JSON file
         if self._setting_to_load != "":
             filename_setting_temp = self._setting_to_load
             self._setting_to_load = ""
         else:
             filename_setting_temp = self.filename.setting
-        self.user.setting = load_setting_json_file(
+        if self._preset_cache_key is None:
+            self._preset_cache_key = preset_cache_key(self.default.setting)
+        self.user.setting, is_cached = load_user_preset_cached(
             filename=filename_setting_temp,
             filepath=self.path.settings,
             dict_def=self.default.setting,
+            cache_key=self._preset_cache_key,
         )
         self.filename.setting = filename_setting_temp
         # Load style JSON file
-        self.user.brakes = load_style_json_file(
+        self.user.brakes = self._sharded[ConfigType.BRAKES] = load_sharded_preset(
             filename=self.filename.brakes,
             filepath=self.path.settings,
             dict_def=self.default.brakes,
@@ -319,7 +339,7 @@ class Setting:
             dict_def=self.default.classes,
             validator=StyleValidator.classes,
         )
-        self.user.compounds = load_style_json_file(
+        self.user.compounds = self._sharded[ConfigType.COMPOUNDS] = load_sharded_preset(
             filename=self.filename.compounds,
             filepath=self.path.settings,
             dict_def=self.default.compounds,
@@ -331,12 +351,13 @@ class Setting:
             dict_def=self.default.heatmap,
             validator=StyleValidator.heatmap,
         )
-        self.user.tracks = load_style_json_file(
+        self.user.tracks = self._sharded[ConfigType.TRACKS] = load_sharded_preset(
             filename=self.filename.tracks,
             filepath=self.path.settings,
             dict_def=self.default.tracks,
             validator=StyleValidator.tracks,
         )
+        return is_cached
 
     @property
     def api_name(self) -> str:
@@ -396,7 +417,7 @@ class Setting:
 
     def create(self, filename: str):
         """Create default setting"""
-        save_and_verify_json_file(
+        save_json_file_atomic(
             dict_user=copy_setting(self.default.setting),
             filename=filename,
             filepath=self.path.settings,
@@ -407,72 +428,90 @@ class Setting:
         """Save trigger, limit to one save operation for a given period.
 
         Args:
-            count:
-                Set time delay(count) that can be refreshed before starting saving thread.
+            delay:
+                Set time delay(1/100 sec) that can be refreshed before saving.
                 Default is roughly one sec delay, use 0 for instant saving.
             cfg_type:
                 Set saving config type.
             next_task:
-                Skip adding save task, run next save task in queue.
+                Skip adding save task, only update delay of save tasks in queue.
         """
-        if not next_task:
-            filename = getattr(self.filename, cfg_type, None)
-            # Check if valid file name
-            if filename is None:
-                logger.error("USERDATA: invalid config type %s, abort saving", cfg_type)
-            # Check if file is locked
-            elif filename in self.user.filelock:
-                logger.info("USERDATA: %s is locked, changes not saved", filename)
-            # Add to save queue
-            elif filename not in self._save_queue:
-                # Save to global config path
-                if cfg_type in (
-                    ConfigType.CONFIG,
-                    ConfigType.FILELOCK,
-                    ConfigType.SHORTCUTS,
-                ):
-                    filepath = self.path.config
-                # Save to settings (preset) path
-                else:
-                    filepath = self.path.settings
-                dict_user = getattr(self.user, cfg_type)
-                self._save_queue[filename] = (filepath, dict_user)
-
-        for queue_filename, queue_filedata in self._save_queue.items():
-            break  # get next file in queue
-        else:
+        if next_task:
+            with self._save_condition:
+                self._save_deadline = monotonic() + delay / 100
+                self._save_condition.notify()
             return
-
-        self._save_delay = delay
-
-        if not self.is_saving:
-            self.is_saving = True
-            threading.Thread(
-                target=self.__saving,
-                args=(queue_filename, *queue_filedata),
-            ).start()
-
-    def __saving(self, filename: str, filepath: str, dict_user: dict):
-        """Saving thread"""
-        # Update save delay
-        while self._save_delay > 0:
-            self._save_delay -= 1
-            sleep(0.01)
-
-        save_and_verify_json_file(
-            dict_user=dict_user,
-            filename=filename,
-            filepath=filepath,
-            max_attempts=self.max_saving_attempts,
-        )
-
-        self._save_queue.pop(filename, None)
-        self.is_saving = False
-        self.version_update += 1
-
-        # Run next save task in save queue if any
-        if self._save_queue:
-            self.save(0, next_task=True)
+        filename = getattr(self.filename, cfg_type, None)
+        # Check if valid file name
+        if filename is None:
+            logger.error("USERDATA: invalid config type %s, abort saving", cfg_type)
+            return
+        # Check if file is locked
+        if filename in self.user.filelock:
+            logger.info("USERDATA: %s is locked, changes not saved", filename)
+            return
+        # Save to global config path
+        if cfg_type in (
+            ConfigType.CONFIG,
+            ConfigType.FILELOCK,
+            ConfigType.SHORTCUTS,
+        ):
+            filepath = self.path.config
+        # Save to settings (preset) path
+        else:
+            filepath = self.path.settings
+        dict_user = getattr(self.user, cfg_type)
+        # Sync replaced style preset (from editor) to sharded preset
+        sharded = self._sharded.get(cfg_type)
+        if sharded is not None and dict_user is not sharded:
+            sharded.replace(dict_user)
+            setattr(self.user, cfg_type, sharded)
+            dict_user = sharded
+
+        with self._save_condition:
+            self._save_queue[filename] = (filepath, dict_user, cfg_type)
+            self._save_deadline = monotonic() + delay / 100
+            self._save_condition.notify()
+            if not self.is_saving:
+                self.is_saving = True
+                threading.Thread(target=self.__saving, name="Setting-Save").start()
+
+    def __saving(self):
+        """Saving thread, wait until save deadline, then save all files in queue"""
+        condition = self._save_condition
+        while True:
+            with condition:
+                # Wait until deadline, which can be refreshed by new save task
+                while True:
+                    time_left = self._save_deadline - monotonic()
+                    if time_left <= 0:
+                        break
+                    condition.wait(time_left)
+                # Get next file in queue
+                if not self._save_queue:
+                    self.is_saving = False
+                    return
+                filename = next(iter(self._save_queue))
+                filepath, dict_user, cfg_type = self._save_queue.pop(filename)
+
+            # Save changed entries only
+            if isinstance(dict_user, ShardedPreset):
+                dict_user.save()
+                self.version_update += 1
+                continue
+            # Skip saving if content unchanged since last saving
+            filename_full = f"{filepath}{filename}"
+            dict_user = copy_setting(dict_user)  # snapshot for saving & caching
+            data = dumps_json(dict_user)
+            checksum = crc32(data)
+            if self._save_checksum.get(filename_full) == checksum and os.path.exists(filename_full):
+                logger.info("USERDATA: %s unchanged, skip saving", filename)
+            elif write_json_file_atomic(data, filename, filepath, self.max_saving_attempts):
+                self._save_checksum[filename_full] = checksum
+                # Update validated preset cache
+                if cfg_type == ConfigType.SETTING and self._preset_cache_key is not None:
+                    save_preset_cache(filename, filepath, self._preset_cache_key, dict_user, checksum)
+            self.version_update += 1
 
     @property
     def max_saving_attempts(self) -> int:
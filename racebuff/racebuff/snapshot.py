@@ -0,0 +1,582 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module info snapshot
+
+Fixed binary layout for publishing module info (minfo) snapshots
+across processes via shared memory ring buffer.
+
+Memory layout:
+    header: latest sequence number, host input.
+    slots: ring buffer slots, each slot = begin sequence, payload, end sequence.
+
+Writer fills next slot and updates sequence numbers last,
+reader verifies begin & end sequence to discard torn (partially written) slot.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import chain
+from multiprocessing import shared_memory
+from struct import Struct, calcsize, pack_into, unpack_from
+from typing import Any, Callable
+
+from .const_common import MAX_VEHICLES
+
+SNAPSHOT_SLOTS = 3
+SEQUENCE = Struct("<Q")
+# Host input: speed trap position, player index override state, player index
+HOST_INPUT = Struct("<d?i")
+
+# Snapshot field spec: (attribute name, struct format)
+# Format with count (such as "4d") is packed from sequence attribute,
+# format "s" (such as "32s") is packed from utf-8 encoded string.
+ENGINE_FIELDS = (
+    ("force", (
+        ("lgtGForceRaw", "d"),
+        ("latGForceRaw", "d"),
+        ("maxAvgLatGForce", "d"),
+        ("maxLgtGForce", "d"),
+        ("maxLatGForce", "d"),
+        ("downForceFront", "d"),
+        ("downForceRear", "d"),
+        ("downForceRatio", "d"),
+        ("brakingRate", "d"),
+        ("transientMaxBrakingRate", "d"),
+        ("maxBrakingRate", "d"),
+        ("deltaBrakingRate", "d"),
+    )),
+    ("hybrid", (
+        ("batteryCharge", "d"),
+        ("batteryDrain", "d"),
+        ("batteryRegen", "d"),
+        ("batteryDrainLast", "d"),
+        ("batteryRegenLast", "d"),
+        ("batteryNetChange", "d"),
+        ("motorActiveTimer", "d"),
+        ("motorInactiveTimer", "d"),
+        ("motorState", "i"),
+        ("fuelEnergyRatio", "d"),
+        ("fuelEnergyBias", "d"),
+    )),
+    ("vehicles", (
+        ("dataSetVersion", "q"),
+        ("leaderIndex", "i"),
+        ("playerIndex", "i"),
+        ("totalOutPits", "i"),
+        ("totalInPits", "i"),
+        ("totalStoppedPits", "i"),
+        ("totalPitRequests", "i"),
+        ("totalCompletedLaps", "i"),
+        ("totalVehicles", "i"),
+        ("nearestLine", "d"),
+        ("nearestTraffic", "d"),
+        ("nearestYellowAhead", "d"),
+        ("nearestYellowBehind", "d"),
+        ("leaderBestLapTime", "d"),
+    )),
+)
+# Vehicle column spec: (column name, struct format)
+# Format "d" & "q" is copied from typed array column as raw bytes,
+# format "g" is time gap (float) or laps (int) packed with type flag,
+# nested attribute name (such as "pitTimer.elapsed") is packed per row.
+VEHICLE_COLUMNS = (
+    ("isPlayer", "?"),
+    ("elapsedTime", "d"),
+    ("positionOverall", "q"),
+    ("positionInClass", "q"),
+    ("qualifyOverall", "q"),
+    ("qualifyInClass", "q"),
+    ("driverName", "64s"),
+    ("vehicleName", "64s"),
+    ("vehicleClass", "64s"),
+    ("classBestLapTime", "d"),
+    ("bestLapTime", "d"),
+    ("lastLapTime", "d"),
+    ("currentLapProgress", "d"),
+    ("totalLapProgress", "d"),
+    ("gapBehindNext", "g"),
+    ("gapBehindNextInClass", "g"),
+    ("gapBehindLeader", "g"),
+    ("gapBehindLeaderInClass", "g"),
+    ("isLapped", "d"),
+    ("isYellow", "?"),
+    ("inPit", "q"),
+    ("isClassFastestLastLap", "?"),
+    ("numPitStops", "i"),
+    ("pitRequested", "?"),
+    ("tireCompoundFront", "96s"),
+    ("tireCompoundRear", "96s"),
+    ("relativeOrientationRadians", "d"),
+    ("relativeStraightDistance", "d"),
+    ("worldPositionX", "d"),
+    ("worldPositionY", "d"),
+    ("relativeRotatedPositionX", "d"),
+    ("relativeRotatedPositionY", "d"),
+    ("vehicleIntegrity", "d"),
+    ("energyRemaining", "d"),
+    ("estimatedStintLaps", "d"),
+    ("currentStintLaps", "i"),
+    ("pitTimer.elapsed", "d"),
+    ("pitTimer.stopped", "d"),
+    ("pitTimer.pitting", "?"),
+    ("pitTimer.lap_stopped", "i"),
+    ("speedTrap.speed", "d"),
+    ("lapTimeHistory", "7d"),
+)
+# Relative table spec: (attribute name, row struct format, max rows, row type)
+# Row type None = single value per row.
+RELATIVE_TABLES = (
+    ("relative", "di", MAX_VEHICLES, tuple),
+    ("standings", "i", MAX_VEHICLES * 2, None),
+    ("classes", "ii64sdiii?", MAX_VEHICLES, list),
+    ("drawOrder", "i", MAX_VEHICLES, None),
+)
+DECODED_STRINGS: dict[bytes, str] = {}
+
+
+def decode_string(raw: bytes) -> str:
+    """Decode null-padded utf-8 bytes to string (cached)"""
+    text = DECODED_STRINGS.get(raw)
+    if text is None:
+        if len(DECODED_STRINGS) > 1024:
+            DECODED_STRINGS.clear()
+        text = DECODED_STRINGS[raw] = raw.rstrip(b"\0").decode("utf-8", errors="ignore")
+    return text
+
+
+def _field_setter(name: str) -> Callable[[Any, Any], None]:
+    """Create field setter, supports nested attribute name"""
+    *parents, attr = name.split(".")
+
+    def setter(obj: Any, value: Any):
+        for parent in parents:
+            obj = getattr(obj, parent)
+        setattr(obj, attr, value)
+
+    return setter
+
+
+def _field_getter(name: str) -> Callable[[Any], Any]:
+    """Create field getter, supports nested attribute name"""
+    names = name.split(".")
+
+    def getter(obj: Any):
+        for attr in names:
+            obj = getattr(obj, attr)
+        return obj
+
+    return getter
+
+
+class ObjectLayout:
+    """Fixed binary layout for object attributes"""
+
+    __slots__ = (
+        "_struct",
+        "_fields",
+        "_values",
+        "_strings",
+        "_nested",
+        "_sequences",
+        "size",
+    )
+
+    def __init__(self, fields: tuple[tuple[str, str], ...]):
+        self._struct = Struct("<" + "".join(fmt for _, fmt in fields))
+        self._fields = tuple(
+            (_field_getter(name), fmt[-1], int(fmt[:-1] or 1))
+            for name, fmt in fields
+        )
+        self.size = self._struct.size
+        # Pre-sort fields by type for unpacking, (value index, ...)
+        values, strings, nested, sequences = [], [], [], []
+        index = 0
+        for name, fmt in fields:
+            count = int(fmt[:-1] or 1)
+            if fmt[-1] == "s":
+                strings.append((index, name))
+                index += 1
+            elif count > 1:
+                sequences.append((index, index + count, _field_getter(name)))
+                index += count
+            elif "." in name:
+                nested.append((index, _field_setter(name)))
+                index += 1
+            else:
+                values.append((index, name))
+                index += 1
+        self._values = tuple(values)
+        self._strings = tuple(strings)
+        self._nested = tuple(nested)
+        self._sequences = tuple(sequences)
+
+    def pack_into(self, buffer, offset: int, obj: Any):
+        """Pack object attributes into buffer"""
+        values = []
+        for getter, code, count in self._fields:
+            value = getter(obj)
+            if code == "s":
+                values.append(value.encode("utf-8"))  # truncated by struct
+            elif count > 1:
+                values.extend(value[:count])
+            else:
+                values.append(value)
+        self._struct.pack_into(buffer, offset, *values)
+
+    def unpack_from(self, buffer, offset: int, obj: Any):
+        """Unpack buffer into object attributes"""
+        values = self._struct.unpack_from(buffer, offset)
+        for index, name in self._values:
+            setattr(obj, name, values[index])
+        for index, name in self._strings:
+            setattr(obj, name, decode_string(values[index]))
+        for index, setter in self._nested:
+            setter(obj, values[index])
+        for index, index_end, getter in self._sequences:
+            target = getter(obj)
+            if isinstance(target, array):
+                target[:] = array(target.typecode, values[index:index_end])
+            else:
+                target[:] = values[index:index_end]
+
+
+class TableLayout:
+    """Fixed binary layout for variable length list (up to max rows)"""
+
+    __slots__ = (
+        "_row",
+        "_max_rows",
+        "_row_type",
+        "_has_string",
+        "size",
+    )
+
+    def __init__(self, row_fmt: str, max_rows: int, row_type: type | None):
+        self._row = Struct("<" + row_fmt)
+        self._max_rows = max_rows
+        self._row_type = row_type
+        self._has_string = "s" in row_fmt
+        self.size = SEQUENCE.size + self._row.size * max_rows
+
+    def pack_into(self, buffer, offset: int, rows: list):
+        """Pack rows into buffer"""
+        total = min(len(rows), self._max_rows)
+        SEQUENCE.pack_into(buffer, offset, total)
+        offset += SEQUENCE.size
+        row_pack = self._row.pack_into
+        row_size = self._row.size
+        if self._row_type is None:
+            for row in rows[:total]:
+                row_pack(buffer, offset, row)
+                offset += row_size
+        elif self._has_string:
+            for row in rows[:total]:
+                row_pack(buffer, offset, *(
+                    value.encode("utf-8") if isinstance(value, str) else value
+                    for value in row
+                ))
+                offset += row_size
+        else:
+            for row in rows[:total]:
+                row_pack(buffer, offset, *row)
+                offset += row_size
+
+    def unpack_from(self, buffer, offset: int) -> list:
+        """Unpack buffer into rows"""
+        total = SEQUENCE.unpack_from(buffer, offset)[0]
+        offset += SEQUENCE.size
+        rows = [
+            row for row in self._row.iter_unpack(
+                buffer[offset:offset + self._row.size * total]
+            )
+        ]
+        row_type = self._row_type
+        if row_type is None:
+            return [row[0] for row in rows]
+        if self._has_string:
+            return [
+                row_type(decode_string(value) if isinstance(value, bytes) else value for value in row)
+                for row in rows
+            ]
+        if row_type is tuple:
+            return rows
+        return [row_type(row) for row in rows]
+
+
+class ColumnLayout:
+    """Fixed binary layout for vehicle data columns
+
+    Each column is stored in continuous block of max rows, typed array
+    column is copied as raw bytes, other columns are packed up to total rows.
+    """
+
+    __slots__ = (
+        "_arrays",
+        "_values",
+        "_strings",
+        "_gaps",
+        "_nested",
+        "_sequences",
+        "_max_rows",
+        "size",
+    )
+
+    def __init__(self, columns: tuple[tuple[str, str], ...], max_rows: int):
+        arrays, values, strings, gaps, nested, sequences = [], [], [], [], [], []
+        offset = 0
+        for name, fmt in columns:
+            code = fmt[-1]
+            count = int(fmt[:-1] or 1)
+            if "." in name:
+                parent, attr = name.split(".")
+                nested.append((parent, attr, code, offset))
+                size = calcsize(f"<{code}")
+            elif code == "s":
+                strings.append((name, Struct(f"<{fmt}"), offset))
+                size = count
+            elif code == "g":
+                gaps.append((name, offset))
+                size = calcsize("<d?")
+            elif count > 1:
+                sequences.append((name, code, count, offset))
+                size = calcsize(f"<{fmt}")
+            elif code in "dq":
+                arrays.append((name, offset))
+                size = calcsize(f"<{code}")
+            else:
+                values.append((name, code, offset))
+                size = calcsize(f"<{code}")
+            offset += size * max_rows
+        self._arrays = tuple(arrays)
+        self._values = tuple(values)
+        self._strings = tuple(strings)
+        self._gaps = tuple(gaps)
+        self._nested = tuple(nested)
+        self._sequences = tuple(sequences)
+        self._max_rows = max_rows
+        self.size = offset
+
+    def pack_into(self, buffer, offset: int, columns: Any, total: int):
+        """Pack columns (up to total rows) into buffer"""
+        total = min(total, self._max_rows)
+        max_rows = self._max_rows
+        for name, column_offset in self._arrays:
+            raw = memoryview(getattr(columns, name)).cast("B")
+            start = offset + column_offset
+            buffer[start:start + len(raw)] = raw
+        for name, code, column_offset in self._values:
+            pack_into(f"<{total}{code}", buffer, offset + column_offset, *getattr(columns, name)[:total])
+        for name, row, column_offset in self._strings:
+            size = row.size
+            start = offset + column_offset
+            buffer[start:start + size * total] = b"".join(
+                row.pack(value.encode("utf-8")) for value in getattr(columns, name)[:total]
+            )
+        for name, column_offset in self._gaps:
+            column = getattr(columns, name)[:total]
+            start = offset + column_offset
+            pack_into(f"<{total}d", buffer, start, *column)
+            pack_into(f"<{total}?", buffer, start + 8 * max_rows, *(isinstance(value, int) for value in column))
+        for parent, attr, code, column_offset in self._nested:
+            pack_into(f"<{total}{code}", buffer, offset + column_offset, *(
+                getattr(row, attr) for row in getattr(columns, parent)[:total]
+            ))
+        for name, code, count, column_offset in self._sequences:
+            pack_into(f"<{total * count}{code}", buffer, offset + column_offset, *chain.from_iterable(
+                row[:count] for row in getattr(columns, name)[:total]
+            ))
+
+    def unpack_from(self, buffer, offset: int, columns: Any, total: int):
+        """Unpack buffer (up to total rows) into columns"""
+        total = min(total, self._max_rows)
+        max_rows = self._max_rows
+        for name, column_offset in self._arrays:
+            raw = memoryview(getattr(columns, name)).cast("B")
+            start = offset + column_offset
+            raw[:] = buffer[start:start + len(raw)]
+        for name, code, column_offset in self._values:
+            getattr(columns, name)[:total] = unpack_from(f"<{total}{code}", buffer, offset + column_offset)
+        for name, row, column_offset in self._strings:
+            start = offset + column_offset
+            getattr(columns, name)[:total] = [
+                decode_string(raw) for raw, in row.iter_unpack(buffer[start:start + row.size * total])
+            ]
+        for name, column_offset in self._gaps:
+            start = offset + column_offset
+            getattr(columns, name)[:total] = [
+                int(value) if is_lap else value
+                for value, is_lap in zip(
+                    unpack_from(f"<{total}d", buffer, start),
+                    unpack_from(f"<{total}?", buffer, start + 8 * max_rows),
+                )
+            ]
+        for parent, attr, code, column_offset in self._nested:
+            for row, value in zip(
+                getattr(columns, parent),
+                unpack_from(f"<{total}{code}", buffer, offset + column_offset),
+            ):
+                setattr(row, attr, value)
+        for name, code, count, column_offset in self._sequences:
+            values = unpack_from(f"<{total * count}{code}", buffer, offset + column_offset)
+            for index, row in enumerate(getattr(columns, name)[:total]):
+                row[:] = array(code, values[index * count:index * count + count])
+
+
+class SnapshotLayout:
+    """Module info snapshot layout
+
+    Args:
+        section_fields: module info section fields spec.
+    """
+
+    __slots__ = (
+        "_sections",
+        "_vehicle",
+        "_vehicle_offset",
+        "_tables",
+        "size",
+    )
+
+    def __init__(self, section_fields: tuple):
+        offset = 0
+        sections = []
+        for section_name, fields in section_fields:
+            layout = ObjectLayout(fields)
+            sections.append((section_name, layout, offset))
+            offset += layout.size
+        self._sections = tuple(sections)
+
+        self._vehicle = ColumnLayout(VEHICLE_COLUMNS, MAX_VEHICLES)
+        self._vehicle_offset = offset
+        offset += self._vehicle.size
+
+        tables = []
+        for table_name, row_fmt, max_rows, row_type in RELATIVE_TABLES:
+            layout = TableLayout(row_fmt, max_rows, row_type)
+            tables.append((table_name, layout, offset))
+            offset += layout.size
+        self._tables = tuple(tables)
+        self.size = offset
+
+    def pack_into(self, buffer, offset: int, info: Any):
+        """Pack module info into buffer"""
+        for section_name, layout, section_offset in self._sections:
+            layout.pack_into(buffer, offset + section_offset, getattr(info, section_name))
+
+        vehicles = info.vehicles
+        self._vehicle.pack_into(buffer, offset + self._vehicle_offset, vehicles.columns, vehicles.totalVehicles)
+
+        relative = info.relative
+        for table_name, layout, section_offset in self._tables:
+            layout.pack_into(buffer, offset + section_offset, getattr(relative, table_name))
+
+    def unpack_from(self, buffer, offset: int, info: Any):
+        """Unpack buffer into module info"""
+        for section_name, layout, section_offset in self._sections:
+            layout.unpack_from(buffer, offset + section_offset, getattr(info, section_name))
+
+        # Vehicle columns are unpacked up to total vehicles (updated from section first)
+        vehicles = info.vehicles
+        self._vehicle.unpack_from(buffer, offset + self._vehicle_offset, vehicles.columns, vehicles.totalVehicles)
+
+        relative = info.relative
+        for table_name, layout, section_offset in self._tables:
+            setattr(relative, table_name, layout.unpack_from(buffer, offset + section_offset))
+
+
+class SnapshotBuffer:
+    """Shared memory ring buffer for module info snapshot
+
+    Args:
+        name: shared memory name, leave empty to create new shared memory.
+    """
+
+    __slots__ = (
+        "_shm",
+        "_owner",
+        "_layout",
+        "_slot_size",
+        "_payload_offset",
+        "sequence",
+    )
+
+    def __init__(self, name: str = ""):
+        self._layout = SnapshotLayout(ENGINE_FIELDS)
+        self._payload_offset = SEQUENCE.size + HOST_INPUT.size
+        self._slot_size = SEQUENCE.size * 2 + self._layout.size
+        total_size = self._payload_offset + self._slot_size * SNAPSHOT_SLOTS
+        self._owner = not name
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=total_size)
+            self._shm.buf[:total_size] = bytes(total_size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self.sequence = 0
+
+    @property
+    def name(self) -> str:
+        """Shared memory name"""
+        return self._shm.name
+
+    def close(self):
+        """Close shared memory, and release if owner"""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def publish(self, info: Any):
+        """Publish (engine side) module info snapshot to next slot"""
+        buffer = self._shm.buf
+        sequence = self.sequence + 1
+        offset = self._payload_offset + self._slot_size * (sequence % SNAPSHOT_SLOTS)
+        SEQUENCE.pack_into(buffer, offset, sequence)
+        self._layout.pack_into(buffer, offset + SEQUENCE.size, info)
+        SEQUENCE.pack_into(buffer, offset + self._slot_size - SEQUENCE.size, sequence)
+        SEQUENCE.pack_into(buffer, 0, sequence)
+        self.sequence = sequence
+
+    def receive(self, info: Any) -> bool:
+        """Receive (host side) latest module info snapshot
+
+        Returns:
+            True if new snapshot received.
+        """
+        buffer = self._shm.buf
+        sequence = SEQUENCE.unpack_from(buffer, 0)[0]
+        if sequence == self.sequence:
+            return False
+        offset = self._payload_offset + self._slot_size * (sequence % SNAPSHOT_SLOTS)
+        payload = bytes(buffer[offset:offset + self._slot_size])
+        if (SEQUENCE.unpack_from(payload, 0)[0] != sequence
+            or SEQUENCE.unpack_from(payload, self._slot_size - SEQUENCE.size)[0] != sequence):
+            return False  # torn slot, overwritten while copying
+        self._layout.unpack_from(payload, SEQUENCE.size, info)
+        self.sequence = sequence
+        return True
+
+    def send_input(self, speedtrap_position: float, override_player: bool, player_index: int):
+        """Send (host side) input to engine"""
+        HOST_INPUT.pack_into(
+            self._shm.buf, SEQUENCE.size, speedtrap_position, override_player, player_index)
+
+    def receive_input(self) -> tuple[float, bool, int]:
+        """Receive (engine side) input from host"""
+        return HOST_INPUT.unpack_from(self._shm.buf, SEQUENCE.size)
@@ -35,12 +35,21 @@ GLOBAL_DEFAULT = {
         "enable_high_dpi_scaling": True,
         "enable_auto_load_preset": False,
         "enable_global_hotkey": False,
+        "enable_telemetry_engine_process": False,
+        "enable_deep_idle_mode": True,
+        "enable_cpu_usage_governor": False,
+        "enable_user_database": False,
         "show_confirmation_for_batch_toggle": True,
         'snap_distance': 10,
         "snap_gap": 0,
         "grid_move_size": 8,
         "minimum_update_interval": 10,
         "maximum_saving_attempts": 10,
+        "maximum_update_interval": 1000,
+        "maximum_interval_scale": 4,
+        "cpu_usage_target": 10,
+        "cpu_usage_sampling_interval": 1000,
+        "profiler_sampling_interval": 5,
         "position_x": 0,
         "position_y": 0,
         "window_width": 0,
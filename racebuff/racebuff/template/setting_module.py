@@ -60,6 +60,13 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "minimum_delta_distance": 5,
     },
+    "module_laptrace": {
+        "enable": False,
+        "update_interval": 20,
+        "idle_update_interval": 400,
+        "trace_distance_step": 10,
+        "maximum_trace_samples": 4000,
+    },
     "module_mapping": {
         "enable": True,
         "update_interval": 10,
@@ -60,6 +60,9 @@ SHORTCUTS_DEFAULT = {
     "pace_notes_playback": {
         "bind": "",
     },
+    "sampling_profiler": {
+        "bind": "",
+    },
     "restart_application": {
         "bind": "",
     },
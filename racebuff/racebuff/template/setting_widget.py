@@ -2236,6 +2236,7 @@ WIDGET_DEFAULT = {
         "bar_gap": 1,
         "stint_history_count": 2,
         "show_empty_history": False,
+        "show_recorded_stint_history": False,
         "show_virtual_energy_if_available": True,
         "minimum_stint_threshold_minutes": 10,
         "font_color_laps": "#222222",
@@ -2494,6 +2495,7 @@ WIDGET_DEFAULT = {
         "proximity_circle_radius": 150,
         "proximity_circle_width": 3,
         "proximity_circle_color": "#88888888",
+        "proximity_circle_color_nearby": "#88FFAA00",
         "show_vehicle_standings": True,
         "enable_multi_class_styling": True,
         "show_custom_player_color_in_multi_class": False,
@@ -45,7 +45,9 @@ from ..units import liter_to_gallon, meter_to_kilometer, meter_to_mile
 from ..userfile.driver_stats import (
     DriverStats,
     load_stats_json_file,
-    save_stats_json_file,
+    merge_stats_journal,
+    read_stats_journal,
+    replace_driver_stats,
     validate_stats_file,
 )
 from ._common import (
@@ -113,6 +115,8 @@ class DriverStatsViewer(BaseEditor):
         self.resize(UIScaler.size(80), UIScaler.size(50))
 
         self.stats_temp = {}
+        self.stats_journal = {}  # unmerged journal entries by track name
+        self.journal_offset = 0  # journal offset of loaded entries
         self.selected_stats_key = ""  # get active session key
         self.selected_stats_dict = {}
 
@@ -180,6 +184,12 @@ class DriverStatsViewer(BaseEditor):
             return
 
         self.stats_temp = validate_stats_file(stats_user)
+        # Group journal entries by track name, merge on selection
+        self.stats_journal = {}
+        journal, self.journal_offset = read_stats_journal(cfg.path.config)
+        for entry in journal:
+            self.stats_journal.setdefault(entry[0], []).append(entry)
+            self.stats_temp.setdefault(entry[0], {})
 
         if self.selected_stats_key:
             last_selected_stats_key = self.selected_stats_key
@@ -229,11 +239,33 @@ class DriverStatsViewer(BaseEditor):
         """Select stats key"""
         self.selected_stats_key = self.stats_list.currentText()
         if self.selected_stats_key:
+            self.merge_journal(self.selected_stats_key)
             self.selected_stats_dict = self.stats_temp[self.selected_stats_key]
             self.refresh_table()
         else:
             self.table_stats.setRowCount(0)  # clear table if no track data found
 
+    def merge_journal(self, track_name: str | None = None):
+        """Merge journal entries of track, or all tracks if not specified"""
+        if track_name is None:
+            for journal in self.stats_journal.values():
+                merge_stats_journal(self.stats_temp, journal)
+            self.stats_journal.clear()
+        else:
+            journal = self.stats_journal.pop(track_name, None)
+            if journal:
+                merge_stats_journal(self.stats_temp, journal)
+
+    def save_stats(self):
+        """Save edited stats, and clear merged journal"""
+        self.merge_journal()
+        replace_driver_stats(
+            stats_user=self.stats_temp,
+            filepath=cfg.path.config,
+            journal_offset=self.journal_offset,
+        )
+        self.journal_offset = 0
+
     def delete_stats_key(self):
         """Delete stats key"""
         if not self.selected_stats_key:
@@ -247,10 +279,7 @@ class DriverStatsViewer(BaseEditor):
         )
         if self.confirm_operation(message=msg_text):
             self.stats_temp.pop(self.selected_stats_key, None)  # remove from dict
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            self.save_stats()
             self.reload_stats()
 
     def remove_vehicle(self):
@@ -272,10 +301,7 @@ class DriverStatsViewer(BaseEditor):
         )
         if self.confirm_operation(message=msg_text):
             track_stats.pop(selected_vehicle, None)  # remove from dict
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            self.save_stats()
             self.reload_stats()
 
     def reset_stat(self, row: int, column: int):
@@ -293,10 +319,7 @@ class DriverStatsViewer(BaseEditor):
         if self.confirm_operation(message=msg_text):
             default_value = DriverStats.__dict__[selected_column]
             self.stats_temp[self.selected_stats_key][selected_vehicle][selected_column] = default_value
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            self.save_stats()
             self.reload_stats()
 
     def open_context_menu(self, position: QPoint):
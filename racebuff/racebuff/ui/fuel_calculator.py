@@ -23,7 +23,6 @@ Fuel calculator
 from __future__ import annotations
 
 import os
-from collections import deque
 from math import ceil, floor
 
 from PySide2.QtCore import Qt
@@ -49,10 +48,10 @@ from PySide2.QtWidgets import (
 
 from .. import calculation as calc
 from ..api_control import api
-from ..const_file import FileFilter
+from ..const_file import FileExt, FileFilter
 from ..formatter import laptime_string_to_seconds
 from ..locale_i18n import tr
-from ..module_info import ConsumptionDataSet, minfo
+from ..module_info import ConsumptionHistory, minfo
 from ..setting import cfg
 from ..units import set_symbol_fuel, set_unit_fuel
 from ..userfile.consumption_history import load_consumption_history_file
@@ -245,16 +244,23 @@ class FuelCalculator(BaseDialog):
         filename_full = QFileDialog.getOpenFileName(
             self,
             dir=cfg.path.fuel_delta,
-            filter=";;".join((FileFilter.CONSUMPTION, FileFilter.CSV))
+            filter=";;".join((FileFilter.CONSUMPTION_BIN, FileFilter.CONSUMPTION, FileFilter.CSV))
         )[0]
         if not filename_full:
             return
 
         filepath = os.path.dirname(filename_full) + "/"
-        filename = os.path.splitext(os.path.basename(filename_full))[0]
+        filename = os.path.basename(filename_full)
+        for extension in (f"{FileExt.CONSUMPTION}{FileExt.BIN}", FileExt.CONSUMPTION):
+            if filename.endswith(extension):
+                filename = filename[:-len(extension)]
+                break
+        else:
+            filename = os.path.splitext(filename)[0]
         history_data = load_consumption_history_file(
             filepath=filepath,
             filename=filename,
+            use_database=False,
         )
         self.refresh_table(history_data)
         self.fill_in_data(history_data)
@@ -266,9 +272,9 @@ class FuelCalculator(BaseDialog):
         self.fill_in_data(minfo.history.consumptionDataSet)
         self.status_bar.showMessage(f"Live Source: {api.read.session.combo_name()}")
 
-    def fill_in_data(self, dataset: deque[ConsumptionDataSet]):
+    def fill_in_data(self, dataset: ConsumptionHistory):
         """Fill in history data to edit"""
-        latest_history = dataset[0]
+        latest_history = dataset.latest()
         # Load laptime from last valid lap
         laptime = latest_history.lapTimeLast
         if laptime > 0 and latest_history.isValidLap:
@@ -279,16 +285,18 @@ class FuelCalculator(BaseDialog):
         capacity = max(api.read.vehicle.tank_capacity(), latest_history.capacityFuel)
         if capacity:
             self.input_fuel.capacity.setValue(self.unit_fuel(capacity))
-        # Load consumption from last valid lap
-        if latest_history.isValidLap:
-            fuel_used = latest_history.lastLapUsedFuel
+        # Load median consumption & average tyre wear from valid laps of latest stint
+        fuel_used = dataset.median_latest_stint("lastLapUsedFuel")
+        if fuel_used:
             self.input_fuel.fuel_used.setValue(self.unit_fuel(fuel_used))
-            energy_used = latest_history.lastLapUsedEnergy
+        energy_used = dataset.median_latest_stint("lastLapUsedEnergy")
+        if energy_used:
             self.input_fuel.energy_used.setValue(energy_used)
-            tyre_wear = latest_history.tyreAvgWearLast
+        tyre_wear = dataset.wear_rate()
+        if tyre_wear:
             self.input_tyre.wear_lap.setValue(tyre_wear)
 
-    def refresh_table(self, dataset: deque[ConsumptionDataSet]):
+    def refresh_table(self, dataset: ConsumptionHistory):
         """Refresh history data table"""
         self.table_history.setRowCount(0)
         invalid_color = QColor("#F40")
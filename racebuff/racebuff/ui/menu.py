@@ -28,13 +28,15 @@ from PySide2.QtWidgets import QMenu, QMessageBox
 from .. import loader
 from ..api_control import api
 from ..const_app import PLATFORM, URL_FAQ, URL_USER_GUIDE
-from ..const_file import ConfigType
+from ..const_file import ConfigType, FileExt
 from ..formatter import format_option_name
 from ..locale_i18n import tr
 from ..module_info import minfo
 from ..overlay_control import octrl
+from ..profiler_control import pctrl
 from ..setting import cfg
 from ..update import update_checker
+from ..userfile.user_database import udb
 from .about import About
 from .brake_editor import BrakeEditor
 from .config import FontConfig, UserConfig
@@ -86,6 +88,11 @@ class OverlayMenu(QMenu):
         reload_preset.triggered.connect(parent.reload_preset)
         self.addSeparator()
 
+        # Sampling profiler
+        self.sampling_profiler = self.addAction(tr("Sampling Profiler"))
+        self.sampling_profiler.setCheckable(True)
+        self.sampling_profiler.triggered.connect(self.toggle_profiler)
+
         # Reset submenu
         menu_reset_data = ResetDataMenu(tr("Reset Data"), parent)
         self.addMenu(menu_reset_data)
@@ -110,6 +117,7 @@ class OverlayMenu(QMenu):
         self.overlay_hide.setChecked(cfg.overlay["auto_hide"])
         self.overlay_grid.setChecked(cfg.overlay["enable_grid_move"])
         self.overlay_vr.setChecked(cfg.overlay["vr_compatibility"])
+        self.sampling_profiler.setChecked(pctrl.running)
 
     def refresh_preset_name(self):
         """Refresh preset name"""
@@ -138,6 +146,11 @@ class OverlayMenu(QMenu):
         """Check VR compatibility state"""
         octrl.toggle.vr()
 
+    @staticmethod
+    def toggle_profiler():
+        """Toggle sampling profiler state"""
+        pctrl.toggle()
+
 
 class ResetDataMenu(QMenu):
     """Reset user data menu"""
@@ -229,9 +242,14 @@ class ResetDataMenu(QMenu):
                 tr("Cannot reset data while on track."),
             )
             return False
-        # Check if file exist
+        # Check if file exist (legacy & binary)
         filename_full = f"{filepath}{filename}.{extension}"
-        if not os.path.exists(filename_full):
+        filename_list = [
+            _filename for _filename in (filename_full, f"{filename_full}{FileExt.BIN}")
+            if os.path.exists(_filename)
+        ]
+        in_database = udb.contains(filename, f".{extension}")
+        if not filename_list and not in_database:
             QMessageBox.warning(
                 self._parent,
                 tr("Error"),
@@ -251,7 +269,10 @@ class ResetDataMenu(QMenu):
         if delete_msg != QMessageBox.Yes:
             return False
         # Delete file
-        os.remove(filename_full)
+        for _filename in filename_list:
+            os.remove(_filename)
+        if in_database:
+            udb.delete(filename, f".{extension}")
         QMessageBox.information(
             self._parent,
             tr("Reset {data_type}").format(data_type=data_type.title()),
@@ -41,7 +41,7 @@ from PySide2.QtWidgets import (
 from .. import regex_pattern as rxp
 from ..formatter import format_option_name
 from ..locale_i18n import tr
-from ..setting import cfg, load_setting_json_file, save_and_verify_json_file
+from ..setting import cfg, load_setting_json_file, save_json_file_atomic
 from ._common import (
     BaseEditor,
     CompactButton,
@@ -186,7 +186,7 @@ class PresetTransfer(BaseEditor):
         # Copy setting
         self.copy_setting(dest_dict, setting_selection, options_selection)
         # Save setting
-        save_and_verify_json_file(
+        save_json_file_atomic(
             dict_user=dest_dict,
             filename=dest_preset_name,
             filepath=cfg.path.settings,
@@ -46,6 +46,7 @@ from ..const_file import ConfigType, FileExt
 from ..formatter import strip_filename_extension
 from ..locale_i18n import tr
 from ..setting import cfg
+from ..userfile.preset_cache import delete_preset_cache
 from ..validator import is_allowed_filename
 from ._common import QVAL_FILENAME, BaseDialog, UIScaler
 from .preset_transfer import PresetTransfer
@@ -231,6 +232,7 @@ class PresetList(QWidget):
             if self.confirm_operation(title=tr("Delete Preset"), message=msg_text):
                 if os.path.exists(f"{cfg.path.settings}{selected_filename}"):
                     os.remove(f"{cfg.path.settings}{selected_filename}")
+                delete_preset_cache(selected_filename, cfg.path.settings)
                 self.refresh()
 
     def confirm_operation(self, title: str = "Confirm", message: str = "") -> bool:
@@ -310,6 +312,7 @@ class CreatePreset(BaseDialog):
                 f"{filepath}{source_filename}",
                 f"{filepath}{entered_filename}{FileExt.JSON}"
             )
+            delete_preset_cache(source_filename, filepath)
             # Reload if renamed file was loaded
             if cfg.is_loaded(source_filename):
                 cfg.set_next_to_load(f"{entered_filename}{FileExt.JSON}")
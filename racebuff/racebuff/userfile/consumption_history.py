@@ -18,50 +18,192 @@
 
 """
 Consumption history file function
+
+Consumption history is saved in binary format (*.consumption.bin) with header,
+followed by fixed size rows of float64 values (one per field), in chronological order.
+New rows are appended to existing file, without rewriting old rows.
 """
 
 from __future__ import annotations
 
 import csv
+import io
 import logging
+import os
+import sys
+from array import array
+from struct import Struct
 
 from ..const_file import FileExt
-from ..module_info import ConsumptionDataSet
+from ..module_info import ConsumptionDataSet, ConsumptionHistory
 from ..validator import dict_value_type, invalid_save_name
+from .user_database import save_userdata, save_userdata_file, udb
+from .write_queue import unpack_header, wqueue
+
+CONSUMPTION_MAGIC = b"RBCH"
+CONSUMPTION_VERSION = 1
+CONSUMPTION_HEADER = Struct("<4sHH")  # magic, version, number of fields
 
 logger = logging.getLogger(__name__)
 
 
+def pack_consumption_rows(history: ConsumptionHistory, start: int = 0, header: bool = True) -> bytes:
+    """Pack consumption history rows (from start row) to binary data"""
+    total_fields = len(ConsumptionHistory.FIELDS)
+    total_rows = len(history) - start
+    values = array("d", bytes(8 * total_fields * max(total_rows, 0)))
+    if total_rows > 0:
+        for index, column in enumerate(history.columns):
+            values[index::total_fields] = array("d", column[start:start + total_rows])
+    if sys.byteorder == "big":
+        values.byteswap()
+    if header:
+        return CONSUMPTION_HEADER.pack(CONSUMPTION_MAGIC, CONSUMPTION_VERSION, total_fields) + values.tobytes()
+    return values.tobytes()
+
+
+def unpack_consumption_binary(data: bytes) -> ConsumptionHistory:
+    """Unpack binary data to consumption history, incomplete last row is ignored"""
+    magic, version, total_fields = unpack_header(CONSUMPTION_HEADER, data, "consumption history")
+    if magic != CONSUMPTION_MAGIC or version != CONSUMPTION_VERSION or total_fields < 1:
+        raise ValueError("invalid consumption history data")
+    row_size = 8 * total_fields
+    body = memoryview(data)[CONSUMPTION_HEADER.size:]
+    values = array("d")
+    values.frombytes(body[:len(body) // row_size * row_size])
+    if sys.byteorder == "big":
+        values.byteswap()
+    total_rows = len(values) // total_fields
+    columns = []
+    for index, (typecode, default) in enumerate(zip(
+        ConsumptionHistory.TYPECODES, ConsumptionDataSet._field_defaults.values())):
+        if index >= total_fields:  # field not exist in older data
+            columns.append(array(typecode, (default,)) * total_rows)
+        elif typecode == "d":
+            columns.append(values[index::total_fields])
+        else:
+            columns.append(array(typecode, map(int, values[index::total_fields])))
+    return ConsumptionHistory(columns)
+
+
+def parse_consumption_csv(csvfile) -> ConsumptionHistory:
+    """Parse legacy consumption history CSV (newest first), skip empty lap
+
+    Stint number is set from lap number continuity.
+    """
+    data_reader = csv.DictReader(csvfile, restval="", restkey="unknown")
+    default_data = ConsumptionDataSet._field_defaults
+    history = ConsumptionHistory()
+    stint_number = 0
+    last_lap_number = -2
+    for data in reversed(tuple(data_reader)):
+        data_set = ConsumptionDataSet(**dict_value_type(data, default_data))
+        if data_set.lapTimeLast <= 0:
+            continue
+        if data_set.lapNumber != last_lap_number + 1:
+            stint_number += 1
+        last_lap_number = data_set.lapNumber
+        history.append(data_set._replace(stintNumber=stint_number))
+    return history
+
+
 def load_consumption_history_file(
-    filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
-) -> tuple[ConsumptionDataSet, ...]:
-    """Load fuel/energy consumption history file (*.consumption)"""
+    filepath: str, filename: str, extension: str = FileExt.CONSUMPTION,
+    use_database: bool = True, migrate: bool = True,
+) -> ConsumptionHistory:
+    """Load fuel/energy consumption history (*.consumption.bin)
+
+    Load from user database if enabled, otherwise from binary file,
+    or migrate from legacy CSV file if binary file not exist or invalid.
+    Set use_database to False to always load from file.
+    Set migrate to False to load without saving binary file (read only).
+    """
     try:
+        if use_database and udb.enabled:
+            data = udb.load(filename, extension)
+            if data is None:
+                raise FileNotFoundError
+            if data.startswith(CONSUMPTION_MAGIC):
+                return unpack_consumption_binary(data)
+            return parse_consumption_csv(io.StringIO(data.decode("utf-8"), newline=""))
+        filename_binary = f"{filepath}{filename}{extension}{FileExt.BIN}"
+        try:
+            with open(filename_binary, "rb") as binfile:
+                history = unpack_consumption_binary(binfile.read())
+            history.saved = len(history)
+            return history
+        except (FileNotFoundError, ValueError):
+            pass  # not exist or corrupted, fall back to legacy file & migrate again
         with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.DictReader(csvfile, restval="", restkey="unknown")
-            default_data = ConsumptionDataSet._field_defaults
-            dataset = tuple(
-                ConsumptionDataSet(**dict_value_type(data, default_data))
-                for data in data_reader
-            )
-            if not dataset:
-                raise ValueError
-        return dataset
+            history = parse_consumption_csv(csvfile)
+        if migrate and history and not invalid_save_name(filename):
+            wqueue.submit(
+                filename_binary, save_userdata_file, filename_binary,
+                pack_consumption_rows(history), f"{filename}{extension}{FileExt.BIN}")
+            history.saved = len(history)
+            logger.info("USERDATA: %s%s%s migrated", filename, extension, FileExt.BIN)
+        return history
     except FileNotFoundError:
         logger.info("MISSING: consumption history (%s) data", extension)
-    except (IndexError, KeyError, ValueError, TypeError):
+    except (IndexError, KeyError, ValueError, TypeError, OSError):
         logger.info("MISSING: invalid consumption history (%s) data", extension)
-    return (ConsumptionDataSet(),)
+    return ConsumptionHistory()
+
+
+def read_consumption_record(filepath: str, filename: str, extension: str) -> bytes:
+    """Read consumption history file as binary data (for database import)"""
+    history = load_consumption_history_file(
+        filepath, filename, extension, use_database=False, migrate=False)
+    if not history:
+        raise ValueError("no consumption history")
+    return pack_consumption_rows(history)
+
+
+def export_consumption_record(data: bytes) -> bytes:
+    """Convert consumption history record to binary data (for database export)"""
+    if data.startswith(CONSUMPTION_MAGIC):
+        return data
+    return pack_consumption_rows(parse_consumption_csv(io.StringIO(data.decode("utf-8"), newline="")))
+
+
+def append_consumption_file(filename_full: str, data: bytes, name: str) -> None:
+    """Append rows to consumption history file (run in write queue)"""
+    with open(filename_full, "ab") as binfile:
+        binfile.write(data)
+    logger.info("USERDATA: %s saved (appended)", name)
 
 
 def save_consumption_history_file(
-    dataset: tuple, filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
+    history: ConsumptionHistory, filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
 ) -> None:
-    """Save fuel/energy consumption history file (*.consumption)"""
-    if len(dataset) < 2 or invalid_save_name(filename):
+    """Save fuel/energy consumption history (*.consumption.bin)
+
+    Append new rows only if existing file matches saved rows, otherwise save all rows.
+    """
+    total_rows = len(history)
+    if total_rows < 1 or invalid_save_name(filename):
+        return
+    if udb.enabled:
+        save_userdata(filepath, filename, extension, pack_consumption_rows(history))
+        history.saved = total_rows
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-        data_writer.writerow(ConsumptionDataSet._fields)  # write field name as column header
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    filename_binary = f"{filepath}{filename}{extension}{FileExt.BIN}"
+    name = f"{filename}{extension}{FileExt.BIN}"
+    saved_rows = history.saved
+    if 0 < saved_rows <= total_rows:
+        try:
+            expected_size = CONSUMPTION_HEADER.size + 8 * len(ConsumptionHistory.FIELDS) * saved_rows
+            is_appendable = os.path.getsize(filename_binary) == expected_size
+        except OSError:
+            is_appendable = False
+    else:
+        is_appendable = False
+    if is_appendable:
+        if saved_rows < total_rows:
+            wqueue.submit(
+                filename_binary, append_consumption_file, filename_binary,
+                pack_consumption_rows(history, saved_rows, header=False), name)
+    else:
+        wqueue.submit(
+            filename_binary, save_userdata_file, filename_binary, pack_consumption_rows(history), name)
+    history.saved = total_rows
@@ -0,0 +1,140 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Binary delta file function
+
+Binary delta file structure (little-endian):
+    Header: magic(4s), version(H), columns(H), rows(I), checksum(I, CRC32, 0 = none)
+    Body: contiguous float64 columns (column-major), each column has rows values
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import mmap
+import sys
+from array import array
+from itertools import chain
+from struct import Struct
+from zlib import crc32
+
+from ..const_file import FileExt
+from ..validator import valid_delta_set
+from .user_database import save_userdata, udb
+from .write_queue import unpack_header, wqueue, write_file_atomic
+
+DELTA_MAGIC = b"RBDT"
+DELTA_VERSION = 1
+DELTA_HEADER = Struct("<4sHHII")
+
+logger = logging.getLogger(__name__)
+
+
+def unpack_delta_binary(buffer) -> tuple[tuple[float, ...], ...]:
+    """Unpack binary delta data from bytes-like buffer, return data in rows"""
+    magic, version, columns, rows, checksum = unpack_header(DELTA_HEADER, buffer, "binary delta")
+    if (magic != DELTA_MAGIC or version != DELTA_VERSION
+        or DELTA_HEADER.size + columns * rows * 8 != len(buffer)):
+        raise ValueError("invalid binary delta header")
+    values = array("d")
+    with memoryview(buffer) as view:
+        body = view[DELTA_HEADER.size:]
+        try:
+            if checksum and crc32(body) != checksum:
+                raise ValueError("binary delta checksum mismatch")
+            values.frombytes(body)
+        finally:
+            body.release()
+    if sys.byteorder == "big":
+        values.byteswap()
+    return tuple(zip(*(values[index:index + rows] for index in range(0, columns * rows, rows))))
+
+
+def pack_delta_binary(dataset: tuple, checksum: bool = True) -> bytes:
+    """Pack delta data in rows to binary delta data"""
+    columns = len(dataset[0])
+    rows = len(dataset)
+    values = array("d", chain.from_iterable(zip(*dataset)))
+    if len(values) != columns * rows:
+        raise ValueError("inconsistent delta columns")
+    if sys.byteorder == "big":
+        values.byteswap()
+    header = DELTA_HEADER.pack(
+        DELTA_MAGIC, DELTA_VERSION, columns, rows, crc32(values) if checksum else 0)
+    return header + values.tobytes()
+
+
+def load_delta_binary(filename_full: str) -> tuple[tuple[float, ...], ...]:
+    """Load binary delta file via memory map, return data in rows"""
+    with open(filename_full, "rb") as temp_file:
+        with mmap.mmap(temp_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return unpack_delta_binary(mapped)
+
+
+def load_delta_csv(filename_full: str) -> tuple[tuple, ...]:
+    """Load legacy CSV delta file"""
+    with open(filename_full, newline="", encoding="utf-8") as csvfile:
+        data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
+        return tuple(tuple(data) for data in data_reader)
+
+
+def load_delta_file(
+    filepath: str, filename: str, extension: str, migrate: bool = True) -> tuple[tuple, ...]:
+    """Load & validate delta file, migrate from legacy CSV file if binary file not exist or invalid
+
+    Binary file is saved as legacy file name with extra (*.bin) extension.
+    Legacy CSV file is kept untouched after migration.
+    Set migrate to False to load without saving binary file (read only).
+    """
+    filename_legacy = f"{filepath}{filename}{extension}"
+    filename_binary = f"{filename_legacy}{FileExt.BIN}"
+    try:
+        return valid_delta_set(load_delta_binary(filename_binary))
+    except (IndexError, ValueError, OSError):
+        pass  # not exist, empty or corrupted, fall back to legacy file & migrate again
+    temp_list = valid_delta_set(load_delta_csv(filename_legacy))
+    if not migrate:
+        return temp_list
+    try:
+        wqueue.submit(filename_binary, write_file_atomic, filename_binary, pack_delta_binary(temp_list))
+        logger.info("USERDATA: %s%s%s migrated", filename, extension, FileExt.BIN)
+    except (IndexError, TypeError, ValueError):
+        logger.info("USERDATA: failed migrating %s%s", filename, extension)
+    return temp_list
+
+
+def read_delta_record(filepath: str, filename: str, extension: str) -> bytes:
+    """Read delta file as binary delta data (for database import)"""
+    return pack_delta_binary(load_delta_file(filepath, filename, extension, migrate=False))
+
+
+def load_delta_data(filepath: str, filename: str, extension: str) -> tuple[tuple, ...]:
+    """Load & validate delta data from user database if enabled, otherwise from file"""
+    if udb.enabled:
+        data = udb.load(filename, extension)
+        if data is None:
+            raise FileNotFoundError
+        return valid_delta_set(unpack_delta_binary(data))
+    return load_delta_file(filepath, filename, extension)
+
+
+def save_delta_data(filepath: str, filename: str, extension: str, dataset: tuple) -> None:
+    """Queue delta data saving, to user database if enabled, otherwise to binary file"""
+    save_userdata(filepath, filename, extension, pack_delta_binary(dataset), FileExt.BIN)
@@ -18,12 +18,17 @@
 
 """
 Driver stats file function
+
+Stats changes are appended to stats journal (*.stats.journal) during session,
+and compacted into stats file (*.stats) in background once journal grows large.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 from dataclasses import dataclass
 from time import sleep
 from typing import KeysView, get_type_hints
@@ -33,12 +38,15 @@ from ..const_file import FileExt, StatsFile
 from ..validator import convert_value_type, purge_data_key
 from .json_setting import (
     create_backup_file,
-    save_and_verify_json_file,
     save_json_file,
+    save_json_file_atomic,
     set_backup_timestamp,
 )
 
+JOURNAL_COMPACT_SIZE = 65536  # bytes
+
 logger = logging.getLogger(__name__)
+_journal_lock = threading.Lock()
 
 
 @dataclass
@@ -109,10 +117,60 @@ def get_sub_dict(source: dict, key_name: str) -> dict:
     return sub_dict
 
 
+def diff_driver_stats(stats_curr: DriverStats, stats_last: DriverStats) -> dict:
+    """Get stats changes since last journal entry
+
+    Lap time is only included if improved, other stats are included as increment.
+    """
+    stats_delta = {}
+    last_dict = stats_last.__dict__
+    for key, value in stats_curr.__dict__.items():
+        last_value = last_dict[key]
+        if DriverStats.is_lap_time(key):
+            if last_value > value > 0:
+                stats_delta[key] = value
+        elif value != last_value:
+            stats_delta[key] = value - last_value
+    return stats_delta
+
+
+def merge_driver_stats(loaded_dict: dict, stats_delta: dict) -> None:
+    """Merge stats changes into loaded stats, auto correct invalid value"""
+    default_dict = DriverStats.__dict__
+    default_type = get_type_hints(DriverStats)
+    for key in DriverStats.keys():
+        # Add new default value if not exists
+        if key not in loaded_dict:
+            loaded_dict[key] = default_dict[key]
+        # Check value type, auto correct if mismatch
+        if not isinstance(loaded_dict[key], default_type[key]):
+            loaded_dict[key] = convert_value_type(loaded_dict[key], default_dict[key], default_type[key])
+        value = stats_delta.get(key)
+        if not isinstance(value, (int, float)):
+            continue
+        # Update laptime value faster than old value
+        if DriverStats.is_lap_time(key):
+            if loaded_dict[key] <= 0:  # reset invalid time
+                loaded_dict[key] = MAX_SECONDS
+            if loaded_dict[key] > value > 0:
+                loaded_dict[key] = value
+            continue
+        # Update value (increment)
+        loaded_dict[key] += value
+
+
+def merge_stats_journal(stats_user: dict, journal: list[tuple[str, str, dict]]) -> dict:
+    """Merge stats journal entries into stats"""
+    for track_name, vehicle_name, stats_delta in journal:
+        loaded_dict = get_sub_dict(get_sub_dict(stats_user, track_name), vehicle_name)
+        merge_driver_stats(loaded_dict, stats_delta)
+    return stats_user
+
+
 def load_driver_stats(
     key_list: tuple[str, str], filepath: str, filename: str = StatsFile.DRIVER
 ) -> DriverStats:
-    """Load driver stats"""
+    """Load driver stats, merged with stats journal"""
     stats_user = load_stats_json_file(
         filepath=filepath,
         filename=filename,
@@ -124,8 +182,14 @@ def load_driver_stats(
     for key in key_list:
         temp_dict = loaded_dict.get(key)
         if not isinstance(temp_dict, dict):  # not exist, set to default
-            return DriverStats()
+            loaded_dict = {}
+            break
         loaded_dict = temp_dict
+    # Merge changes from journal
+    track_name, vehicle_name = key_list
+    for entry in load_stats_journal(filepath, filename):
+        if entry[0] == track_name and entry[1] == vehicle_name:
+            merge_driver_stats(loaded_dict, entry[2])
     # Add data to DriverStats
     try:
         return DriverStats(**purge_data_key(loaded_dict, DriverStats.keys()))
@@ -133,60 +197,126 @@ def load_driver_stats(
         return DriverStats()
 
 
-def save_driver_stats(
-    key_list: tuple[str, str], stats_update: DriverStats, filepath: str, filename: str = StatsFile.DRIVER
+def append_driver_stats(
+    key_list: tuple[str, str], stats_delta: dict, filepath: str, filename: str = StatsFile.DRIVER
 ) -> None:
-    """Save driver stats"""
-    if not key_list or not all(key_list):  # ignore invalid key name
+    """Append stats changes to stats journal (*.stats.journal)"""
+    if not stats_delta or not key_list or not all(key_list):  # ignore invalid key name
         return
-    # Load stats with limited attempts
-    load_attempts = 10
-    while load_attempts > 0:
-        stats_user = load_stats_json_file(
-            filepath=filepath,
-            filename=filename,
-            show_log=False,
-        )
-        if stats_user is not None:
-            break
-        load_attempts -= 1
-        logger.info("USERDATA: unable to load %s%s, %s attempt(s) left", filename, FileExt.STATS, load_attempts)
-        sleep(0.05)
-    # Create backup if failed to load stats
-    if stats_user is None:
-        logger.info("USERDATA: unable to load %s%s, creating backup", filename, FileExt.STATS)
-        if not create_backup_file(f"{filename}{FileExt.STATS}", filepath, set_backup_timestamp(), show_log=True):
-            return  # abort saving if failed to create backup
-        stats_user = {}  # reset stats
-    # Get data from matching key
-    loaded_dict = stats_user
-    for key in key_list:
-        loaded_dict = get_sub_dict(loaded_dict, key)
-    # Verify and update new data
-    default_dict = DriverStats.__dict__
-    default_type = get_type_hints(DriverStats)
-    for key, value in stats_update.__dict__.items():
-        # Add new default value if not exists
-        if key not in loaded_dict:
-            loaded_dict[key] = default_dict[key]
-        # Check value type, auto correct if mismatch
-        if not isinstance(loaded_dict[key], default_type[key]):
-            loaded_dict[key] = convert_value_type(loaded_dict[key], default_dict[key], default_type[key])
-        # Update laptime value faster than old value
-        if DriverStats.is_lap_time(key):
-            if loaded_dict[key] <= 0:  # reset invalid time
-                loaded_dict[key] = MAX_SECONDS
-            if loaded_dict[key] > value > 0:
-                loaded_dict[key] = value
-            continue
-        # Update value (increment)
-        loaded_dict[key] += value
-    # Save new data
-    save_stats_json_file(
-        stats_user=stats_user,
-        filepath=filepath,
-        filename=filename,
-    )
+    entry = f"{json.dumps([*key_list, stats_delta], separators=(',', ':'))}\n".encode("utf-8")
+    with _journal_lock:
+        try:
+            with open(f"{filepath}{filename}{FileExt.STATS}{FileExt.JOURNAL}", "a+b") as journal_file:
+                # Start new line if last entry was incomplete (crashed while writing)
+                if journal_file.seek(0, os.SEEK_END) > 0:
+                    journal_file.seek(-1, os.SEEK_END)
+                    if journal_file.read(1) != b"\n":
+                        entry = b"\n" + entry
+                journal_file.write(entry)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+        except OSError:
+            logger.error("USERDATA: failed appending %s%s", filename, FileExt.JOURNAL)
+
+
+def load_stats_journal(filepath: str, filename: str = StatsFile.DRIVER) -> list[tuple[str, str, dict]]:
+    """Load stats journal entries, skip incomplete or invalid entry"""
+    return read_stats_journal(filepath, filename)[0]
+
+
+def read_stats_journal(
+    filepath: str, filename: str = StatsFile.DRIVER, offset: int = 0
+) -> tuple[list[tuple[str, str, dict]], int]:
+    """Read stats journal entries from offset, skip incomplete or invalid entry
+
+    Returns:
+        Journal entries, journal offset after last complete entry.
+    """
+    journal = []
+    try:
+        with open(f"{filepath}{filename}{FileExt.STATS}{FileExt.JOURNAL}", "rb") as journal_file:
+            journal_file.seek(offset)
+            for line in journal_file:
+                if not line.endswith(b"\n"):  # incomplete entry
+                    break
+                offset += len(line)
+                try:
+                    track_name, vehicle_name, stats_delta = json.loads(line)
+                except (TypeError, ValueError):
+                    continue
+                if (isinstance(track_name, str) and isinstance(vehicle_name, str)
+                    and isinstance(stats_delta, dict)):
+                    journal.append((track_name, vehicle_name, stats_delta))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        logger.info("MISSING: invalid %s stats (%s) journal", filename, FileExt.JOURNAL)
+    return journal, offset
+
+
+def compact_driver_stats(filepath: str, filename: str = StatsFile.DRIVER, min_size: int = 0) -> None:
+    """Compact stats journal into stats file, then clear journal
+
+    Args:
+        filepath: file path.
+        filename: file name.
+        min_size: minimum journal size (bytes) to start compaction.
+    """
+    filename_journal = f"{filepath}{filename}{FileExt.STATS}{FileExt.JOURNAL}"
+    with _journal_lock:
+        try:
+            if os.path.getsize(filename_journal) < max(min_size, 1):
+                return
+        except OSError:  # journal not exist
+            return
+        # Load stats with limited attempts
+        load_attempts = 10
+        while load_attempts > 0:
+            stats_user = load_stats_json_file(
+                filepath=filepath,
+                filename=filename,
+                show_log=False,
+            )
+            if stats_user is not None:
+                break
+            load_attempts -= 1
+            logger.info("USERDATA: unable to load %s%s, %s attempt(s) left", filename, FileExt.STATS, load_attempts)
+            sleep(0.05)
+        # Create backup if failed to load stats
+        if stats_user is None:
+            logger.info("USERDATA: unable to load %s%s, creating backup", filename, FileExt.STATS)
+            if not create_backup_file(f"{filename}{FileExt.STATS}", filepath, set_backup_timestamp(), show_log=True):
+                return  # abort compaction if failed to create backup
+            stats_user = {}  # reset stats
+        journal = load_stats_journal(filepath, filename)
+        merge_stats_journal(stats_user, journal)
+        if save_stats_json_file(stats_user, filepath, filename):
+            os.remove(filename_journal)
+            logger.info("USERDATA: %s%s compacted (%s entries)", filename, FileExt.JOURNAL, len(journal))
+
+
+def replace_driver_stats(
+    stats_user: dict, filepath: str, filename: str = StatsFile.DRIVER, journal_offset: int = 0
+) -> None:
+    """Replace stats file with edited stats (merged with journal), then clear journal
+
+    Args:
+        stats_user: edited stats, merged with journal entries before journal offset.
+        filepath: file path.
+        filename: file name.
+        journal_offset: journal offset of merged entries, entries appended after are merged before saving.
+    """
+    filename_journal = f"{filepath}{filename}{FileExt.STATS}{FileExt.JOURNAL}"
+    with _journal_lock:
+        try:
+            if os.path.getsize(filename_journal) < journal_offset:
+                journal_offset = 0  # journal compacted & recreated since loaded
+        except OSError:
+            journal_offset = 0
+        journal = read_stats_journal(filepath, filename, journal_offset)[0]
+        merge_stats_journal(stats_user, journal)
+        if save_stats_json_file(stats_user, filepath, filename) and os.path.exists(filename_journal):
+            os.remove(filename_journal)
 
 
 def load_stats_json_file(
@@ -213,9 +343,9 @@ def load_stats_json_file(
 
 def save_stats_json_file(
     stats_user: dict, filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS
-) -> None:
+) -> bool:
     """Save stats to json file"""
-    save_and_verify_json_file(
+    return save_json_file_atomic(
         dict_user=stats_user,
         filename=f"{filename}{extension}",
         filepath=filepath,
@@ -120,21 +120,6 @@ def save_json_file(
             json.dump(dict_user, jsonfile, indent=4)
 
 
-def verify_json_file(
-    dict_user: dict, filename: str, filepath: str, extension: str = ""
-) -> bool:
-    """Verify saved json file"""
-    filename_source = f"{filepath}{filename}{extension}"
-    try:
-        with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            return json.load(jsonfile) == dict_user
-    except FileNotFoundError:
-        logger.error("USERDATA: not found %s", filename_source)
-    except (ValueError, OSError):
-        logger.error("USERDATA: unable to verify %s", filename_source)
-    return False
-
-
 def create_backup_file(
     filename: str, filepath: str, extension: str = FileExt.BAK, show_log: bool = False
 ) -> bool:
@@ -155,44 +140,6 @@ def create_backup_file(
     return False
 
 
-def restore_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Restore backup file if saving failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_source = f"{filepath}{filename}"
-    try:
-        shutil.copyfile(filename_backup, filename_source)
-        logger.info("USERDATA: backup restored %s", filename_source)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to restore backup %s", filename_backup)
-    return False
-
-
-def copy_and_rename_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Copy and rename backup file if restoring backup failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_renamed = f"{filepath}{filename}{set_backup_timestamp()}"
-    try:
-        shutil.copyfile(filename_backup, filename_renamed)
-        logger.info("USERDATA: backup renamed %s", filename_renamed)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to copy and rename backup %s", filename_backup)
-    return False
-
-
 def delete_backup_file(
     filename: str, filepath: str, extension: str = FileExt.BAK
 ) -> bool:
@@ -211,46 +158,73 @@ def delete_backup_file(
     return False
 
 
-def save_and_verify_json_file(
+def dumps_json(dict_user: dict, compact_json: bool = False) -> bytes:
+    """Serialize json data to bytes"""
+    if compact_json:
+        return json.dumps(dict_user, separators=(",", ":")).encode("utf-8")
+    return json.dumps(dict_user, indent=4).encode("utf-8")
+
+
+def save_json_file_atomic(
     dict_user: dict,
     filename: str,
     filepath: str,
     max_attempts: int = 10,
     compact_json: bool = False,
-) -> None:
-    """Save and verify json file, backup or restore if saving failed"""
-    file_found = os.path.exists(f"{filepath}{filename}")
-    # Create backup: abort saving if backup failed; skip backup and create new if not exist
-    if not file_found:
-        logger.info("USERDATA: %s not found, create new", filename)
-    elif not create_backup_file(filename, filepath):
-        logger.info("USERDATA: %s saving abort", filename)
-        return
+) -> bool:
+    """Save json file atomically
+
+    Returns:
+        True if saved.
+    """
+    return write_json_file_atomic(dumps_json(dict_user, compact_json), filename, filepath, max_attempts)
+
+
+def write_json_file_atomic(data: bytes, filename: str, filepath: str, max_attempts: int = 10) -> bool:
+    """Write serialized json data to file atomically
+
+    Write content to temp file (flushed to disk), then replace old file,
+    which is kept untouched if saving failed.
+
+    Args:
+        data: serialized json data.
+        filename: file name.
+        filepath: file path.
+        max_attempts: max saving attempts.
+
+    Returns:
+        True if saved.
+    """
+    timer_start = monotonic()
+    filename_source = f"{filepath}{filename}"
+    filename_temp = f"{filename_source}{FileExt.TMP}"
     # Start saving attempts
     attempts = max_attempts
-    timer_start = monotonic()
     while attempts > 0:
-        save_json_file(dict_user, filename, filepath, compact_json=compact_json)
-        if verify_json_file(dict_user, filename, filepath):
+        try:
+            with open(filename_temp, "wb") as jsonfile:
+                jsonfile.write(data)
+                jsonfile.flush()
+                os.fsync(jsonfile.fileno())
+            os.replace(filename_temp, filename_source)
             break
-        attempts -= 1
-        logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
-        sleep(0.05)
+        except OSError:
+            attempts -= 1
+            logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
+            sleep(0.05)
     timer_end = round((monotonic() - timer_start) * 1000)
     # Clean up
     if attempts > 0:
         state_text = "saved"
     else:
-        if file_found and not restore_backup_file(filename, filepath):
-            copy_and_rename_backup_file(filename, filepath)
+        delete_backup_file(filename, filepath, FileExt.TMP)
         state_text = "failed saving"
-    if file_found:
-        delete_backup_file(filename, filepath)
     logger.info(
         "USERDATA: %s %s (took %sms, %s/%s attempts)",
         filename,
         state_text,
         timer_end,
-        max_attempts - attempts,
-        attempts,
+        max_attempts - attempts + (attempts > 0),
+        max_attempts,
     )
+    return attempts > 0
@@ -0,0 +1,124 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Validated preset cache function
+
+Validated user preset is cached in binary format (*.json.bin) next to preset file,
+keyed by preset file checksum, app version & default setting,
+so that unchanged preset can skip validation on loading.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import marshal
+import os
+from struct import Struct
+from zlib import crc32
+
+from ..const_app import VERSION
+from ..const_file import FileExt
+from .json_setting import load_setting_json_file
+from .write_queue import unpack_header, write_file_atomic
+
+PRESET_CACHE_MAGIC = b"RBPC"
+PRESET_CACHE_VERSION = 1
+PRESET_CACHE_HEADER = Struct("<4sHHIII")
+
+logger = logging.getLogger(__name__)
+
+
+def preset_cache_key(dict_def: dict) -> int:
+    """Create preset cache key from app version & default setting"""
+    default = json.dumps({key: dict(value) for key, value in dict_def.items()}, separators=(",", ":"))
+    return crc32(default.encode("utf-8"), crc32(VERSION.encode("utf-8")))
+
+
+def load_preset_cache(filename_full: str, source_checksum: int, cache_key: int) -> dict:
+    """Load validated preset cache (*.json.bin), must match preset checksum & cache key"""
+    with open(filename_full, "rb") as binfile:
+        data = binfile.read()
+    magic, version, marshal_version, checksum, key, data_checksum = unpack_header(
+        PRESET_CACHE_HEADER, data, "preset cache")
+    body = memoryview(data)[PRESET_CACHE_HEADER.size:]
+    if (magic != PRESET_CACHE_MAGIC or version != PRESET_CACHE_VERSION
+        or marshal_version != marshal.version or checksum != source_checksum
+        or key != cache_key or data_checksum != crc32(body)):
+        raise ValueError("outdated preset cache")
+    setting_user = marshal.loads(body)
+    if not isinstance(setting_user, dict):
+        raise TypeError("invalid preset cache")
+    return setting_user
+
+
+def save_preset_cache(
+    filename: str, filepath: str, cache_key: int, setting_user: dict, source_checksum: int
+) -> None:
+    """Save validated preset cache (*.json.bin)
+
+    Args:
+        filename: preset file name.
+        filepath: preset file path.
+        cache_key: preset cache key.
+        setting_user: validated setting, same as saved preset file content.
+        source_checksum: checksum of saved preset file content.
+    """
+    try:
+        body = marshal.dumps(setting_user)
+        header = PRESET_CACHE_HEADER.pack(
+            PRESET_CACHE_MAGIC, PRESET_CACHE_VERSION, marshal.version,
+            source_checksum, cache_key, crc32(body))
+        write_file_atomic(f"{filepath}{filename}{FileExt.BIN}", header + body)
+    except (OSError, TypeError, ValueError):
+        logger.info("USERDATA: failed caching %s", filename)
+
+
+def delete_preset_cache(filename: str, filepath: str) -> None:
+    """Delete validated preset cache (*.json.bin)"""
+    filename_cache = f"{filepath}{filename}{FileExt.BIN}"
+    try:
+        if os.path.exists(filename_cache):
+            os.remove(filename_cache)
+    except OSError:
+        logger.error("USERDATA: unable to delete %s", filename_cache)
+
+
+def load_user_preset_cached(filename: str, filepath: str, dict_def: dict, cache_key: int) -> tuple[dict, bool]:
+    """Load user preset from validated cache if preset unchanged, otherwise load & validate preset file
+
+    Returns:
+        User preset, whether loaded from validated cache.
+    """
+    filename_full = f"{filepath}{filename}"
+    try:
+        with open(filename_full, "rb") as jsonfile:
+            checksum = crc32(jsonfile.read())
+        setting_user = load_preset_cache(f"{filename_full}{FileExt.BIN}", checksum, cache_key)
+        logger.info("USERDATA: %s loaded (user preset, validated cache)", filename)
+        return setting_user, True
+    except (OSError, EOFError, TypeError, ValueError):
+        pass
+    setting_user = load_setting_json_file(
+        filename=filename,
+        filepath=filepath,
+        dict_def=dict_def,
+    )
+    return setting_user, False
@@ -0,0 +1,112 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Sampling profiler file function
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from types import CodeType
+
+from ..const_app import APP_NAME, VERSION
+from ..const_file import FileExt
+
+URL_SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+logger = logging.getLogger(__name__)
+
+
+def format_frame_name(code: CodeType) -> str:
+    """Format frame name from code object"""
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)})"
+
+
+def save_profile_collapsed(
+    filepath: str, filename: str, samples: dict[tuple[str, tuple[CodeType, ...]], int]
+) -> None:
+    """Save sampling profile in collapsed stack format (*.folded)
+
+    Each line: thread name;root frame;...;leaf frame sample count
+    """
+    lines = [
+        f"{';'.join((thread_name, *map(format_frame_name, stack)))} {count}\n"
+        for (thread_name, stack), count in samples.items()
+    ]
+    lines.sort()
+    with open(f"{filepath}{filename}{FileExt.FOLDED}", "w", encoding="utf-8") as temp_file:
+        temp_file.writelines(lines)
+        logger.info("USERDATA: %s%s saved", filename, FileExt.FOLDED)
+
+
+def save_profile_speedscope(
+    filepath: str, filename: str, samples: dict[tuple[str, tuple[CodeType, ...]], int], interval: float
+) -> None:
+    """Save sampling profile in speedscope format (*.speedscope.json)
+
+    Args:
+        filepath: file path.
+        filename: file name without extension.
+        samples: sample count by thread name & stack (from root to leaf).
+        interval: sampling interval in milliseconds, used as sample weight.
+    """
+    frame_index: dict[CodeType, int] = {}
+    frames = []
+    profiles: dict[str, dict] = {}
+    for (thread_name, stack), count in samples.items():
+        stack_index = []
+        for code in stack:
+            index = frame_index.get(code)
+            if index is None:
+                index = frame_index[code] = len(frames)
+                frames.append({
+                    "name": getattr(code, "co_qualname", code.co_name),
+                    "file": code.co_filename,
+                    "line": code.co_firstlineno,
+                })
+            stack_index.append(index)
+        profile = profiles.get(thread_name)
+        if profile is None:
+            profile = profiles[thread_name] = {
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": 0,
+                "samples": [],
+                "weights": [],
+            }
+        weight = count * interval
+        profile["samples"].append(stack_index)
+        profile["weights"].append(weight)
+        profile["endValue"] += weight
+
+    output = {
+        "$schema": URL_SPEEDSCOPE_SCHEMA,
+        "name": filename,
+        "exporter": f"{APP_NAME} {VERSION}",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": sorted(profiles.values(), key=lambda _profile: _profile["name"]),
+    }
+    with open(f"{filepath}{filename}{FileExt.SPEEDSCOPE}", "w", encoding="utf-8") as temp_file:
+        json.dump(output, temp_file, separators=(",", ":"))
+        logger.info("USERDATA: %s%s saved", filename, FileExt.SPEEDSCOPE)
@@ -23,10 +23,12 @@ Sector best file function
 from __future__ import annotations
 
 import csv
+import io
 import logging
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name
+from .user_database import open_userdata_text, save_userdata
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,7 @@ def load_sector_best_file(
 ) -> tuple[list, list, list, list]:
     """Load sector best file (*.sector)"""
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
+        with open_userdata_text(filepath, filename, extension) as csvfile:
             temp_list = list(csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC))
         # Check if same session
         if (temp_list[0][0] == session_id[0] and  # session_stamp
@@ -73,7 +75,7 @@ def save_sector_best_file(
     """
     if len(dataset) != 5 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    csvfile = io.StringIO(newline="")
+    data_writer = csv.writer(csvfile)
+    data_writer.writerows(dataset)
+    save_userdata(filepath, filename, extension, csvfile.getvalue().encode("utf-8"))
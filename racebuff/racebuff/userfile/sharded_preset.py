@@ -0,0 +1,283 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Sharded style preset function
+
+Style preset (brakes, compounds, tracks) is stored as one small json file
+per entry in preset sub-folder, loaded lazily on first access,
+and only changed entries are saved.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections.abc import MutableMapping
+from time import monotonic
+from typing import Any, Callable, Iterator, Mapping
+from zlib import crc32
+
+from ..const_file import FileExt
+from ..formatter import strip_filename_extension, strip_invalid_char
+from .json_setting import (
+    copy_setting,
+    create_backup_file,
+    set_backup_timestamp,
+)
+from .write_queue import write_file_atomic
+
+MAX_SHARD_NAME_LENGTH = 64
+
+logger = logging.getLogger(__name__)
+
+
+def shard_filename(name: str) -> str:
+    """Set shard file name from entry name, with checksum suffix to avoid name collision"""
+    prefix = strip_invalid_char(name)[:MAX_SHARD_NAME_LENGTH].rstrip(" .")
+    return f"{prefix}-{crc32(name.encode('utf-8')):08x}{FileExt.JSON}"
+
+
+def dumps_shard(name: str, data: dict) -> str:
+    """Serialize shard to compact json text"""
+    return json.dumps({name: data}, separators=(",", ":"))
+
+
+class ShardedPreset(MutableMapping):
+    """Sharded style preset
+
+    Each entry is stored as single entry json file ({name: data}) in shard path.
+    Entries are loaded on first access, full scan only on iteration.
+
+    Args:
+        filename: preset file name.
+        shard_path: shard folder path.
+        validator: style validator, returns True if entry changed.
+    """
+
+    __slots__ = (
+        "_name",
+        "_path",
+        "_validator",
+        "_lock",
+        "_entries",
+        "_missing",
+        "_saved",
+        "_scanned",
+    )
+
+    def __init__(self, filename: str, shard_path: str, validator: Callable[[dict], bool] | None = None):
+        self._name = filename
+        self._path = shard_path
+        self._validator = validator
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._missing: set[str] = set()
+        self._saved: dict[str, str] = {}  # last saved text of loaded entry
+        self._scanned = False
+
+    def __getitem__(self, name: str) -> dict:
+        data = self.get(name)
+        if data is None:
+            raise KeyError(name)
+        return data
+
+    def __setitem__(self, name: str, data: dict):
+        with self._lock:
+            self._entries[name] = data
+            self._missing.discard(name)
+
+    def __delitem__(self, name: str):
+        if self.get(name) is None:
+            raise KeyError(name)
+        with self._lock:
+            del self._entries[name]
+            self._missing.add(name)
+
+    def __contains__(self, name: object) -> bool:
+        return self.get(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        self.scan()
+        with self._lock:
+            return iter(tuple(self._entries))
+
+    def __len__(self) -> int:
+        self.scan()
+        return len(self._entries)
+
+    def get(self, name: Any, default: Any = None) -> Any:
+        """Get entry, load from shard file on first access"""
+        data = self._entries.get(name)
+        if data is not None:
+            return data
+        if self._scanned or name in self._missing or not isinstance(name, str):
+            return default
+        data = self.__load(shard_filename(name), name)
+        if data is None:
+            self._missing.add(name)
+            return default
+        return data
+
+    def copy(self) -> dict[str, dict]:
+        """Copy all entries to dict"""
+        self.scan()
+        with self._lock:
+            return self._entries.copy()
+
+    def scan(self):
+        """Load all unloaded shard files"""
+        if self._scanned:
+            return
+        try:
+            shard_files = sorted(
+                _filename for _filename in os.listdir(self._path)
+                if _filename.endswith(FileExt.JSON)
+            )
+        except OSError:
+            shard_files = []
+        loaded_files = {shard_filename(name) for name in self._entries}
+        for _filename in shard_files:
+            if _filename not in loaded_files:
+                self.__load(_filename)
+        with self._lock:
+            self._entries = dict(sorted(self._entries.items(), key=lambda _item: _item[0].lower()))
+            self._missing.clear()
+            self._scanned = True
+
+    def replace(self, dict_user: Mapping[str, dict]):
+        """Replace all entries, removed entries are deleted on next saving"""
+        self.scan()
+        with self._lock:
+            self._entries = dict(dict_user)
+
+    def save(self) -> int:
+        """Save changed entries & delete removed entries
+
+        Returns:
+            Number of changed shard files.
+        """
+        timer_start = monotonic()
+        with self._lock:
+            entries = tuple(self._entries.items())
+            saved = self._saved.copy()
+            removed = tuple(name for name in saved if name not in self._entries)
+        changed = 0
+        for name, data in entries:
+            shard_text = dumps_shard(name, data)
+            if saved.get(name) == shard_text:
+                continue
+            filename_full = f"{self._path}{shard_filename(name)}"
+            try:
+                write_file_atomic(filename_full, shard_text.encode("utf-8"))
+                with self._lock:
+                    self._saved[name] = shard_text
+                changed += 1
+            except OSError:
+                logger.error("USERDATA: %s failed saving", filename_full)
+        for name in removed:
+            filename_full = f"{self._path}{shard_filename(name)}"
+            try:
+                if os.path.exists(filename_full):
+                    os.remove(filename_full)
+                with self._lock:
+                    self._saved.pop(name, None)
+                changed += 1
+            except OSError:
+                logger.error("USERDATA: unable to delete %s", filename_full)
+        timer_end = round((monotonic() - timer_start) * 1000)
+        if changed:
+            logger.info("USERDATA: %s saved (%s changed entries, took %sms)", self._name, changed, timer_end)
+        else:
+            logger.info("USERDATA: %s unchanged, skip saving", self._name)
+        return changed
+
+    def __load(self, filename: str, name: str | None = None) -> dict | None:
+        """Load shard file, name is verified if specified"""
+        filename_full = f"{self._path}{filename}"
+        try:
+            with open(filename_full, "r", encoding="utf-8") as jsonfile:
+                shard = json.load(jsonfile)
+            if not isinstance(shard, dict) or len(shard) != 1:
+                raise ValueError("invalid shard")
+            shard_name, data = next(iter(shard.items()))
+            if name is not None and shard_name != name:
+                return None  # checksum suffix collision
+            is_changed = self._validator is not None and self._validator(shard)
+            data = shard[shard_name]
+        except FileNotFoundError:
+            return None
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError, OSError):
+            logger.error("USERDATA: %s failed loading, skipped", filename)
+            create_backup_file(filename, self._path, set_backup_timestamp(), show_log=True)
+            return None
+        with self._lock:
+            if shard_name in self._entries:  # loaded by other thread
+                return self._entries[shard_name]
+            self._entries[shard_name] = data
+            self._saved[shard_name] = "" if is_changed else dumps_shard(shard_name, data)
+        return data
+
+
+def load_legacy_preset(
+    filename: str, filepath: str, dict_def: dict,
+    validator: Callable[[dict], bool] | None = None,
+) -> dict:
+    """Load & validate legacy style preset file in memory (read only), or default if not exist"""
+    try:
+        with open(f"{filepath}{filename}", "r", encoding="utf-8") as jsonfile:
+            dict_user = json.load(jsonfile)
+        if not isinstance(dict_user, dict):
+            raise TypeError("invalid style preset")
+        if validator is not None:
+            validator(dict_user)
+        return dict_user
+    except FileNotFoundError:
+        pass
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError, OSError):
+        logger.error("USERDATA: %s failed loading, fall back to default", filename)
+    return copy_setting(dict_def)
+
+
+def load_sharded_preset(
+    filename: str, filepath: str, dict_def: dict,
+    validator: Callable[[dict], bool] | None = None,
+) -> ShardedPreset:
+    """Load sharded style preset
+
+    Sharded entries are stored in sub-folder named after preset file (without extension).
+    If sub-folder not exist, existing preset file (or default) is split into sharded entries,
+    and preset file is kept untouched.
+    """
+    shard_path = f"{filepath}{strip_filename_extension(filename, FileExt.JSON)}/"
+    style_user = ShardedPreset(filename, shard_path, validator)
+    if os.path.isdir(shard_path):
+        logger.info("USERDATA: %s loaded (sharded style preset)", filename)
+        return style_user
+    # Migrate from preset file (read only)
+    dict_user = load_legacy_preset(filename, filepath, dict_def, validator)
+    try:
+        os.makedirs(shard_path, exist_ok=True)
+    except OSError:
+        logger.error("USERDATA: unable to create %s", shard_path)
+    style_user.replace(dict_user)
+    style_user.save()
+    logger.info("USERDATA: %s split into sharded entries (sharded style preset)", filename)
+    return style_user
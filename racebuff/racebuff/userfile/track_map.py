@@ -22,12 +22,24 @@ Track map file function
 
 from __future__ import annotations
 
+import io
 import logging
+import os
+import sys
 import xml.dom.minidom
 import xml.parsers.expat
+from array import array
+from struct import Struct
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name
+from .write_queue import unpack_header, wqueue, write_file_atomic
+
+# Binary sidecar header: magic, version, svg modified time (ns), svg size,
+# coords count, dists count, sector index (2)
+MAP_CACHE_MAGIC = b"RBTM"
+MAP_CACHE_VERSION = 1
+MAP_CACHE_HEADER = Struct("<4sHqqII2i")
 
 logger = logging.getLogger(__name__)
 
@@ -38,27 +50,26 @@ def string_pair_to_int(string: str) -> tuple[int, int]:
     return int(value[0]), int(value[1])
 
 
-def string_pair_to_float(string: str) -> tuple[float, float]:
-    """Convert string pair "x,y" to float list"""
-    value = string.split(",")
-    return float(value[0]), float(value[1])
-
-
 def list_pair_to_string(data: tuple | list) -> str:
     """Convert list pair (x,y) to string pair"""
     return f"{data[0]},{data[1]}"
 
 
-def points_to_coords(points: str) -> tuple[tuple[float, float], ...]:
+def points_to_values(points: str) -> tuple[tuple[float, float], ...]:
     """Convert svg points strings to raw coordinates
 
+    Split all numbers at once, then pair up x & y values.
+
     Args:
         points: "x,y x,y ..." svg points strings.
 
     Returns:
         ((x,y), (x,y), ...) raw coordinates.
     """
-    return tuple(map(string_pair_to_float, points.split(" ")))
+    values = tuple(map(float, points.replace(",", " ").split()))
+    if len(values) % 2:
+        raise ValueError("unpaired svg points")
+    return tuple(zip(values[::2], values[1::2]))
 
 
 def coords_to_points(coords: tuple | list) -> str:
@@ -73,28 +84,111 @@ def coords_to_points(coords: tuple | list) -> str:
     return " ".join(map(list_pair_to_string, coords))
 
 
+def parse_track_map_svg(filename_full: str) -> tuple[str, str, str]:
+    """Parse svg track map file with streaming parser
+
+    Only map & dist polyline points and desc text are collected.
+
+    Returns:
+        map points, dist points, desc text.
+    """
+    polylines = {}
+    desc_text = []
+    in_desc = False
+
+    def start_element(name: str, attrs: dict):
+        nonlocal in_desc
+        if name == "polyline":
+            polyline_id = attrs.get("id")
+            if polyline_id == "map" or polyline_id == "dist":
+                polylines[polyline_id] = attrs.get("points")
+        elif name == "desc":
+            in_desc = not desc_text  # first desc only
+
+    def end_element(name: str):
+        nonlocal in_desc
+        if name == "desc":
+            in_desc = False
+
+    def char_data(data: str):
+        if in_desc:
+            desc_text.append(data)
+
+    parser = xml.parsers.expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = char_data
+    # Parse whole file at once, as chunked parsing rescans long points attribute
+    with open(filename_full, "rb") as svgfile:
+        parser.Parse(svgfile.read(), True)
+    svg_coords = polylines.get("map")
+    svg_dists = polylines.get("dist")
+    if not isinstance(svg_coords, str) or not isinstance(svg_dists, str):
+        raise ValueError("missing track map polyline")
+    return svg_coords, svg_dists, "".join(desc_text)
+
+
+def load_track_map_cache(filename_full: str, svg_stat: os.stat_result):
+    """Load binary track map cache (*.svg.bin), must match svg modified time & size"""
+    with open(filename_full, "rb") as binfile:
+        data = binfile.read()
+    (magic, version, modified, size, coords_count, dists_count, *sector_index
+     ) = unpack_header(MAP_CACHE_HEADER, data, "track map cache")
+    if (magic != MAP_CACHE_MAGIC or version != MAP_CACHE_VERSION
+        or modified != svg_stat.st_mtime_ns or size != svg_stat.st_size
+        or MAP_CACHE_HEADER.size + (coords_count + dists_count) * 16 != len(data)):
+        raise ValueError("outdated track map cache")
+    values = array("d")
+    values.frombytes(memoryview(data)[MAP_CACHE_HEADER.size:])
+    if sys.byteorder == "big":
+        values.byteswap()
+    split = coords_count * 2
+    raw_coords = tuple(zip(values[0:split:2], values[1:split:2]))
+    raw_dists = tuple(zip(values[split::2], values[split + 1::2]))
+    return raw_coords, raw_dists, tuple(sector_index)
+
+
+def save_track_map_cache(
+    filename_full: str, svg_stat: os.stat_result,
+    raw_coords: tuple, raw_dists: tuple, sector_index: tuple
+) -> None:
+    """Save binary track map cache (*.svg.bin)"""
+    values = array("d")
+    for coords in raw_coords:
+        values.extend(coords)
+    for coords in raw_dists:
+        values.extend(coords)
+    if sys.byteorder == "big":
+        values.byteswap()
+    header = MAP_CACHE_HEADER.pack(
+        MAP_CACHE_MAGIC, MAP_CACHE_VERSION, svg_stat.st_mtime_ns, svg_stat.st_size,
+        len(raw_coords), len(raw_dists), sector_index[0], sector_index[1])
+    write_file_atomic(filename_full, header + values.tobytes())
+
+
 def load_track_map_file(filepath: str, filename: str, extension: str = FileExt.SVG):
-    """Load svg track map file (*.svg)"""
+    """Load svg track map file (*.svg)
+
+    Load from binary cache (*.svg.bin) if matches svg file,
+    otherwise parse svg file and create new cache.
+    """
+    filename_full = f"{filepath}{filename}{extension}"
+    filename_cache = f"{filename_full}{FileExt.BIN}"
     try:
-        dom = xml.dom.minidom.parse(f"{filepath}{filename}{extension}")
-        desc_col = dom.documentElement.getElementsByTagName("desc")
-        path_col = dom.documentElement.getElementsByTagName("polyline")
-        svg_coords = svg_dists = None
-        for tags in path_col:
-            if tags.getAttribute("id") == "map":
-                svg_coords = tags.getAttribute("points")
-                continue
-            if tags.getAttribute("id") == "dist":
-                svg_dists = tags.getAttribute("points")
-                continue
-        # Convert to coordinates list
-        if not isinstance(svg_coords, str):
-            raise ValueError
-        if not isinstance(svg_dists, str):
-            raise ValueError
-        raw_coords = points_to_coords(svg_coords)
-        raw_dists = points_to_coords(svg_dists)
-        sector_index = string_pair_to_int(desc_col[0].childNodes[0].nodeValue)
+        svg_stat = os.stat(filename_full)
+        try:
+            return load_track_map_cache(filename_cache, svg_stat)
+        except (OSError, ValueError, TypeError):
+            pass
+        svg_coords, svg_dists, svg_desc = parse_track_map_svg(filename_full)
+        raw_coords = points_to_values(svg_coords)
+        raw_dists = points_to_values(svg_dists)
+        sector_index = string_pair_to_int(svg_desc)
+        try:
+            save_track_map_cache(filename_cache, svg_stat, raw_coords, raw_dists, sector_index)
+        except (OSError, ValueError, TypeError):
+            logger.info("USERDATA: failed caching %s%s", filename, extension)
         return raw_coords, raw_dists, sector_index
     except FileNotFoundError:
         logger.info("MISSING: track map (%s) data", extension)
@@ -157,7 +251,24 @@ def save_track_map_file(
     dist_node.setAttribute("stroke-width", "0")
     dist_node.setAttribute("points", svg_dists)
     root_node.appendChild(dist_node)
-    # Save svg
-    with open(f"{filepath}{filename}{extension}", "w", encoding="utf-8") as svgfile:
-        new_svg.writexml(svgfile, indent="", addindent="\t", newl="\n", encoding="utf-8")
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    # Queue saving svg & binary cache
+    svgfile = io.StringIO()
+    new_svg.writexml(svgfile, indent="", addindent="\t", newl="\n", encoding="utf-8")
+    filename_full = f"{filepath}{filename}{extension}"
+    wqueue.submit(
+        filename_full, write_track_map_files, filename_full, svgfile.getvalue().encode("utf-8"),
+        tuple(raw_coords), tuple(raw_dists), tuple(sector_index))
+
+
+def write_track_map_files(
+    filename_full: str, data: bytes, raw_coords: tuple, raw_dists: tuple, sector_index: tuple
+) -> None:
+    """Write track map file & binary cache (run in write queue)"""
+    write_file_atomic(filename_full, data)
+    logger.info("USERDATA: %s saved", os.path.basename(filename_full))
+    try:
+        save_track_map_cache(
+            f"{filename_full}{FileExt.BIN}", os.stat(filename_full),
+            raw_coords, raw_dists, sector_index)
+    except (OSError, ValueError, TypeError):
+        logger.info("USERDATA: failed caching %s", os.path.basename(filename_full))
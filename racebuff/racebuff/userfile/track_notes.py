@@ -25,11 +25,15 @@ from __future__ import annotations
 import csv
 import logging
 import os
+import sys
+from array import array
 from operator import itemgetter
+from struct import Struct
 from typing import Any, Callable, Iterable
 
 from ..const_common import CRLF
-from ..const_file import FileFilter
+from ..const_file import FileExt, FileFilter
+from .write_queue import unpack_header, write_file_atomic
 
 NOTESTYPE_PACE = "Pace Notes"
 NOTESTYPE_TRACK = "Track Notes"
@@ -44,6 +48,14 @@ HEADER_TRACK_NOTES = COLUMN_DISTANCE, COLUMN_TRACKNOTE, COLUMN_COMMENT
 
 METADATA_FIELDNAMES = "TITLE", "AUTHOR", "DATE", "DESCRIPTION"
 
+# Binary notes index header: magic, version, text columns, notes file modified time (ns),
+# notes file size, notes count, lookup count, lookup resolution, text table size
+NOTES_INDEX_MAGIC = b"RBNI"
+NOTES_INDEX_VERSION = 1
+NOTES_INDEX_HEADER = Struct("<4sHHqqIIdI")
+NOTES_INDEX_RESOLUTION = 5.0  # meters per next note lookup slot
+NOTES_INDEX_MAX_LOOKUP = 65536  # limit lookup table size for very long stage
+
 logger = logging.getLogger(__name__)
 
 
@@ -167,6 +179,184 @@ def parse_csv_notes_only(notes_file: Iterable[str], table_header: tuple[str, ...
     return sorted(lastlist, key=itemgetter(column_key))
 
 
+class NotesIndex:
+    """Compiled notes index
+
+    Attributes:
+        header: notes table header, first column is distance.
+        distances: sorted notes distance array.
+        text_index: text table index of each note text column (row major).
+        texts: interned text table.
+        lookup: last note index at start of each lookup slot, -1 if before first note.
+        resolution: lookup slot size in meters.
+    """
+
+    __slots__ = (
+        "header",
+        "distances",
+        "text_index",
+        "texts",
+        "lookup",
+        "resolution",
+        "_columns",
+    )
+
+    def __init__(
+        self, header: tuple[str, ...], distances: array, text_index: array,
+        texts: tuple[str, ...], lookup: array, resolution: float):
+        self.header = header
+        self.distances = distances
+        self.text_index = text_index
+        self.texts = texts
+        self.lookup = lookup
+        self.resolution = resolution
+        self._columns = len(header) - 1
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def index_at(self, position: float) -> int:
+        """Find last note index at position, -1 if before first note"""
+        distances = self.distances
+        if position < distances[0]:
+            return -1
+        if position < 0:  # negative distance, before first lookup slot
+            index = 0
+        else:
+            index = self.lookup[min(int(position / self.resolution), len(self.lookup) - 1)]
+        end_index = len(distances) - 1
+        while index < end_index and distances[index + 1] <= position:
+            index += 1
+        return index
+
+    def note(self, index: int) -> dict[str, float | str]:
+        """Get note line from index, negative index counts from end"""
+        columns = self._columns
+        if index < 0:
+            index += len(self.distances)
+        start = index * columns
+        texts = self.texts
+        note_line = {self.header[0]: self.distances[index]}
+        for column, text_index in enumerate(self.text_index[start:start + columns], 1):
+            note_line[self.header[column]] = texts[text_index]
+        return note_line
+
+
+def create_notes_lookup(distances: array, resolution: float) -> tuple[array, float]:
+    """Create next note lookup table from sorted notes distance"""
+    if distances[-1] > 0:
+        resolution = max(resolution, distances[-1] / (NOTES_INDEX_MAX_LOOKUP - 1))
+        total_slots = int(distances[-1] / resolution) + 1
+    else:
+        total_slots = 1
+    lookup = array("i", bytes(4 * total_slots))
+    index = -1
+    end_index = len(distances) - 1
+    for slot in range(total_slots):
+        slot_position = slot * resolution
+        while index < end_index and distances[index + 1] <= slot_position:
+            index += 1
+        lookup[slot] = index
+    return lookup, resolution
+
+
+def compile_notes(notes: list[dict], table_header: tuple[str, ...]) -> NotesIndex:
+    """Compile sorted notes list into notes index, with interned text table"""
+    text_table: dict[str, int] = {}
+    text_index = array("I")
+    distances = array("d", (note_line[table_header[0]] for note_line in notes))
+    for note_line in notes:
+        for column in table_header[1:]:
+            text = str(note_line.get(column, "")).replace("\0", "")
+            index = text_table.get(text)
+            if index is None:
+                index = text_table[text] = len(text_table)
+            text_index.append(index)
+    lookup, resolution = create_notes_lookup(distances, NOTES_INDEX_RESOLUTION)
+    return NotesIndex(table_header, distances, text_index, tuple(text_table), lookup, resolution)
+
+
+def load_notes_index_cache(
+    filename_full: str, notes_stat: os.stat_result, table_header: tuple[str, ...]) -> NotesIndex:
+    """Load binary notes index (*.bin), must match notes file modified time & size"""
+    with open(filename_full, "rb") as binfile:
+        data = binfile.read()
+    (magic, version, columns, modified, size, notes_count, lookup_count, resolution, text_size
+     ) = unpack_header(NOTES_INDEX_HEADER, data, "notes index")
+    text_start = NOTES_INDEX_HEADER.size + notes_count * (8 + 4 * columns) + lookup_count * 4
+    if (magic != NOTES_INDEX_MAGIC or version != NOTES_INDEX_VERSION
+        or columns != len(table_header) - 1 or notes_count < 1
+        or modified != notes_stat.st_mtime_ns or size != notes_stat.st_size
+        or text_start + text_size != len(data)):
+        raise ValueError("outdated notes index")
+    body = memoryview(data)
+    offset = NOTES_INDEX_HEADER.size
+    distances = array("d")
+    distances.frombytes(body[offset:offset + notes_count * 8])
+    offset += notes_count * 8
+    text_index = array("I")
+    text_index.frombytes(body[offset:offset + notes_count * columns * 4])
+    offset += notes_count * columns * 4
+    lookup = array("i")
+    lookup.frombytes(body[offset:text_start])
+    if sys.byteorder == "big":
+        distances.byteswap()
+        text_index.byteswap()
+        lookup.byteswap()
+    texts = tuple(map(sys.intern, str(body[text_start:], "utf-8").split("\0")))
+    if max(text_index) >= len(texts):
+        raise ValueError("invalid notes index")
+    return NotesIndex(table_header, distances, text_index, texts, lookup, resolution)
+
+
+def save_notes_index_cache(
+    filename_full: str, notes_stat: os.stat_result, notes_index: NotesIndex) -> None:
+    """Save binary notes index (*.bin)"""
+    arrays = [array(values.typecode, values) for values in (
+        notes_index.distances, notes_index.text_index, notes_index.lookup)]
+    if sys.byteorder == "big":
+        for values in arrays:
+            values.byteswap()
+    text_table = "\0".join(notes_index.texts).encode("utf-8")
+    header = NOTES_INDEX_HEADER.pack(
+        NOTES_INDEX_MAGIC, NOTES_INDEX_VERSION, len(notes_index.header) - 1,
+        notes_stat.st_mtime_ns, notes_stat.st_size, len(notes_index.distances),
+        len(notes_index.lookup), notes_index.resolution, len(text_table))
+    write_file_atomic(filename_full, b"".join((header, *(values.tobytes() for values in arrays), text_table)))
+
+
+def load_notes_index(
+    filepath: str, filename: str, table_header: tuple[str, ...],
+    parser: Callable = parse_csv_notes_only, extension: str = "") -> NotesIndex | None:
+    """Load compiled notes index
+
+    Load from binary notes index (*.bin) if matches notes file,
+    otherwise parse notes file and create new notes index.
+    """
+    filename_full = f"{filepath}{filename}{extension}"
+    filename_cache = f"{filename_full}{FileExt.BIN}"
+    try:
+        notes_stat = os.stat(filename_full)
+        try:
+            return load_notes_index_cache(filename_cache, notes_stat, table_header)
+        except (OSError, ValueError, TypeError, UnicodeDecodeError):
+            pass
+        notes = load_notes_file(filepath, filename, table_header, parser, extension)
+        if not notes:
+            return None
+        notes_index = compile_notes(notes, table_header)
+        try:
+            save_notes_index_cache(filename_cache, notes_stat, notes_index)
+        except (OSError, ValueError, TypeError):
+            logger.info("USERDATA: failed caching %s%s", filename, extension)
+        return notes_index
+    except FileNotFoundError:
+        logger.info("MISSING: track notes (%s) data", extension)
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError, OSError):
+        logger.info("MISSING: invalid track notes (%s) data", extension)
+    return None
+
+
 def load_notes_file(
     filepath: str, filename: str, table_header: tuple[str, ...],
     parser: Callable = parse_csv_notes, extension: str = ""):
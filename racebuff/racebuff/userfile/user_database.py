@@ -0,0 +1,294 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+User database function
+
+Optional SQLite (WAL mode) store for per-combo user data (delta best,
+fuel & energy delta, sector best, consumption history), which replaces
+per-combo files while enabled. Each record is keyed by combo name & kind
+(file extension), and stores same content as corresponding file.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import sqlite3
+import threading
+from struct import error as StructError
+from time import time
+from typing import Callable, Iterable, TextIO
+
+from ..const_file import FileExt
+from .write_queue import wqueue, write_file_atomic
+
+DATABASE_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+class UserDatabase:
+    """User database"""
+
+    __slots__ = (
+        "_lock",
+        "_connection",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether database is opened"""
+        return self._connection is not None
+
+    def open(self, filename_full: str) -> bool:
+        """Open (or create) database, returns true if newly created"""
+        if self._connection is not None:
+            return False
+        connection = sqlite3.connect(filename_full, check_same_thread=False, isolation_level=None)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS userdata ("
+                "combo TEXT NOT NULL, kind TEXT NOT NULL, data BLOB NOT NULL, modified REAL NOT NULL, "
+                "PRIMARY KEY (combo, kind)) WITHOUT ROWID"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS userdata_kind ON userdata (kind, combo)")
+            is_new = connection.execute("PRAGMA user_version").fetchone()[0] < DATABASE_VERSION
+        except BaseException:
+            connection.close()
+            raise
+        self._connection = connection
+        logger.info("ENABLED: user database")
+        return is_new
+
+    def close(self):
+        """Close database"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+                logger.info("DISABLED: user database")
+
+    def set_version(self):
+        """Mark database as up to date (imported)"""
+        with self._lock:
+            self._connection.execute(f"PRAGMA user_version={DATABASE_VERSION}")
+
+    def load(self, combo: str, kind: str) -> bytes | None:
+        """Load record data, None if not exist"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM userdata WHERE combo=? AND kind=?", (combo, kind)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def save(self, combo: str, kind: str, data: bytes):
+        """Save record data"""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO userdata VALUES (?, ?, ?, ?)",
+                (combo, kind, data, time()),
+            )
+
+    def delete(self, combo: str, kind: str) -> bool:
+        """Delete record, returns true if deleted"""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM userdata WHERE combo=? AND kind=?", (combo, kind))
+        return cursor.rowcount > 0
+
+    def contains(self, combo: str, kind: str) -> bool:
+        """Whether record exists"""
+        if self._connection is None:
+            return False
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM userdata WHERE combo=? AND kind=?", (combo, kind)
+            ).fetchone()
+        return row is not None
+
+    def import_records(self, records: Iterable[tuple[str, str, bytes, float]]) -> int:
+        """Import records in single transaction, existing records are kept unless older
+
+        Args:
+            records: (combo, kind, data, modified time) records.
+
+        Returns:
+            Number of imported records.
+        """
+        with self._lock:
+            connection = self._connection
+            total_before = connection.total_changes
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(
+                    "INSERT INTO userdata VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (combo, kind) DO UPDATE SET data=excluded.data, modified=excluded.modified "
+                    "WHERE excluded.modified > userdata.modified",
+                    records,
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return connection.total_changes - total_before
+
+
+def open_userdata_text(
+    filepath: str, filename: str, extension: str, use_database: bool = True
+) -> TextIO:
+    """Open user data text for reading, from user database if enabled, otherwise from file"""
+    if use_database and udb.enabled:
+        data = udb.load(filename, extension)
+        if data is None:
+            raise FileNotFoundError(f"{filename}{extension}")
+        return io.StringIO(data.decode("utf-8"), newline="")
+    return open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8")
+
+
+def save_userdata(filepath: str, filename: str, extension: str, data: bytes, suffix: str = "") -> None:
+    """Queue user data saving, to user database if enabled, otherwise to file
+
+    Args:
+        filepath: file path.
+        filename: file name (combo name).
+        extension: file extension (record kind).
+        data: file content.
+        suffix: extra file extension (such as binary file), not used by database.
+    """
+    if udb.enabled:
+        wqueue.submit((filename, extension), save_userdata_record, filename, extension, data)
+    else:
+        filename_full = f"{filepath}{filename}{extension}{suffix}"
+        wqueue.submit(filename_full, save_userdata_file, filename_full, data, f"{filename}{extension}{suffix}")
+
+
+def save_userdata_record(filename: str, extension: str, data: bytes) -> None:
+    """Save user data to user database (run in write queue)"""
+    if not udb.enabled:
+        logger.error("USERDATA: user database closed, %s%s not saved", filename, extension)
+        return
+    udb.save(filename, extension, data)
+    logger.info("USERDATA: %s%s saved", filename, extension)
+
+
+def save_userdata_file(filename_full: str, data: bytes, name: str) -> None:
+    """Save user data to file atomically (run in write queue)"""
+    write_file_atomic(filename_full, data)
+    logger.info("USERDATA: %s saved", name)
+
+
+def read_file_record(filepath: str, filename: str, extension: str) -> bytes:
+    """Read user data file content (for database import)"""
+    with open(f"{filepath}{filename}{extension}", "rb") as temp_file:
+        return temp_file.read()
+
+
+def scan_userdata_files(
+    filepath: str, extension: str, reader: Callable[[str, str, str], bytes | None]
+):
+    """Scan user data files by extension, yield (combo, kind, data, modified time) records
+
+    Args:
+        filepath: user data folder.
+        extension: file extension (also as record kind).
+        reader: function(filepath, filename, extension) that returns record data, None to skip.
+    """
+    try:
+        filenames = sorted(os.listdir(filepath))
+    except OSError:
+        return
+    filename_set = set(filenames)
+    binary_extension = f"{extension}{FileExt.BIN}"
+    for filename_full in filenames:
+        if filename_full.endswith(extension):
+            filename = filename_full[:-len(extension)]
+        elif filename_full.endswith(binary_extension):
+            filename = filename_full[:-len(binary_extension)]
+            if f"{filename}{extension}" in filename_set:
+                continue  # same record as legacy file
+        else:
+            continue
+        try:
+            data = reader(filepath, filename, extension)
+            modified = max(
+                os.path.getmtime(f"{filepath}{_filename}")
+                for _filename in (f"{filename}{extension}", f"{filename}{binary_extension}")
+                if _filename in filename_set
+            )
+        except (OSError, IndexError, KeyError, TypeError, ValueError, StructError):
+            logger.info("USERDATA: skipped importing invalid %s%s", filename, extension)
+            continue
+        if data is not None:
+            yield filename, extension, data, modified
+
+
+def export_userdata_records(
+    filename_full: str, targets: dict[str, tuple[str, str, Callable[[bytes], bytes] | None]]
+) -> int:
+    """Export user database records that are newer than user data files, run once after disabled
+
+    Database is marked as exported (not up to date), and is re-imported from files on next enabling.
+
+    Args:
+        filename_full: database full file name.
+        targets: file path, file suffix, data converter (optional) by record kind.
+
+    Returns:
+        Number of exported records.
+    """
+    if not os.path.exists(filename_full):
+        return 0
+    total_exported = 0
+    connection = sqlite3.connect(filename_full, isolation_level=None)
+    try:
+        if connection.execute("PRAGMA user_version").fetchone()[0] < DATABASE_VERSION:
+            return 0  # already exported
+        for combo, kind, data, modified in connection.execute(
+            "SELECT combo, kind, data, modified FROM userdata"):
+            target = targets.get(kind)
+            if target is None:
+                continue
+            filepath, suffix, converter = target
+            filename_target = f"{filepath}{combo}{kind}{suffix}"
+            try:
+                if os.path.getmtime(filename_target) >= modified:
+                    continue
+            except OSError:
+                pass
+            try:
+                write_file_atomic(filename_target, data if converter is None else converter(data))
+                total_exported += 1
+            except (OSError, IndexError, TypeError, ValueError):
+                logger.error("USERDATA: failed exporting %s%s", combo, kind)
+        connection.execute("PRAGMA user_version=0")
+    finally:
+        connection.close()
+    return total_exported
+
+
+udb = UserDatabase()
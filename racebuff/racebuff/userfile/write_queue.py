@@ -0,0 +1,153 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Write-behind queue function
+
+Queue user data writes to dedicated I/O thread, so that module loops never
+block on disk. Pending writes to same target (key) are coalesced, only
+latest write is kept. Writes run synchronously if queue is not running
+(such as in telemetry engine process or before startup).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from struct import Struct
+from typing import Callable
+
+from ..const_file import FileExt
+
+logger = logging.getLogger(__name__)
+
+
+def write_file_atomic(filename_full: str, data: bytes) -> None:
+    """Write file atomically, replace existing file after fully written"""
+    temp_filename = f"{filename_full}{FileExt.TMP}"
+    with open(temp_filename, "wb") as temp_file:
+        temp_file.write(data)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    os.replace(temp_filename, filename_full)
+
+
+def unpack_header(header: Struct, buffer, name: str) -> tuple:
+    """Unpack binary file header, raise ValueError if buffer is shorter than header
+
+    Args:
+        header: header struct.
+        buffer: bytes-like file data.
+        name: file type name for error message.
+    """
+    if len(buffer) < header.size:
+        raise ValueError(f"truncated {name} header")
+    return header.unpack_from(buffer, 0)
+
+
+class WriteQueue:
+    """Write-behind queue"""
+
+    __slots__ = (
+        "_stopped",
+        "_thread",
+        "_condition",
+        "_pending",
+        "_writing",
+    )
+
+    def __init__(self):
+        self._stopped = True
+        self._thread = None
+        self._condition = threading.Condition()
+        self._pending: dict[object, tuple[Callable, tuple]] = {}
+        self._writing = False
+
+    def enable(self):
+        """Enable write-behind queue"""
+        if self._stopped:
+            self._stopped = False
+            self._thread = threading.Thread(target=self.__writing, name="Write-Queue", daemon=True)
+            self._thread.start()
+            logger.info("ENABLED: write-behind queue")
+
+    def disable(self):
+        """Disable write-behind queue, and flush pending writes"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, key: object, task: Callable, *args):
+        """Submit write task
+
+        Args:
+            key: write target identifier (such as full file name),
+                replaces pending task with same key.
+            task: write function.
+            args: write function arguments, must not be modified after submit.
+        """
+        with self._condition:
+            # Keep queuing while flushing on stop, so that older pending write
+            # does not overwrite newer one
+            if not self._stopped or key in self._pending:
+                self._pending[key] = (task, args)
+                self._condition.notify_all()
+                return
+        self.__run(key, task, args)
+
+    def flush(self):
+        """Wait until all pending writes finished"""
+        with self._condition:
+            while (self._pending or self._writing) and self._thread is not None:
+                self._condition.wait()
+
+    def __writing(self):
+        """Run pending writes"""
+        condition = self._condition
+        pending = self._pending
+        while True:
+            with condition:
+                while not pending and not self._stopped:
+                    condition.wait()
+                if not pending:  # stopped & flushed
+                    break
+                key = next(iter(pending))
+                task, args = pending.pop(key)
+                self._writing = True
+            try:
+                self.__run(key, task, args)
+            finally:
+                with condition:
+                    self._writing = False
+                    condition.notify_all()
+        logger.info("DISABLED: write-behind queue")
+
+    @staticmethod
+    def __run(key: object, task: Callable, args: tuple):
+        """Run write task"""
+        try:
+            task(*args)
+        except Exception as error:  # keep queue running, such as sqlite3.Error, struct.error
+            logger.error("USERDATA: failed writing %s, %s", key, error)
+
+
+wqueue = WriteQueue()
@@ -28,8 +28,9 @@ import re
 import time
 from functools import wraps
 from math import isfinite
+from sys import intern
 from time import monotonic
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from .const_common import MAX_SECONDS
 from .const_file import FileExt
@@ -64,6 +65,29 @@ def bytes_to_str(bytestring: bytes | Any, char_encoding: str = "utf-8") -> str:
     return ""
 
 
+def cached_bytes_to_str(char_encoding: str = "utf-8", max_size: int = 1024) -> Callable[[bytes | Any], str]:
+    """Create cached bytes to string converter
+
+    Decoded strings are cached by raw bytes content (and interned),
+    so that unchanged names are only decoded once.
+    Cache is cleared if exceeded max size.
+    """
+    cache: dict[bytes, str] = {}
+
+    def converter(bytestring: bytes | Any) -> str:
+        if not isinstance(bytestring, bytes):
+            return ""
+        text = cache.get(bytestring)
+        if text is None:
+            if len(cache) >= max_size:
+                cache.clear()
+            text = cache[bytestring] = intern(
+                bytestring.decode(encoding=char_encoding, errors="replace").rstrip())
+        return text
+
+    return converter
+
+
 def is_allowed_filename(filename: str) -> bool:
     """Is allowed setting file name"""
     return re.search(CFG_INVALID_FILENAME, filename, flags=re.IGNORECASE) is None
@@ -24,7 +24,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from PySide2.QtCore import QBasicTimer, Qt, Slot
+from PySide2.QtCore import QBasicTimer, Qt, Signal, Slot
 from PySide2.QtGui import QFont, QFontMetrics, QPalette, QPixmap
 from PySide2.QtWidgets import QGridLayout, QLabel, QLayout, QMenu, QWidget
 
@@ -32,6 +32,7 @@ from .. import overlay_signal, realtime_state
 from .. import regex_pattern as rxp
 from ..const_app import APP_NAME
 from ..formatter import format_module_name
+from ..governor_control import gctrl
 from ..locale_i18n import tr
 from ..setting import Setting
 from ._common import ExLabel, FontMetrics, MousePosition
@@ -42,6 +43,8 @@ mousepos = MousePosition()  # single instance shared by all widgets
 class Overlay(QWidget):
     """Overlay window"""
 
+    rate_scaled = Signal(float)
+
     def __init__(self, config: Setting, widget_name: str):
         super().__init__()
         self.widget_name = widget_name
@@ -63,6 +66,7 @@ class Overlay(QWidget):
             self.wcfg["update_interval"],
             self.cfg.application["minimum_update_interval"],
         )
+        self._scaled_interval = self._update_interval
 
     def start(self):
         """Set initial widget state in orders, and start update"""
@@ -70,9 +74,11 @@ class Overlay(QWidget):
         self.__set_window_attributes()  # 1
         self.__set_window_flags()  # 2
         self.__toggle_timer(not realtime_state.active)
+        gctrl.register(self.widget_name, self, self._update_interval)
 
     def stop(self):
         """Stop and close widget"""
+        gctrl.unregister(self)
         self.__toggle_timer(True)
         self.__break_signal()
         self.unload_resource()
@@ -199,7 +205,18 @@ class Overlay(QWidget):
             self._update_timer.stop()
             self.post_update()
         else:
-            self._update_timer.start(self._update_interval, self)
+            self._update_timer.start(self._scaled_interval, self)
+
+    @Slot(float)  # type: ignore[operator]
+    def __update_rate_scale(self, scale: float):
+        """Update widget timer interval scale"""
+        self._scaled_interval = round(self._update_interval * scale)
+        if self._update_timer.isActive():
+            self._update_timer.start(self._scaled_interval, self)
+
+    def set_rate_scale(self, scale: float):
+        """Set update interval scale (from CPU usage governor), thread-safe"""
+        self.rate_scaled.emit(scale)
 
     def __connect_signal(self):
         """Connect overlay lock and hide signal"""
@@ -207,6 +224,7 @@ class Overlay(QWidget):
         overlay_signal.hidden.connect(self.setHidden)
         overlay_signal.paused.connect(self.__toggle_timer)
         overlay_signal.iconify.connect(self.__toggle_vr_compat)
+        self.rate_scaled.connect(self.__update_rate_scale)
 
     def __break_signal(self):
         """Disconnect overlay lock and hide signal"""
@@ -214,6 +232,7 @@ class Overlay(QWidget):
         overlay_signal.hidden.disconnect(self.setHidden)
         overlay_signal.paused.disconnect(self.__toggle_timer)
         overlay_signal.iconify.disconnect(self.__toggle_vr_compat)
+        self.rate_scaled.disconnect(self.__update_rate_scale)
 
     def closeEvent(self, event):
         """Ignore attempts to close via window Close button when VR compatibility enabled"""
@@ -46,8 +46,7 @@ class Realtime(Overlay):
         font_offset = self.calc_font_offset(font_m)
 
         # Config variable
-        self.laptime_source = f"lapTime{self.wcfg['deltabest_source']}"
-        self.delta_source = f"delta{self.wcfg['deltabest_source']}"
+        self.reference_name = self.wcfg["deltabest_source"].lower()
         bar_gap = self.wcfg["bar_gap"]
         padx = round(font_m.width * self.wcfg["bar_padding_horizontal"])
         pady = round(font_m.capital * self.wcfg["bar_padding_vertical"])
@@ -103,10 +102,10 @@ class Realtime(Overlay):
             self.new_lap = True
         else:
             if self.new_lap:
-                self.last_laptime = getattr(minfo.delta, self.laptime_source)
+                self.last_laptime = minfo.delta.references.laptime(self.reference_name)
                 self.new_lap = False
 
-            temp_best = getattr(minfo.delta, self.delta_source)
+            temp_best = minfo.delta.references.delta(self.reference_name)
 
         if self.delta_best != temp_best:
             self.delta_best = temp_best
@@ -24,6 +24,8 @@ from .. import calculation as calc
 from ..module_info import minfo
 from ._base import Overlay
 
+REFERENCE_NAMES = ("best", "session", "stint", "last")  # delta reference names in display order
+
 
 class Realtime(Overlay):
     """Draw widget"""
@@ -141,29 +143,23 @@ class Realtime(Overlay):
             )
 
         # Last data
-        self.last_laptimes = [0.0] * 4
+        self.last_laptimes = (0.0,) * len(REFERENCE_NAMES)
         self.new_lap = True
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        references = minfo.delta.references
         if minfo.delta.lapTimeCurrent < self.freeze_duration:
-            alltime_best = minfo.delta.lapTimeLast - self.last_laptimes[0]
-            session_best = minfo.delta.lapTimeLast - self.last_laptimes[1]
-            stint_best = minfo.delta.lapTimeLast - self.last_laptimes[2]
-            delta_last = minfo.delta.lapTimeLast - self.last_laptimes[3]
+            laptime_last = minfo.delta.lapTimeLast
+            alltime_best, session_best, stint_best, delta_last = (
+                laptime_last - laptime for laptime in self.last_laptimes)
             self.new_lap = True
         else:
             if self.new_lap:
-                self.last_laptimes[0] = minfo.delta.lapTimeBest
-                self.last_laptimes[1] = minfo.delta.lapTimeSession
-                self.last_laptimes[2] = minfo.delta.lapTimeStint
-                self.last_laptimes[3] = minfo.delta.lapTimeLast
+                self.last_laptimes = tuple(map(references.laptime, REFERENCE_NAMES))
                 self.new_lap = False
 
-            alltime_best = minfo.delta.deltaBest
-            session_best = minfo.delta.deltaSession
-            stint_best = minfo.delta.deltaStint
-            delta_last = minfo.delta.deltaLast
+            alltime_best, session_best, stint_best, delta_last = map(references.delta, REFERENCE_NAMES)
 
         # All time deltabest
         if self.wcfg["show_all_time_deltabest"]:
@@ -20,7 +20,6 @@
 Radar Widget
 """
 
-from itertools import islice
 from typing import NamedTuple
 
 from PySide2.QtCore import QRectF, Qt
@@ -304,36 +303,37 @@ class Realtime(Overlay):
         nearest_right = indicator.max_range_x
 
         # Draw opponent vehicle within radar range
-        for veh_info in islice(minfo.vehicles.dataSet, minfo.vehicles.totalVehicles):
-            if veh_info.isPlayer:
-                continue
-            # -x = left, +x = right, -y = ahead, +y = behind
-            raw_pos_x = veh_info.relativeRotatedPositionX
-            raw_pos_y = veh_info.relativeRotatedPositionY
-            if (self.vehicle_hide_range.behind > raw_pos_y > -self.vehicle_hide_range.ahead and
-                -self.vehicle_hide_range.side < raw_pos_x < self.vehicle_hide_range.side):
-
-                # Find nearest vehicle coordinates
-                if (self.wcfg["show_overlap_indicator"] and
-                    abs(raw_pos_x) < indicator.max_range_x and
-                    abs(raw_pos_y) < indicator.max_range_y):
-                    if -indicator.min_range_x > raw_pos_x > nearest_left:
-                        nearest_left = raw_pos_x
-                    if indicator.min_range_x < raw_pos_x < nearest_right:
-                        nearest_right = raw_pos_x
-
-                # Draw vehicle
-                self.brush_veh.setColor(self.color_lap_diff(veh_info))
-                painter.setBrush(self.brush_veh)
-                painter.translate(self.scale_veh_pos(raw_pos_x), self.scale_veh_pos(raw_pos_y))
-                if self.wcfg["show_vehicle_orientation"]:
-                    painter.rotate(calc.rad2deg(-veh_info.relativeOrientationRadians))
-                painter.drawRoundedRect(
-                    self.veh_shape,
-                    self.wcfg["vehicle_border_radius"],
-                    self.wcfg["vehicle_border_radius"]
-                )
-                painter.resetTransform()
+        # -x = left, +x = right, -y = ahead, +y = behind
+        columns = minfo.vehicles.columns
+        veh_data = minfo.vehicles.dataSet
+        hide_range = self.vehicle_hide_range
+        for index in minfo.vehicles.spatialIndex.within_rect(
+            -hide_range.side, -hide_range.ahead, hide_range.side, hide_range.behind):
+            veh_info = veh_data[index]
+            raw_pos_x = columns.relativeRotatedPositionX[index]
+            raw_pos_y = columns.relativeRotatedPositionY[index]
+
+            # Find nearest vehicle coordinates
+            if (self.wcfg["show_overlap_indicator"] and
+                abs(raw_pos_x) < indicator.max_range_x and
+                abs(raw_pos_y) < indicator.max_range_y):
+                if -indicator.min_range_x > raw_pos_x > nearest_left:
+                    nearest_left = raw_pos_x
+                if indicator.min_range_x < raw_pos_x < nearest_right:
+                    nearest_right = raw_pos_x
+
+            # Draw vehicle
+            self.brush_veh.setColor(self.color_lap_diff(veh_info))
+            painter.setBrush(self.brush_veh)
+            painter.translate(self.scale_veh_pos(raw_pos_x), self.scale_veh_pos(raw_pos_y))
+            if self.wcfg["show_vehicle_orientation"]:
+                painter.rotate(calc.rad2deg(-veh_info.relativeOrientationRadians))
+            painter.drawRoundedRect(
+                self.veh_shape,
+                self.wcfg["vehicle_border_radius"],
+                self.wcfg["vehicle_border_radius"]
+            )
+            painter.resetTransform()
 
         # Draw overlap indicator below vehicle shape
         if self.wcfg["show_overlap_indicator"]:
@@ -409,13 +409,10 @@ class Realtime(Overlay):
 
     def is_nearby(self):
         """Check nearby vehicles"""
-        for veh_info in islice(minfo.vehicles.dataSet, minfo.vehicles.totalVehicles):
-            # -x = left, +x = right, -y = ahead, +y = behind
-            if (not veh_info.isPlayer and
-                self.radar_hide_range.behind > veh_info.relativeRotatedPositionY > -self.radar_hide_range.ahead and
-                -self.radar_hide_range.side < veh_info.relativeRotatedPositionX < self.radar_hide_range.side):
-                return True
-        return False
+        # -x = left, +x = right, -y = ahead, +y = behind
+        hide_range = self.radar_hide_range
+        return bool(minfo.vehicles.spatialIndex.within_rect(
+            -hide_range.side, -hide_range.ahead, hide_range.side, hide_range.behind))
 
     def calc_indicator_dimension(self, veh_width, veh_length):
         """Calculate indicator dimension
@@ -437,7 +437,7 @@ class Realtime(Overlay):
         classes_list = minfo.relative.classes
         total_cls_idx = len(classes_list)
         player_idx = minfo.vehicles.playerIndex
-        plr_veh_info = minfo.vehicles.dataSet[player_idx]
+        columns = minfo.vehicles.columns
         in_race = api.read.session.in_race()
 
         if player_idx < total_cls_idx:
@@ -458,85 +458,83 @@ class Realtime(Overlay):
                 self.row_visible[idx] = False
                 state = 0
 
-            # Get vehicle dataset
-            veh_info = minfo.vehicles.dataSet[rvl_idx]
             # Driver position
             if self.wcfg["show_position"]:
-                self.update_pos(self.bars_pos[idx], veh_info.positionOverall, state)
+                self.update_pos(self.bars_pos[idx], columns.positionOverall[rvl_idx], state)
             # Driver position change
             if self.wcfg["show_position_change"]:
                 if self.wcfg["show_position_change_in_class"]:
-                    pos_diff = veh_info.qualifyInClass - veh_info.positionInClass
+                    pos_diff = columns.qualifyInClass[rvl_idx] - columns.positionInClass[rvl_idx]
                 else:
-                    pos_diff = veh_info.qualifyOverall - veh_info.positionOverall
+                    pos_diff = columns.qualifyOverall[rvl_idx] - columns.positionOverall[rvl_idx]
                 self.update_pgl(self.bars_pgl[idx], pos_diff, state)
             # Driver name
             if self.wcfg["show_driver_name"]:
-                self.update_drv(self.bars_drv[idx], veh_info.driverName, state)
+                self.update_drv(self.bars_drv[idx], columns.driverName[rvl_idx], state)
             # Vehicle name
             if self.wcfg["show_vehicle_name"]:
-                self.update_veh(self.bars_veh[idx], veh_info.vehicleName, state)
+                self.update_veh(self.bars_veh[idx], columns.vehicleName[rvl_idx], state)
             # Brand logo
             if self.wcfg["show_brand_logo"]:
-                self.update_brd(self.bars_brd[idx], veh_info.vehicleName, state)
+                self.update_brd(self.bars_brd[idx], columns.vehicleName[rvl_idx], state)
             # Time interval
             if self.wcfg["show_time_interval"]:
-                is_ahead = veh_info.positionOverall < plr_veh_info.positionOverall
+                is_ahead = columns.positionOverall[rvl_idx] < columns.positionOverall[player_idx]
                 if is_ahead:
-                    time_int = plr_veh_info.gapBehindNextInClass
+                    time_int = columns.gapBehindNextInClass[player_idx]
                 else:
-                    time_int = veh_info.gapBehindNextInClass
+                    time_int = columns.gapBehindNextInClass[rvl_idx]
                 self.update_int(self.bars_int[idx], time_int, is_ahead, state)
             # Vehicle laptime
             if self.wcfg["show_laptime"]:
-                if self.wcfg["show_pitstop_duration_while_requested_pitstop"] and plr_veh_info.pitRequested:
-                    laptime = self.set_pittime(veh_info.inPit, veh_info.pitTimer.elapsed)
+                if self.wcfg["show_pitstop_duration_while_requested_pitstop"] and columns.pitRequested[player_idx]:
+                    laptime = self.set_pittime(columns.inPit[rvl_idx], columns.pitTimer[rvl_idx].elapsed)
                 elif in_race or self.wcfg["show_best_laptime"]:
-                    if veh_info.pitTimer.pitting:
-                        laptime = self.set_pittime(veh_info.inPit, veh_info.pitTimer.elapsed)
+                    if columns.pitTimer[rvl_idx].pitting:
+                        laptime = self.set_pittime(columns.inPit[rvl_idx], columns.pitTimer[rvl_idx].elapsed)
                     else:
-                        laptime = self.set_laptime(veh_info.lastLapTime)
+                        laptime = self.set_laptime(columns.lastLapTime[rvl_idx])
                 else:
-                    laptime = self.set_laptime(veh_info.bestLapTime)
+                    laptime = self.set_laptime(columns.bestLapTime[rvl_idx])
                 self.update_lpt(self.bars_lpt[idx], laptime, state)
             # Vehicle best laptime
             if self.wcfg["show_best_laptime"]:
                 if in_race and self.wcfg["show_best_laptime_from_recent_laps_in_race"]:
-                    laptime = veh_info.lapTimeHistory.best()
+                    laptime = columns.lapTimeHistory[rvl_idx].best()
                 else:
-                    laptime = veh_info.bestLapTime
+                    laptime = columns.bestLapTime[rvl_idx]
                 self.update_blp(self.bars_blp[idx], laptime, state)
             # Position in class
             if self.wcfg["show_position_in_class"]:
-                self.update_pic(self.bars_pic[idx], veh_info.positionInClass, veh_info.vehicleClass, state)
+                self.update_pic(self.bars_pic[idx], columns.positionInClass[rvl_idx], columns.vehicleClass[rvl_idx], state)
             # Vehicle class
             if self.wcfg["show_class"]:
-                self.update_cls(self.bars_cls[idx], veh_info.vehicleClass, state)
+                self.update_cls(self.bars_cls[idx], columns.vehicleClass[rvl_idx], state)
             # Vehicle in pit
             if self.wcfg["show_pit_status"]:
-                self.update_pit(self.bars_pit[idx], veh_info.inPit, veh_info.isYellow, state)
+                self.update_pit(self.bars_pit[idx], columns.inPit[rvl_idx], columns.isYellow[rvl_idx], state)
             # Tyre compound index
             if self.wcfg["show_tyre_compound"]:
-                self.update_tcp(self.bars_tcp[idx], veh_info.tireCompoundFront, veh_info.tireCompoundRear, state)
+                self.update_tcp(self.bars_tcp[idx], columns.tireCompoundFront[rvl_idx], columns.tireCompoundRear[rvl_idx], state)
             # Pitstop count
             if self.wcfg["show_pitstop_count"]:
-                self.update_psc(self.bars_psc[idx], veh_info.numPitStops, veh_info.pitRequested, state)
+                self.update_psc(self.bars_psc[idx], columns.numPitStops[rvl_idx], columns.pitRequested[rvl_idx], state)
             # Delta laptime
             if self.wcfg["show_delta_laptime"]:
-                delta_laptime = tuple(veh_info.lapTimeHistory.delta(plr_veh_info.lapTimeHistory, self.max_delta))
+                delta_laptime = tuple(columns.lapTimeHistory[rvl_idx].delta(columns.lapTimeHistory[player_idx], self.max_delta))
                 self.update_dlt(self.bars_dlt[idx], delta_laptime, state)
             # Remaining energy
             if self.wcfg["show_energy_remaining"]:
-                self.update_nrg(self.bars_nrg[idx], veh_info.energyRemaining, state)
+                self.update_nrg(self.bars_nrg[idx], columns.energyRemaining[rvl_idx], state)
             # Vehicle integrity
             if self.wcfg["show_vehicle_integrity"]:
-                self.update_dmg(self.bars_dmg[idx], veh_info.vehicleIntegrity, state)
+                self.update_dmg(self.bars_dmg[idx], columns.vehicleIntegrity[rvl_idx], state)
             # Stint laps
             if self.wcfg["show_stint_laps"]:
-                self.update_stl(self.bars_stl[idx], veh_info.currentStintLaps, veh_info.estimatedStintLaps, state)
+                self.update_stl(self.bars_stl[idx], columns.currentStintLaps[rvl_idx], columns.estimatedStintLaps[rvl_idx], state)
             # Speed trap
             if self.wcfg["show_speed_trap"]:
-                self.update_spd(self.bars_spd[idx], veh_info.speedTrap.speed, state)
+                self.update_spd(self.bars_spd[idx], columns.speedTrap[rvl_idx].speed, state)
 
     # GUI update methods
     def update_pos(self, target, *data):
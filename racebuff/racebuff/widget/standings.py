@@ -535,7 +535,7 @@ class Realtime(Overlay):
         standings_list = minfo.relative.standings
         total_std_idx = len(standings_list) - 1  # skip final -1 index
         player_idx = minfo.vehicles.playerIndex
-        plr_veh_info = minfo.vehicles.dataSet[player_idx]
+        columns = minfo.vehicles.columns
         in_race = api.read.session.in_race()
 
         # Standings update
@@ -556,103 +556,101 @@ class Realtime(Overlay):
                 self.row_visible[idx] = False
                 state = 2
 
-            # Get vehicle dataset
-            veh_info = minfo.vehicles.dataSet[std_idx]
             # Highlighted player
-            hi_player = self.wcfg["show_player_highlighted"] and veh_info.isPlayer
+            hi_player = self.wcfg["show_player_highlighted"] and columns.isPlayer[std_idx]
             # Driver position
             if self.wcfg["show_position"]:
-                self.update_pos(self.bars_pos[idx], veh_info.positionOverall, hi_player, state)
+                self.update_pos(self.bars_pos[idx], columns.positionOverall[std_idx], hi_player, state)
             # Driver position change
             if self.wcfg["show_position_change"]:
                 if self.wcfg["show_position_change_in_class"]:
-                    pos_diff = veh_info.qualifyInClass - veh_info.positionInClass
+                    pos_diff = columns.qualifyInClass[std_idx] - columns.positionInClass[std_idx]
                 else:
-                    pos_diff = veh_info.qualifyOverall - veh_info.positionOverall
+                    pos_diff = columns.qualifyOverall[std_idx] - columns.positionOverall[std_idx]
                 self.update_pgl(self.bars_pgl[idx], pos_diff, hi_player, state)
             # Driver name
             if self.wcfg["show_driver_name"]:
-                self.update_drv(self.bars_drv[idx], veh_info.driverName, hi_player, state)
+                self.update_drv(self.bars_drv[idx], columns.driverName[std_idx], hi_player, state)
             # Vehicle name
             if self.wcfg["show_vehicle_name"]:
-                self.update_veh(self.bars_veh[idx], veh_info.vehicleName, hi_player, state)
+                self.update_veh(self.bars_veh[idx], columns.vehicleName[std_idx], hi_player, state)
             # Brand logo
             if self.wcfg["show_brand_logo"]:
-                self.update_brd(self.bars_brd[idx], veh_info.vehicleName, hi_player, state)
+                self.update_brd(self.bars_brd[idx], columns.vehicleName[std_idx], hi_player, state)
             # Time gap
             if self.wcfg["show_time_gap"]:
                 if in_race:
                     if self.show_class_timegap:
-                        time_gap = self.gap_to_leader_race(veh_info.gapBehindLeaderInClass, veh_info.positionInClass)
+                        time_gap = self.gap_to_leader_race(columns.gapBehindLeaderInClass[std_idx], columns.positionInClass[std_idx])
                     else:
-                        time_gap = self.gap_to_leader_race(veh_info.gapBehindLeader, veh_info.positionOverall)
+                        time_gap = self.gap_to_leader_race(columns.gapBehindLeader[std_idx], columns.positionOverall[std_idx])
                 else:
                     if self.show_class_timegap:
-                        time_gap = self.gap_to_leader_best(veh_info.bestLapTime, veh_info.classBestLapTime)
+                        time_gap = self.gap_to_leader_best(columns.bestLapTime[std_idx], columns.classBestLapTime[std_idx])
                     else:
-                        time_gap = self.gap_to_leader_best(veh_info.bestLapTime, minfo.vehicles.leaderBestLapTime)
+                        time_gap = self.gap_to_leader_best(columns.bestLapTime[std_idx], minfo.vehicles.leaderBestLapTime)
                 self.update_gap(self.bars_gap[idx], time_gap, hi_player, state)
             # Time interval
             if self.wcfg["show_time_interval"]:
                 if self.show_class_interval:
-                    time_int = (veh_info.positionInClass, veh_info.gapBehindNextInClass)
+                    time_int = (columns.positionInClass[std_idx], columns.gapBehindNextInClass[std_idx])
                 else:
-                    time_int = (veh_info.positionOverall, veh_info.gapBehindNext)
+                    time_int = (columns.positionOverall[std_idx], columns.gapBehindNext[std_idx])
                 self.update_int(self.bars_int[idx], time_int, hi_player, state)
             # Vehicle laptime
             if self.wcfg["show_laptime"]:
-                if self.wcfg["show_pitstop_duration_while_requested_pitstop"] and plr_veh_info.pitRequested:
-                    laptime = self.set_pittime(veh_info.inPit, veh_info.pitTimer.elapsed)
+                if self.wcfg["show_pitstop_duration_while_requested_pitstop"] and columns.pitRequested[player_idx]:
+                    laptime = self.set_pittime(columns.inPit[std_idx], columns.pitTimer[std_idx].elapsed)
                     is_class_best = False
                 elif in_race or self.wcfg["show_best_laptime"]:
-                    if veh_info.pitTimer.pitting:
-                        laptime = self.set_pittime(veh_info.inPit, veh_info.pitTimer.elapsed)
+                    if columns.pitTimer[std_idx].pitting:
+                        laptime = self.set_pittime(columns.inPit[std_idx], columns.pitTimer[std_idx].elapsed)
                         is_class_best = False
                     else:
-                        laptime = self.set_laptime(veh_info.lastLapTime)
-                        is_class_best = veh_info.isClassFastestLastLap
+                        laptime = self.set_laptime(columns.lastLapTime[std_idx])
+                        is_class_best = columns.isClassFastestLastLap[std_idx]
                 else:
-                    laptime = self.set_laptime(veh_info.bestLapTime)
+                    laptime = self.set_laptime(columns.bestLapTime[std_idx])
                     is_class_best = False
                 self.update_lpt(self.bars_lpt[idx], laptime, is_class_best, hi_player, state)
             # Vehicle best laptime
             if self.wcfg["show_best_laptime"]:
                 if in_race and self.wcfg["show_best_laptime_from_recent_laps_in_race"]:
-                    laptime = veh_info.lapTimeHistory.best()
+                    laptime = columns.lapTimeHistory[std_idx].best()
                 else:
-                    laptime = veh_info.bestLapTime
+                    laptime = columns.bestLapTime[std_idx]
                 self.update_blp(self.bars_blp[idx], laptime, hi_player, state)
             # Position in class
             if self.wcfg["show_position_in_class"]:
-                self.update_pic(self.bars_pic[idx], veh_info.positionInClass, veh_info.vehicleClass, hi_player, state)
+                self.update_pic(self.bars_pic[idx], columns.positionInClass[std_idx], columns.vehicleClass[std_idx], hi_player, state)
             # Vehicle class
             if self.wcfg["show_class"]:
-                self.update_cls(self.bars_cls[idx], veh_info.vehicleClass, state)
+                self.update_cls(self.bars_cls[idx], columns.vehicleClass[std_idx], state)
             # Vehicle in pit
             if self.wcfg["show_pit_status"]:
-                self.update_pit(self.bars_pit[idx], veh_info.inPit, veh_info.isYellow, state)
+                self.update_pit(self.bars_pit[idx], columns.inPit[std_idx], columns.isYellow[std_idx], state)
             # Tyre compound index
             if self.wcfg["show_tyre_compound"]:
-                self.update_tcp(self.bars_tcp[idx], veh_info.tireCompoundFront, veh_info.tireCompoundRear, hi_player, state)
+                self.update_tcp(self.bars_tcp[idx], columns.tireCompoundFront[std_idx], columns.tireCompoundRear[std_idx], hi_player, state)
             # Pitstop count
             if self.wcfg["show_pitstop_count"]:
-                self.update_psc(self.bars_psc[idx], veh_info.numPitStops, veh_info.pitRequested, hi_player, state)
+                self.update_psc(self.bars_psc[idx], columns.numPitStops[std_idx], columns.pitRequested[std_idx], hi_player, state)
             # Delta laptime
             if self.wcfg["show_delta_laptime"]:
-                delta_laptime = tuple(veh_info.lapTimeHistory.delta(plr_veh_info.lapTimeHistory, self.max_delta))
+                delta_laptime = tuple(columns.lapTimeHistory[std_idx].delta(columns.lapTimeHistory[player_idx], self.max_delta))
                 self.update_dlt(self.bars_dlt[idx], delta_laptime, hi_player, state)
             # Remaining energy
             if self.wcfg["show_energy_remaining"]:
-                self.update_nrg(self.bars_nrg[idx], veh_info.energyRemaining, hi_player, state)
+                self.update_nrg(self.bars_nrg[idx], columns.energyRemaining[std_idx], hi_player, state)
             # Vehicle integrity
             if self.wcfg["show_vehicle_integrity"]:
-                self.update_dmg(self.bars_dmg[idx], veh_info.vehicleIntegrity, hi_player, state)
+                self.update_dmg(self.bars_dmg[idx], columns.vehicleIntegrity[std_idx], hi_player, state)
             # Stint laps
             if self.wcfg["show_stint_laps"]:
-                self.update_stl(self.bars_stl[idx], veh_info.currentStintLaps, veh_info.estimatedStintLaps, hi_player, state)
+                self.update_stl(self.bars_stl[idx], columns.currentStintLaps[std_idx], columns.estimatedStintLaps[std_idx], hi_player, state)
             # Speed trap
             if self.wcfg["show_speed_trap"]:
-                self.update_spd(self.bars_spd[idx], veh_info.speedTrap.speed, hi_player, state)
+                self.update_spd(self.bars_spd[idx], columns.speedTrap[std_idx].speed, hi_player, state)
 
     # GUI update methods
     def update_pos(self, target, *data):
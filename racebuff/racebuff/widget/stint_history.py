@@ -187,10 +187,17 @@ class Realtime(Overlay):
         # 0 - tyre compound, 1 - total laps, 2 - total time, 3 - total fuel, 4 - total tyre wear
         self.stint_data = ["--",0,0,0,0]
         self.history_data = deque([tuple(self.stint_data) for _ in range(stint_slot)], stint_slot)
+        self.last_data_name = ""
         self.update_stint_history()
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        # Load recorded stints once per track & vehicle
+        if (self.wcfg["show_recorded_stint_history"]
+            and self.last_data_name != minfo.history.consumptionDataName):
+            self.last_data_name = minfo.history.consumptionDataName
+            self.load_recorded_stint_history()
+
         # Read stint data
         lap_num = api.read.lap.number()
         time_curr = api.read.session.elapsed()
@@ -284,6 +291,21 @@ class Realtime(Overlay):
             target.last = data
             target.setText(f"{data:02.0f}%"[:3])
 
+    def load_recorded_stint_history(self):
+        """Load recorded stints from consumption history"""
+        if any(data[2] for data in self.history_data):  # keep stints from current session
+            return
+        is_energy = bool(self.wcfg["show_virtual_energy_if_available"] and api.read.vehicle.max_virtual_energy())
+        recorded_stints = [
+            ("--", laps, laptime, energy if is_energy else self.unit_fuel(fuel), wear)
+            for _, laps, laptime, fuel, energy, wear in minfo.history.consumptionDataSet.stint_summary()
+            if laptime >= self.minimum_stint_seconds
+        ]
+        for stint_data in reversed(recorded_stints[:self.history_data.maxlen]):
+            self.history_data.appendleft(stint_data)
+        if recorded_stints:
+            self.update_stint_history()
+
     def update_stint_history(self, new_stint_data=None):
         """Stint history data"""
         if new_stint_data:
@@ -94,9 +94,16 @@ class Realtime(Overlay):
             self.pit_text_shape = QRectF(-veh_size_base * 0.5 - 2, font_offset - veh_size_opt * 0.5 - veh_size_base - 3, veh_size_base + 4, veh_size_base)
 
         if self.wcfg["show_proximity_circle"]:
-            self.pen_proximity = self.set_veh_pen_style(
-                self.wcfg["proximity_circle_color"],
-                self.wcfg["proximity_circle_width"],
+            self.proximity_radius = max(self.wcfg["proximity_circle_radius"], 1)
+            self.pen_proximity = (
+                self.set_veh_pen_style(
+                    self.wcfg["proximity_circle_color"],
+                    self.wcfg["proximity_circle_width"],
+                ),
+                self.set_veh_pen_style(
+                    self.wcfg["proximity_circle_color_nearby"],
+                    self.wcfg["proximity_circle_width"],
+                ),
             )
             self.rect_proximity = QRectF()
 
@@ -336,7 +343,7 @@ class Realtime(Overlay):
             if data.isPlayer:
                 painter.drawEllipse(self.veh_shape_player)
                 if self.wcfg["show_proximity_circle"]:
-                    painter.setPen(self.pen_proximity)
+                    painter.setPen(self.pen_proximity[self.is_nearby()])
                     painter.setBrush(Qt.NoBrush)
                     painter.drawEllipse(self.rect_proximity)
             else:
@@ -465,12 +472,15 @@ class Realtime(Overlay):
 
     def update_proximity_rect(self):
         """Update proximity circle rect"""
-        proxi_radius = max(self.wcfg["proximity_circle_radius"], 1)
-        proxi_x = -proxi_radius * self.map_scale
-        proxi_y = proxi_radius * 2 * self.map_scale
+        proxi_x = -self.proximity_radius * self.map_scale
+        proxi_y = self.proximity_radius * 2 * self.map_scale
         self.rect_proximity.setRect(proxi_x, proxi_x, proxi_y, proxi_y)
 
     # Additional methods
+    def is_nearby(self) -> bool:
+        """Check opponents within proximity circle"""
+        return bool(minfo.vehicles.spatialIndex.within_radius(self.proximity_radius))
+
     def outline_vehicle(self, veh_info):
         """Set vehicle outline"""
         if veh_info.isPlayer:
@@ -23,6 +23,7 @@ Run program
 """
 
 import argparse
+import multiprocessing
 import os
 import sys
 
@@ -97,7 +98,15 @@ def override_module(original: str, override: str):
     sys.modules[original] = __import__(override, fromlist=[override])
 
 
+if __name__ == "__mp_main__":  # spawned telemetry engine process (run as script)
+    override_pyside_version(int(os.getenv("PYSIDE_OVERRIDE", "2")))
+
 if __name__ == "__main__":
+    # Spawned telemetry engine process (run as exe) inherits PySide version from parent
+    if "--multiprocessing-fork" in sys.argv:
+        override_pyside_version(int(os.getenv("PYSIDE_OVERRIDE", "2")))
+    multiprocessing.freeze_support()
+
     os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
 
     # Load command line arguments
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Vehicles module benchmark
+
+Time vehicles module update (update_vehicle_data) against mock API fleet
+at 20/60/128 vehicles. Run from repository root:
+
+    python tools/benchmark_vehicles.py
+
+Compare with another version of vehicles module, such as before a change:
+
+    git show <rev>:racebuff/module/module_vehicles.py > /tmp/module_vehicles_old.py
+    python tools/benchmark_vehicles.py --compare /tmp/module_vehicles_old.py
+
+In compare mode, vehicle data columns of both versions are also checked for equality.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_api import MockFleet, create_mock_api  # noqa: E402
+
+from racebuff.setting import cfg  # noqa: E402
+
+# Use default setting (read only), without loading or creating user preset files
+cfg.user.config = cfg.default.config
+cfg.user.setting = cfg.default.setting
+
+from racebuff.module import module_vehicles  # noqa: E402
+from racebuff.module_info import VehicleColumns, VehiclesInfo, minfo  # noqa: E402
+
+
+def get_cli_argument() -> argparse.Namespace:
+    """Get command line argument"""
+    parse = argparse.ArgumentParser(
+        description="Vehicles module benchmark",
+    )
+    parse.add_argument(
+        "-v",
+        "--vehicles",
+        type=int,
+        nargs="+",
+        default=(20, 60, 128),
+        help="number of vehicles to benchmark (default: 20 60 128)",
+    )
+    parse.add_argument(
+        "-n",
+        "--calls",
+        type=int,
+        default=50,
+        help="update calls per sample (default: 50)",
+    )
+    parse.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=30,
+        help="number of samples, best sample is reported (default: 30)",
+    )
+    parse.add_argument(
+        "--low-priority",
+        action="store_true",
+        help="include low priority update in every call",
+    )
+    parse.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="another version of module_vehicles.py to compare with",
+    )
+    return parse.parse_args()
+
+
+def load_module_file(filename: str):
+    """Load vehicles module from file, as part of racebuff.module package"""
+    spec = importlib.util.spec_from_file_location("racebuff.module._compare_vehicles", filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def setup_fleet(module, total_vehicles: int) -> tuple[MockFleet, VehiclesInfo]:
+    """Setup mock fleet for vehicles module, return fleet & output"""
+    fleet = MockFleet(total_vehicles)
+    module.api = create_mock_api(fleet)
+    output = VehiclesInfo()
+    output.totalVehicles = total_vehicles
+    return fleet, output
+
+
+def run_update(module, fleet: MockFleet, output: VehiclesInfo, calls: int, low_priority: bool) -> float:
+    """Run update calls, return total update time (seconds)"""
+    update = module.update_vehicle_data
+    total_time = 0.0
+    for _ in range(calls):
+        fleet.step()
+        start_time = perf_counter()
+        update(output, 1, 1, low_priority)
+        total_time += perf_counter() - start_time
+    return total_time
+
+
+def benchmark(modules: dict, total_vehicles: int, calls: int, repeat: int, low_priority: bool) -> dict:
+    """Benchmark modules at number of vehicles, return best time per update (microseconds)"""
+    minfo.mapping.speedTrapPosition = 0.0
+    minfo.relative.classes = [[0, 1, "", 0.0, -1, 0.0, -1, False]] * total_vehicles
+    setups = {name: setup_fleet(module, total_vehicles) for name, module in modules.items()}
+    best = dict.fromkeys(modules, float("inf"))
+    for _ in range(repeat):
+        # Interleave modules, so that system noise affects all equally
+        for name, module in modules.items():
+            fleet, output = setups[name]
+            sample = run_update(module, fleet, output, calls, low_priority) / calls * 1e6
+            best[name] = min(best[name], sample)
+    return best
+
+
+def column_values(output: VehiclesInfo) -> list:
+    """Vehicle data column values for equality check (nested objects excluded)"""
+    total_vehicles = output.totalVehicles
+    values = []
+    for name in VehicleColumns.__slots__:
+        column = getattr(output.columns, name)
+        if hasattr(column[0], "__slots__"):
+            continue
+        values.append(list(column[:total_vehicles]))
+    values.append(output.nearestLine)
+    values.append(output.playerIndex)
+    return values
+
+
+def check_equal(modules: dict, total_vehicles: int) -> bool:
+    """Check vehicle data columns of all modules are equal after same updates"""
+    minfo.relative.classes = [[0, 1, "", 0.0, -1, 0.0, -1, False]] * total_vehicles
+    results = []
+    for module in modules.values():
+        fleet, output = setup_fleet(module, total_vehicles)
+        run_update(module, fleet, output, 5, True)
+        results.append(column_values(output))
+    return all(result == results[0] for result in results)
+
+
+def main():
+    """Run benchmark"""
+    cli_args = get_cli_argument()
+    modules = {"current": module_vehicles}
+    if cli_args.compare:
+        modules = {"compare": load_module_file(cli_args.compare), **modules}
+
+    print(f"update_vehicle_data, best of {cli_args.repeat} x {cli_args.calls} calls"
+          f"{', low priority' if cli_args.low_priority else ''}")
+    print(f"{'vehicles':>8}" + "".join(f"{name:>12}" for name in modules))
+    for total_vehicles in cli_args.vehicles:
+        best = benchmark(modules, total_vehicles, cli_args.calls, cli_args.repeat, cli_args.low_priority)
+        print(f"{total_vehicles:>8}" + "".join(f"{best[name]:>10.0f}us" for name in modules))
+
+    if cli_args.compare:
+        print(f"equal output: {check_equal(modules, 40)}")
+
+
+if __name__ == "__main__":
+    main()
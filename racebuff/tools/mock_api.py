@@ -0,0 +1,252 @@
+#  RaceBuff is an open-source overlay application for racing simulation.
+#  Copyright (C) 2026 RaceBuff developers, see contributors.md file
+#
+#  This file is part of RaceBuff.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Mock API reader for benchmark
+
+Simulated fleet of vehicles driving around a circular track, exposed through
+the same reader methods (api.read.lap, vehicle, timing, session, tyre) that
+vehicles module reads from game API. Index None = local player (index 0).
+"""
+
+from __future__ import annotations
+
+import random
+from math import cos, pi, sin
+from types import SimpleNamespace
+
+TRACK_LENGTH = 5000.0
+TRACK_RADIUS = TRACK_LENGTH / (2 * pi)
+CLASS_NAMES = ("Hypercar", "LMP2", "GT3")
+
+
+class MockVehicle:
+    """Simulated vehicle state"""
+
+    __slots__ = (
+        "slot_id",
+        "laps",
+        "distance",
+        "speed",
+        "in_pit",
+        "lap_start",
+        "class_name",
+    )
+
+    def __init__(self, slot_id: int, rng: random.Random):
+        self.slot_id = slot_id
+        self.laps = rng.randint(1, 5)
+        self.distance = rng.uniform(0, TRACK_LENGTH)
+        self.speed = rng.uniform(40, 80)
+        self.in_pit = int(rng.random() < 0.1)
+        self.lap_start = 0.0
+        self.class_name = CLASS_NAMES[slot_id % len(CLASS_NAMES)]
+
+
+class MockFleet:
+    """Simulated fleet, advanced by step()
+
+    Args:
+        total_vehicles: number of vehicles.
+        seed: random seed, same seed creates same fleet.
+    """
+
+    __slots__ = (
+        "vehicles",
+        "session_time",
+    )
+
+    def __init__(self, total_vehicles: int, seed: int = 1):
+        rng = random.Random(seed)
+        self.vehicles = tuple(MockVehicle(index, rng) for index in range(total_vehicles))
+        self.session_time = 0.0
+
+    def step(self, delta_time: float = 0.01):
+        """Advance session time & vehicle position"""
+        self.session_time += delta_time
+        for veh in self.vehicles:
+            if veh.in_pit:
+                continue
+            veh.distance += veh.speed * delta_time
+            if veh.distance >= TRACK_LENGTH:
+                veh.distance -= TRACK_LENGTH
+                veh.laps += 1
+                veh.lap_start = self.session_time
+
+    def veh(self, index: int | None) -> MockVehicle:
+        """Vehicle by index, None = local player"""
+        return self.vehicles[0 if index is None else index]
+
+
+class MockLap:
+    """Lap reader"""
+
+    __slots__ = ("_fleet",)
+
+    def __init__(self, fleet: MockFleet):
+        self._fleet = fleet
+
+    def track_length(self) -> float:
+        return TRACK_LENGTH
+
+    def completed_laps(self, index: int | None = None) -> int:
+        return self._fleet.veh(index).laps
+
+    def distance(self, index: int | None = None) -> float:
+        return self._fleet.veh(index).distance
+
+    def behind_leader(self, index: int | None = None) -> int:
+        return 0
+
+    def behind_next(self, index: int | None = None) -> int:
+        return 0
+
+
+class MockVehicleReader:
+    """Vehicle reader"""
+
+    __slots__ = ("_fleet",)
+
+    def __init__(self, fleet: MockFleet):
+        self._fleet = fleet
+
+    def total_vehicles(self) -> int:
+        return len(self._fleet.vehicles)
+
+    def is_player(self, index: int = 0) -> bool:
+        return index == 0
+
+    def slot_id(self, index: int | None = None) -> int:
+        return self._fleet.veh(index).slot_id
+
+    def speed(self, index: int | None = None) -> float:
+        return self._fleet.veh(index).speed
+
+    def in_paddock(self, index: int | None = None) -> int:
+        return self._fleet.veh(index).in_pit
+
+    def position_longitudinal(self, index: int | None = None) -> float:
+        return TRACK_RADIUS * cos(self._fleet.veh(index).distance / TRACK_RADIUS)
+
+    def position_lateral(self, index: int | None = None) -> float:
+        return TRACK_RADIUS * sin(self._fleet.veh(index).distance / TRACK_RADIUS)
+
+    def orientation_yaw_radians(self, index: int | None = None) -> float:
+        return self._fleet.veh(index).distance / TRACK_RADIUS
+
+    def place(self, index: int | None = None) -> int:
+        return (index or 0) + 1
+
+    def qualification(self, index: int | None = None) -> int:
+        return (index or 0) + 1
+
+    def class_name(self, index: int | None = None) -> str:
+        return self._fleet.veh(index).class_name
+
+    def driver_name(self, index: int | None = None) -> str:
+        return f"Driver {self._fleet.veh(index).slot_id}"
+
+    def vehicle_name(self, index: int | None = None) -> str:
+        return f"Car #{self._fleet.veh(index).slot_id}"
+
+    def number_pitstops(self, index: int | None = None, penalty: int = 0) -> int:
+        return 0
+
+    def number_penalties(self, index: int | None = None) -> int:
+        return 0
+
+    def pit_request(self, index: int | None = None) -> bool:
+        return False
+
+    def integrity(self, index: int | None = None) -> float:
+        return 1.0
+
+    def stint_usage(self, driver_name: str) -> tuple[float, float, float, float, int]:
+        return -100.0, 0.0, 0.0, 0.0, 0
+
+
+class MockTiming:
+    """Timing reader"""
+
+    __slots__ = ("_fleet",)
+
+    def __init__(self, fleet: MockFleet):
+        self._fleet = fleet
+
+    def elapsed(self, index: int | None = None) -> float:
+        return self._fleet.session_time
+
+    def start(self, index: int | None = None) -> float:
+        return self._fleet.veh(index).lap_start
+
+    def estimated_laptime(self, index: int | None = None) -> float:
+        return TRACK_LENGTH / self._fleet.veh(index).speed
+
+    def estimated_time_into(self, index: int | None = None) -> float:
+        veh = self._fleet.veh(index)
+        return veh.distance / veh.speed
+
+    def last_laptime(self, index: int | None = None) -> float:
+        return 90.0
+
+    def best_laptime(self, index: int | None = None) -> float:
+        return 89.0
+
+    def behind_leader(self, index: int | None = None) -> float:
+        return 0.0
+
+    def behind_next(self, index: int | None = None) -> float:
+        return 0.0
+
+
+class MockSession:
+    """Session reader"""
+
+    __slots__ = ("_fleet",)
+
+    def __init__(self, fleet: MockFleet):
+        self._fleet = fleet
+
+    def in_race(self) -> bool:
+        return True
+
+    def elapsed(self) -> float:
+        return self._fleet.session_time
+
+
+class MockTyre:
+    """Tyre reader"""
+
+    __slots__ = ()
+
+    def compound_name_front(self, index: int | None = None) -> str:
+        return "Medium"
+
+    def compound_name_rear(self, index: int | None = None) -> str:
+        return "Medium"
+
+
+def create_mock_api(fleet: MockFleet) -> SimpleNamespace:
+    """Create mock API with same reader layout as api_control.api"""
+    return SimpleNamespace(read=SimpleNamespace(
+        lap=MockLap(fleet),
+        vehicle=MockVehicleReader(fleet),
+        timing=MockTiming(fleet),
+        session=MockSession(fleet),
+        tyre=MockTyre(),
+    ))